@@ -0,0 +1,153 @@
+"""
+Shared per-frame animation clock for DSA Learning Adventure
+
+The game samples one clock at the start of every frame and every pulse,
+glow and bob in the menus and levels reads from it, so animations stay in
+phase and time is read once per frame. Waves and easing curves come from
+precomputed lookup tables instead of rotating a temporary Vector2 for
+every sine or cosine.
+
+Angles are in degrees, matching the pygame.math.Vector2.rotate() calls
+these replace: Vector2(1, 0).rotate(a).x == cos_deg(a), .y == sin_deg(a).
+"""
+import math
+
+import pygame
+
+# Cosine lookup table, samples per full turn (power of two for cheap wrapping)
+TABLE_SIZE = 4096
+_TABLE_MASK = TABLE_SIZE - 1
+_STEPS_PER_DEGREE = TABLE_SIZE / 360.0
+_COS_TABLE = [math.cos(2 * math.pi * i / TABLE_SIZE) for i in range(TABLE_SIZE)]
+_QUARTER_TURN = TABLE_SIZE // 4
+
+
+def cos_deg(degrees):
+    """Cosine of an angle in degrees from the lookup table"""
+    return _COS_TABLE[int(degrees * _STEPS_PER_DEGREE) & _TABLE_MASK]
+
+
+def sin_deg(degrees):
+    """Sine of an angle in degrees from the lookup table"""
+    return _COS_TABLE[(int(degrees * _STEPS_PER_DEGREE) - _QUARTER_TURN) & _TABLE_MASK]
+
+
+# Easing curves sampled over t in [0, 1]
+EASING_SAMPLES = 256
+
+
+def _sample_curve(curve):
+    return [curve(i / (EASING_SAMPLES - 1)) for i in range(EASING_SAMPLES)]
+
+
+EASINGS = {
+    "linear": _sample_curve(lambda t: t),
+    "ease_in": _sample_curve(lambda t: t * t),
+    "ease_out": _sample_curve(lambda t: 1 - (1 - t) * (1 - t)),
+    "ease_in_out": _sample_curve(lambda t: 0.5 - 0.5 * math.cos(math.pi * t)),
+}
+
+
+def ease(name, t):
+    """Value of the named easing curve at t (clamped to [0, 1])"""
+    table = EASINGS[name]
+    if t <= 0:
+        return table[0]
+    if t >= 1:
+        return table[-1]
+    return table[int(t * (EASING_SAMPLES - 1))]
+
+
+class Oscillator:
+    """Wave whose angle advances one degree every `divisor` milliseconds"""
+
+    __slots__ = ("divisor", "phase")
+
+    def __init__(self, divisor, phase=0.0):
+        self.divisor = divisor
+        self.phase = phase
+
+    def cos(self, ticks):
+        return cos_deg(ticks / self.divisor + self.phase)
+
+    def sin(self, ticks):
+        return sin_deg(ticks / self.divisor + self.phase)
+
+
+class Tween:
+    """Interpolates from start to end over duration_ms along an easing curve"""
+
+    def __init__(self, start, end, duration_ms, easing="linear"):
+        self.start_value = start
+        self.end_value = end
+        self.duration_ms = duration_ms
+        self.easing = easing
+        self.start_ticks = None
+
+    def start(self, ticks):
+        self.start_ticks = ticks
+
+    def progress(self, ticks):
+        if self.start_ticks is None or self.duration_ms <= 0:
+            return 1.0
+        return min(1.0, max(0.0, (ticks - self.start_ticks) / self.duration_ms))
+
+    def value(self, ticks):
+        t = ease(self.easing, self.progress(ticks))
+        return self.start_value + (self.end_value - self.start_value) * t
+
+    def finished(self, ticks):
+        return self.progress(ticks) >= 1.0
+
+
+# Named oscillators used by the menus and levels: (divisor in ms per degree, phase)
+OSCILLATORS = {
+    "menu_glow": (500, 0),
+    "menu_subtitle_bob": (1000, 0),
+    "level_select_header_bob": (800, 0),
+    "scoreboard_glow": (600, 0),
+    "game_over_glow": (300, 0),
+    "hud_warning_pulse": (100, 0),
+    "array_selection_glow": (200, 0),
+    "stack_label_bob": (800, 0),
+    "queue_front_pulse": (200, 0),
+    "search_target_glow": (400, 0),
+    "search_mid_pulse": (200, 0),
+}
+
+
+class AnimationClock:
+    """Time source for all animations, sampled once per frame"""
+
+    def __init__(self, oscillators=OSCILLATORS):
+        self.ticks = 0
+        self.oscillators = {name: Oscillator(divisor, phase)
+                            for name, (divisor, phase) in oscillators.items()}
+
+    def sample(self, ticks=None):
+        """Advance to the current frame (pygame ticks unless given)"""
+        self.ticks = pygame.time.get_ticks() if ticks is None else ticks
+        return self.ticks
+
+    def add_oscillator(self, name, divisor, phase=0.0):
+        self.oscillators[name] = Oscillator(divisor, phase)
+
+    def cos(self, name):
+        """Cosine of a named oscillator at the sampled time"""
+        return self.oscillators[name].cos(self.ticks)
+
+    def sin(self, name):
+        """Sine of a named oscillator at the sampled time"""
+        return self.oscillators[name].sin(self.ticks)
+
+    def wave_cos(self, divisor, phase=0.0):
+        """Cosine of an ad-hoc wave, for effects with a per-element phase"""
+        return cos_deg(self.ticks / divisor + phase)
+
+    def wave_sin(self, divisor, phase=0.0):
+        """Sine of an ad-hoc wave, for effects with a per-element phase"""
+        return sin_deg(self.ticks / divisor + phase)
+
+
+# Shared by the game loop, the menus and every level
+animation_clock = AnimationClock()
@@ -0,0 +1,172 @@
+"""
+Sprite atlas for DSA Learning Adventure
+
+The shapes the levels and menus draw over and over (3D cells with their
+shadows and highlights, stack and queue boxes, attempt markers, medals and
+panels) are painted once at startup, packed into a single colour-keyed
+surface in the display pixel format and drawn as sub-rect blits. Sprites
+are painted in logical coordinates at the render scale (canvas.py), so a
+half-scale game packs half-size sprites.
+
+Sprites whose fill colour animates are stored as frames: the shadow,
+border and highlight with a transparent interior, drawn over a plain
+filled rect.
+"""
+import pygame
+
+from canvas import Canvas, get_render_scale
+from config import BLACK, WHITE, GREEN, RED, BLUE, YELLOW, CYAN, GRAY, SPRITE_COLORKEY
+
+# Medal colours for the top three high scores
+MEDAL_COLORS = (YELLOW, (192, 192, 192), (205, 127, 50))
+
+
+class SpriteAtlas:
+    """Named sprites packed into one surface with a shelf packer"""
+
+    def __init__(self, max_width=1024, padding=1, colorkey=SPRITE_COLORKEY, scale=1.0):
+        self.max_width = max_width
+        self.padding = padding
+        self.colorkey = colorkey
+        self.scale = scale
+        self.pending = {}
+        self.rects = {}
+        self.anchors = {}
+        self.surface = None
+
+    def add(self, name, size, paint, anchor=(0, 0)):
+        """Register a sprite; paint(canvas) draws it onto a colour-keyed canvas of logical size
+
+        anchor is the point inside the sprite that lands on the position given to draw().
+        """
+        sprite = Canvas.new(size, self.scale)
+        sprite.fill(self.colorkey)
+        paint(sprite)
+        self.pending[name] = sprite.surface
+        self.anchors[name] = anchor
+
+    def build(self):
+        """Pack every registered sprite (tallest first) and convert the atlas"""
+        order = sorted(self.pending, key=lambda name: self.pending[name].get_height(), reverse=True)
+        x = y = shelf_height = 0
+        width = 0
+        for name in order:
+            w, h = self.pending[name].get_size()
+            if x and x + w > self.max_width:
+                x = 0
+                y += shelf_height + self.padding
+                shelf_height = 0
+            self.rects[name] = pygame.Rect(x, y, w, h)
+            x += w + self.padding
+            width = max(width, x)
+            shelf_height = max(shelf_height, h)
+
+        surface = pygame.Surface((max(1, width), max(1, y + shelf_height)))
+        surface.fill(self.colorkey)
+        for name, sprite in self.pending.items():
+            surface.blit(sprite, self.rects[name])
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        surface.set_colorkey(self.colorkey, pygame.RLEACCEL)
+        self.surface = surface
+        self.pending = {}
+        return self
+
+    def __contains__(self, name):
+        return name in self.rects
+
+    def get_size(self, name):
+        """Size of a sprite in atlas pixels"""
+        return self.rects[name].size
+
+    def draw(self, screen, name, pos):
+        """Blit a sprite with its anchor at the logical pos; returns the rect drawn"""
+        anchor_x, anchor_y = self.anchors[name]
+        return screen.blit(self.surface, (pos[0] - anchor_x, pos[1] - anchor_y), self.rects[name])
+
+
+def paint_cell(width, height, shadow, shadow_color, bg_color, border_color, border_width,
+               highlight_height=None, highlight_inset=2, glow=0):
+    """Painter for a 3D cell: shadow, fill, border and highlight strip
+
+    A bg_color of None leaves the interior transparent so an animated fill
+    can be drawn underneath. glow adds the fading outline the binary
+    search level puts around the middle cell.
+    """
+    def paint(canvas):
+        x = y = glow
+        canvas.rect(shadow_color, (x + shadow, y + shadow, width, height))
+        for glow_size in range(glow, 0, -1):
+            glow_alpha = 50 - glow_size * 10
+            canvas.rect((glow_alpha, glow_alpha, 0),
+                        (x - glow_size, y - glow_size, width + 2 * glow_size, height + 2 * glow_size), 1)
+        cell_rect = pygame.Rect(x, y, width, height)
+        canvas.rect(SPRITE_COLORKEY if bg_color is None else bg_color, cell_rect)
+        canvas.rect(border_color, cell_rect, border_width)
+        if highlight_height:
+            canvas.rect(WHITE, (x + highlight_inset, y + highlight_inset,
+                                width - 2 * highlight_inset, highlight_height))
+    return (width + shadow + glow * 2, height + shadow + glow * 2), paint, (glow, glow)
+
+
+def paint_disc(radius, fill_color, ring_color, ring_width):
+    """Painter for a filled circle with an outline ring (fill_color may be None)"""
+    def paint(canvas):
+        if fill_color is not None:
+            canvas.circle(fill_color, (radius, radius), radius)
+        canvas.circle(ring_color, (radius, radius), radius, ring_width)
+    return (radius * 2 + 1, radius * 2 + 1), paint, (radius, radius)
+
+
+def paint_panel(width, height, bg_color, border_color, border_width):
+    """Painter for a filled panel with a border"""
+    def paint(canvas):
+        canvas.rect(bg_color, (0, 0, width, height))
+        canvas.rect(border_color, (0, 0, width, height), border_width)
+    return (width, height), paint, (0, 0)
+
+
+# Every shape in the shared atlas: name -> (size, painter, anchor)
+SPRITES = {
+    # Level HUD
+    "hud_panel": paint_panel(280, 100, (0, 0, 50), CYAN, 2),
+    # Array level cells (70x50, shadow 3)
+    "array_cell": paint_cell(70, 50, 3, (30, 30, 30), (30, 30, 50), WHITE, 3, 50 // 3),
+    "array_cell_target": paint_cell(70, 50, 3, (30, 30, 30), (0, 50, 0), GREEN, 3, 50 // 3),
+    "array_cell_selected": paint_cell(70, 50, 3, (30, 30, 30), None, YELLOW, 3, 50 // 3),
+    "attempt_used": paint_disc(8, RED, RED, 0),
+    "attempt_left": paint_disc(8, None, GRAY, 2),
+    # Stack elements (80x40, shadow 3)
+    "stack_element": paint_cell(80, 40, 3, (20, 20, 20), (30, 30, 60), WHITE, 2, 40 // 3),
+    "stack_element_top": paint_cell(80, 40, 3, (20, 20, 20), (50, 50, 100), CYAN, 2, 40 // 3),
+    # Queue customers (70x50, shadow 3)
+    "queue_customer": paint_cell(70, 50, 3, (20, 20, 20), (0, 50, 100), BLUE, 3, 15),
+    "queue_customer_front": paint_cell(70, 50, 3, (20, 20, 20), None, GREEN, 3, 15),
+    "processed_customer": paint_disc(15, GREEN, WHITE, 2),
+    # Binary search cells (55x50, shadow 2)
+    "search_cell_out": paint_cell(55, 50, 2, (20, 20, 20), (30, 30, 30), GRAY, 3),
+    "search_cell": paint_cell(55, 50, 2, (20, 20, 20), (0, 50, 100), BLUE, 3, 50 // 3),
+    "search_cell_mid": paint_cell(55, 50, 2, (20, 20, 20), None, YELLOW, 3, 50 // 3, glow=5),
+    # High score medals
+    "medal_1": paint_disc(12, MEDAL_COLORS[0], BLACK, 2),
+    "medal_2": paint_disc(12, MEDAL_COLORS[1], BLACK, 2),
+    "medal_3": paint_disc(12, MEDAL_COLORS[2], BLACK, 2),
+}
+
+
+def build_sprite_atlas(sprites=SPRITES, scale=1.0):
+    atlas = SpriteAtlas(scale=scale)
+    for name, (size, paint, anchor) in sprites.items():
+        atlas.add(name, size, paint, anchor)
+    return atlas.build()
+
+
+_sprite_atlas = None
+
+
+def get_sprite_atlas():
+    """Shared atlas at the render scale, built on first use (after the display mode is set)"""
+    global _sprite_atlas
+    if _sprite_atlas is None or _sprite_atlas.scale != get_render_scale():
+        _sprite_atlas = build_sprite_atlas(scale=get_render_scale())
+    return _sprite_atlas
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Headless frame-time benchmark for DSA Learning Adventure
+
+Renders a fixed number of frames of every game screen and every playable
+level with the SDL dummy video driver, feeding scripted key presses to the
+levels, then draws a few of them again at half the render scale. Reports mean/p50/p95/p99 frame times and per-frame allocations as
+JSON, and exits with status 1 when a stored baseline regresses.
+
+Usage:
+    python3 benchmark.py --frames 300 --output results.json
+    python3 benchmark.py --save-baseline benchmark_baseline.json
+    python3 benchmark.py --baseline benchmark_baseline.json --threshold 0.25
+"""
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import json
+import random
+import sys
+import time
+import tracemalloc
+
+import pygame
+
+import dsa_game
+from canvas import scaled_size, set_render_scale
+from config import RENDER_SCALE, SCALE_MODE, SCALE_MODES, SCREEN_SIZE
+from dsa_game import DSAGame, GameState
+from game_clock import STEP
+from scaled_display import parse_size
+from stats import percentile
+
+# Screens benchmarked without a level
+SCREEN_SCENARIOS = {
+    "menu": GameState.MENU,
+    "level_select": GameState.LEVEL_SELECT,
+    "scoreboard": GameState.SCOREBOARD,
+    "game_over": GameState.GAME_OVER,
+}
+
+# Level number and the key presses fed to it, one every INPUT_INTERVAL frames
+LEVEL_SCENARIOS = {
+    "array_level": (1, [pygame.K_RIGHT, pygame.K_RIGHT, pygame.K_SPACE, pygame.K_LEFT]),
+    "stack_level": (2, [pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_SPACE, pygame.K_4]),
+    "queue_level": (3, [pygame.K_a, pygame.K_a, pygame.K_SPACE]),
+    "binary_search_level": (4, [pygame.K_LEFT, pygame.K_RIGHT, pygame.K_SPACE]),
+}
+
+# High-volume level modes: level number and key presses, as above
+STRESS_SCENARIOS = {
+    "queue_rush_hour": (3, [pygame.K_SPACE, pygame.K_RIGHT, pygame.K_a]),
+    "search_large": (4, [pygame.K_LEFT, pygame.K_RIGHT, pygame.K_SPACE]),
+    "array_large": (1, [pygame.K_PAGEDOWN, pygame.K_RIGHT, pygame.K_SPACE]),
+}
+
+# Particle effects benchmarked on top of a screen
+EFFECT_SCENARIOS = {
+    "celebration": GameState.LEVEL_SELECT,
+}
+
+# Scenarios drawn again at a reduced render scale: the scenario and the scale.
+# The window is the size drawn, so the numbers are the drawing cost alone
+# (see the README for what scaling the frame up to a larger window adds)
+RENDER_SCALE_SCENARIOS = {
+    "menu_half_scale": ("menu", 0.5),
+    "array_level_half_scale": ("array_level", 0.5),
+    "celebration_half_scale": ("celebration", 0.5),
+}
+
+INPUT_INTERVAL = 10
+
+# Statistic compared against the baseline
+BASELINE_METRIC = "p95_ms"
+
+
+def summarize(frame_times, allocations):
+    """Summary statistics for one scenario (times in milliseconds)"""
+    times_ms = sorted(t * 1000 for t in frame_times)
+    return {
+        "frames": len(times_ms),
+        "mean_ms": sum(times_ms) / len(times_ms),
+        "p50_ms": percentile(times_ms, 50),
+        "p95_ms": percentile(times_ms, 95),
+        "p99_ms": percentile(times_ms, 99),
+        "max_ms": times_ms[-1],
+        "alloc_bytes_mean": sum(allocations) / len(allocations),
+        "alloc_bytes_max": max(allocations),
+    }
+
+
+class Scenario:
+    """One benchmarked screen or level, driven one frame at a time"""
+
+    def __init__(self, game, state, level_num=None, keys=None):
+        self.game = game
+        self.state = state
+        self.level_num = level_num
+        self.keys = keys or []
+        self.frame_index = 0
+
+    def setup(self):
+        random.seed(0)
+        self.frame_index = 0
+        if self.level_num is not None:
+            self.game.start_level(self.level_num, seed=0)
+        self.game.state = self.state
+
+    def frame(self):
+        """Run one full frame: input, update, draw and present"""
+        game = self.game
+        if self.keys and self.frame_index % INPUT_INTERVAL == 0:
+            key = self.keys[(self.frame_index // INPUT_INTERVAL) % len(self.keys)]
+            game.current_level_instance.handle_event(pygame.event.Event(pygame.KEYDOWN, key=key))
+            game.full_redraw = True
+        if self.level_num is not None:
+            # One fixed step of simulated time per frame, so runs are repeatable;
+            # keep drawing the level even once it has been won or lost
+            game.current_level_instance.step(STEP)
+        game.draw_frame()
+        game.present_frame()
+        self.frame_index += 1
+
+
+class RushHourScenario(Scenario):
+    """Queue level in rush hour with a full queue of 10,000 customers"""
+
+    def setup(self):
+        super().setup()
+        level = self.game.current_level_instance
+        model = level.model
+        model.start_rush_hour()
+        for _ in range(model.RUSH_HOUR_CAPACITY):
+            model.add_customer()
+        level.scroll_to(len(model.queue) // 2)
+
+
+class LargeSearchScenario(Scenario):
+    """Binary search level over an array of a million values"""
+
+    def setup(self):
+        super().setup()
+        self.game.current_level_instance.model.start_large_search()
+
+
+class LargeArrayScenario(Scenario):
+    """Array level with thousands of values in a scrolling viewport"""
+
+    def setup(self):
+        super().setup()
+        self.game.current_level_instance.model.start_large_array()
+
+
+class CelebrationScenario(Scenario):
+    """Level select with the completion fireworks relaunched every second"""
+
+    def setup(self):
+        super().setup()
+        self.game.celebration.clear()
+
+    def frame(self):
+        if self.frame_index % 60 == 0:
+            self.game.celebrate()
+        super().frame()
+
+
+# How each stress scenario puts its level into its high-volume mode
+STRESS_SCENARIO_CLASSES = {
+    "queue_rush_hour": RushHourScenario,
+    "search_large": LargeSearchScenario,
+    "array_large": LargeArrayScenario,
+}
+
+
+def time_scenario(scenario, frames, warmup):
+    """Frame times in seconds, measured without allocation tracing"""
+    scenario.setup()
+    for _ in range(warmup):
+        scenario.frame()
+    frame_times = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        scenario.frame()
+        frame_times.append(time.perf_counter() - start)
+    return frame_times
+
+
+def trace_allocations(scenario, frames, warmup):
+    """Bytes allocated per frame (peak above the starting level)"""
+    scenario.setup()
+    for _ in range(warmup):
+        scenario.frame()
+    allocations = []
+    tracemalloc.start()
+    try:
+        for _ in range(frames):
+            if hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            scenario.frame()
+            current, peak = tracemalloc.get_traced_memory()
+            allocations.append(max(peak, current) - before)
+    finally:
+        tracemalloc.stop()
+    return allocations
+
+
+def build_scenarios(game, names=None):
+    scenarios = {}
+    for name, state in SCREEN_SCENARIOS.items():
+        scenarios[name] = Scenario(game, state)
+    for name, (level_num, keys) in LEVEL_SCENARIOS.items():
+        scenarios[name] = Scenario(game, GameState.PLAYING, level_num, keys)
+    for name, (level_num, keys) in STRESS_SCENARIOS.items():
+        scenarios[name] = STRESS_SCENARIO_CLASSES[name](game, GameState.PLAYING, level_num, keys)
+    for name, state in EFFECT_SCENARIOS.items():
+        scenarios[name] = CelebrationScenario(game, state)
+    if names:
+        unknown = set(names) - set(scenarios) - set(RENDER_SCALE_SCENARIOS)
+        if unknown:
+            raise ValueError(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+        scenarios = {name: scenarios[name] for name in scenarios if name in names}
+    return scenarios
+
+
+def measure(scenario, frames, warmup):
+    frame_times = time_scenario(scenario, frames, warmup)
+    allocations = trace_allocations(scenario, max(1, frames // 10), warmup)
+    return summarize(frame_times, allocations)
+
+
+def run_benchmark(frames=300, warmup=30, names=None, background_mode="tiled", dirty_rects=False,
+                  window_size=None, scale_mode=SCALE_MODE, render_scale=RENDER_SCALE):
+    """Benchmark every scenario and return the results as a dict"""
+    pygame.init()
+    game = DSAGame(dirty_rects=dirty_rects, window_size=window_size, scale_mode=scale_mode,
+                   render_scale=render_scale)
+    game.background_mode = background_mode
+    window = list(game.display.window.get_size())
+
+    results = {}
+    for name, scenario in build_scenarios(game, names).items():
+        results[name] = measure(scenario, frames, warmup)
+
+    # A game per render scale; making one sets the process-wide scale, so it
+    # is put back afterwards
+    scaled_games = {}
+    for name, (base, scale) in RENDER_SCALE_SCENARIOS.items():
+        if names and name not in names:
+            continue
+        if scale not in scaled_games:
+            scaled_games[scale] = DSAGame(dirty_rects=dirty_rects, window_size=scaled_size(SCREEN_SIZE, scale),
+                                          scale_mode=scale_mode, render_scale=scale)
+            scaled_games[scale].background_mode = background_mode
+        results[name] = measure(build_scenarios(scaled_games[scale], [base])[base], frames, warmup)
+    if scaled_games:
+        set_render_scale(render_scale)
+
+    return {
+        "config": {
+            "frames": frames,
+            "warmup": warmup,
+            "background_mode": background_mode,
+            "dirty_rects": dirty_rects,
+            "screen": [dsa_game.SCREEN_WIDTH, dsa_game.SCREEN_HEIGHT],
+            "window": window,
+            "scale_mode": scale_mode,
+            "render_scale": render_scale,
+            "video_driver": pygame.display.get_driver(),
+            "pygame": pygame.version.ver,
+            "python": sys.version.split()[0],
+        },
+        "scenarios": results,
+    }
+
+
+def compare_to_baseline(results, baseline, threshold):
+    """Return (name, baseline, current) for scenarios slower than the threshold allows"""
+    regressions = []
+    for name, stats in results["scenarios"].items():
+        reference = baseline.get("scenarios", {}).get(name)
+        if reference is None:
+            continue
+        allowed = reference[BASELINE_METRIC] * (1 + threshold)
+        if stats[BASELINE_METRIC] > allowed:
+            regressions.append((name, reference[BASELINE_METRIC], stats[BASELINE_METRIC]))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless frame-time benchmark")
+    parser.add_argument("--frames", type=int, default=300, help="frames measured per scenario")
+    parser.add_argument("--warmup", type=int, default=30, help="frames drawn before measuring")
+    parser.add_argument("--scenario", action="append", dest="scenarios",
+                        help="only run this scenario (repeatable)")
+    parser.add_argument("--background", choices=["tiled", "immediate"], default="tiled",
+                        help="background drawing path")
+    parser.add_argument("--dirty-rects", action="store_true", help="benchmark dirty-rect presentation")
+    parser.add_argument("--window", type=parse_size, metavar="WIDTHxHEIGHT",
+                        help="benchmark scaled presentation to a window of this size")
+    parser.add_argument("--scale-mode", choices=SCALE_MODES, default=SCALE_MODE,
+                        help="how the canvas is scaled to the window")
+    parser.add_argument("--render-scale", type=float, default=RENDER_SCALE,
+                        help="draw at this fraction of the layout size")
+    parser.add_argument("--output", help="write results JSON to this file")
+    parser.add_argument("--baseline", help="fail if results regress against this results JSON")
+    parser.add_argument("--save-baseline", help="write results JSON as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help=f"allowed {BASELINE_METRIC} slowdown as a fraction (default 0.25)")
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(args.frames, args.warmup, args.scenarios, args.background, args.dirty_rects,
+                            args.window, args.scale_mode, args.render_scale)
+    report = json.dumps(results, indent=2)
+    print(report)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report + "\n")
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            f.write(report + "\n")
+
+    if args.baseline:
+        with open(args.baseline, "r") as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(results, baseline, args.threshold)
+        for name, before, after in regressions:
+            print(f"❌ {name}: {BASELINE_METRIC} {before:.3f}ms -> {after:.3f}ms", file=sys.stderr)
+        if regressions:
+            return 1
+        print(f"✅ No scenario regressed more than {args.threshold:.0%}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+"""
+Logical-coordinate drawing for DSA Learning Adventure
+
+Every screen and level is laid out in logical coordinates on a
+SCREEN_WIDTH x SCREEN_HEIGHT canvas (config.py). A Canvas wraps the surface
+the pixels actually go to, which is the render scale times that size, and
+scales positions, rects, radii and line widths on the way in. Fonts, sprites
+and pre-built layers are made at the render scale up front, so surfaces
+blitted onto a canvas are copied pixel for pixel (area rects are in their
+pixels) and nothing is rescaled per frame.
+
+At a render scale of 1 the drawing methods are pygame's own, bound to the
+surface, so full-size rendering pays nothing for this.
+"""
+import math
+from functools import partial
+
+import pygame
+
+from config import RENDER_SCALE
+
+_render_scale = RENDER_SCALE
+
+
+def get_render_scale():
+    """Scale fonts, sprites and new canvases are made at"""
+    return _render_scale
+
+
+def set_render_scale(scale):
+    """Set the render scale; call before fonts, sprites or layers are made"""
+    global _render_scale
+    if not 0 < scale <= 1:
+        raise ValueError(f"render scale must be above 0 and at most 1, got {scale}")
+    _render_scale = scale
+
+
+def scaled_size(size, scale):
+    """Pixel size of a logical (width, height) at scale"""
+    return max(1, round(size[0] * scale)), max(1, round(size[1] * scale))
+
+
+class Canvas:
+    """A surface drawn on in logical coordinates
+
+    The drawing methods take the arguments of the pygame.draw function of
+    the same name minus the surface, and like blit() return the logical
+    rect they touched.
+    """
+
+    def __init__(self, surface, scale=1.0, size=None):
+        self.surface = surface
+        self.scale = scale
+        self.size = tuple(size) if size else (round(surface.get_width() / scale),
+                                              round(surface.get_height() / scale))
+        if scale == 1:
+            # Logical and pixel coordinates are the same
+            self.blit = surface.blit
+            self.blits = surface.blits
+            self.fill = surface.fill
+            self.rect = partial(pygame.draw.rect, surface)
+            self.line = partial(pygame.draw.line, surface)
+            self.lines = partial(pygame.draw.lines, surface)
+            self.polygon = partial(pygame.draw.polygon, surface)
+            self.circle = partial(pygame.draw.circle, surface)
+
+    @classmethod
+    def new(cls, size, scale=None, flags=0):
+        """Canvas on a new surface of logical size, at the render scale unless given"""
+        if scale is None:
+            scale = _render_scale
+        return cls(pygame.Surface(scaled_size(size, scale), flags), scale, size)
+
+    def get_width(self):
+        return self.size[0]
+
+    def get_height(self):
+        return self.size[1]
+
+    def get_size(self):
+        return self.size
+
+    def get_rect(self, **anchor):
+        rect = pygame.Rect((0, 0), self.size)
+        for name, value in anchor.items():
+            setattr(rect, name, value)
+        return rect
+
+    def rect_of(self, source, **anchor):
+        """Logical rect a surface covers when blitted here, placed like get_rect(**anchor)"""
+        if self.scale == 1:
+            return source.get_rect(**anchor)
+        width, height = source.get_size()
+        rect = pygame.Rect(0, 0, round(width / self.scale), round(height / self.scale))
+        for name, value in anchor.items():
+            setattr(rect, name, value)
+        return rect
+
+    def point(self, pos):
+        scale = self.scale
+        return round(pos[0] * scale), round(pos[1] * scale)
+
+    def to_pixels(self, rect):
+        """Surface pixels covered by a logical rect (edges rounded, so neighbours stay adjacent)"""
+        rect = pygame.Rect(rect)
+        if self.scale == 1:
+            return rect
+        scale = self.scale
+        left, top = round(rect.x * scale), round(rect.y * scale)
+        return pygame.Rect(left, top, round(rect.right * scale) - left, round(rect.bottom * scale) - top)
+
+    def to_logical(self, rect):
+        """Smallest logical rect covering a rect of surface pixels"""
+        scale = self.scale
+        left, top = math.floor(rect.x / scale), math.floor(rect.y / scale)
+        return pygame.Rect(left, top, math.ceil(rect.right / scale) - left, math.ceil(rect.bottom / scale) - top)
+
+    def line_width(self, width):
+        # 0 means filled; any outline stays at least a pixel wide
+        return max(1, round(width * self.scale)) if width > 0 else width
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        return self.to_logical(self.surface.blit(source, self.point(dest), area, special_flags))
+
+    def blits(self, blit_sequence, doreturn=True):
+        scale = self.scale
+        drawn = self.surface.blits([(source, (int(dest[0] * scale + 0.5), int(dest[1] * scale + 0.5)), *area)
+                                    for source, dest, *area in blit_sequence], doreturn)
+        return [self.to_logical(rect) for rect in drawn] if doreturn else None
+
+    def fill(self, color, rect=None, special_flags=0):
+        rect = None if rect is None else self.to_pixels(rect)
+        return self.to_logical(self.surface.fill(color, rect, special_flags))
+
+    def rect(self, color, rect, width=0):
+        return self.to_logical(pygame.draw.rect(self.surface, color, self.to_pixels(rect), self.line_width(width)))
+
+    def line(self, color, start_pos, end_pos, width=1):
+        return self.to_logical(pygame.draw.line(self.surface, color, self.point(start_pos), self.point(end_pos),
+                                                self.line_width(width)))
+
+    def lines(self, color, closed, points, width=1):
+        return self.to_logical(pygame.draw.lines(self.surface, color, closed, [self.point(p) for p in points],
+                                                 self.line_width(width)))
+
+    def polygon(self, color, points, width=0):
+        return self.to_logical(pygame.draw.polygon(self.surface, color, [self.point(p) for p in points],
+                                                   self.line_width(width)))
+
+    def circle(self, color, center, radius, width=0):
+        return self.to_logical(pygame.draw.circle(self.surface, color, self.point(center),
+                                                  max(1, round(radius * self.scale)), self.line_width(width)))
@@ -0,0 +1,51 @@
+"""
+Shared configuration for DSA Learning Adventure
+
+Screen layout, colours and presentation settings used by the game, the
+levels and the tools. All layout code works in logical coordinates on a
+SCREEN_WIDTH x SCREEN_HEIGHT canvas; it may be drawn at a lower resolution
+(see canvas.py) and the window it is shown in may be any size (see
+scaled_display.py).
+"""
+
+# Logical canvas size every screen and level is laid out in; the pixels
+# drawn and the window size are set separately below
+SCREEN_WIDTH = 1024
+SCREEN_HEIGHT = 768
+SCREEN_SIZE = (SCREEN_WIDTH, SCREEN_HEIGHT)
+FPS = 60
+
+# Fraction of the logical size the game is drawn at (--render-scale): 0.5
+# draws a quarter of the pixels, with fonts and sprites made at that size,
+# and the frame is scaled up to the window
+RENDER_SCALE = 1.0
+
+# Window size when none is given on the command line
+WINDOW_SIZE = SCREEN_SIZE
+
+# How the canvas is scaled to a window of a different size:
+#   "integer" - largest whole-number factor that fits, pixel-exact (falls back to "fast" when shrinking)
+#   "fast"    - nearest-neighbour fit, preserving the aspect ratio
+#   "smooth"  - filtered fit, preserving the aspect ratio
+SCALE_MODES = ("integer", "fast", "smooth")
+SCALE_MODE = "integer"
+
+# Colors (Retro palette)
+BLACK = (0, 0, 0)
+WHITE = (255, 255, 255)
+GREEN = (0, 255, 0)
+RED = (255, 0, 0)
+BLUE = (0, 0, 255)
+YELLOW = (255, 255, 0)
+PURPLE = (255, 0, 255)
+CYAN = (0, 255, 255)
+ORANGE = (255, 165, 0)
+GRAY = (128, 128, 128)
+
+# Font sizes (default face): large, medium and small
+MENU_FONT_SIZES = (48, 32, 24)
+LEVEL_FONT_SIZES = (36, 24, 18)
+OVERLAY_FONT_SIZE = 20
+
+# Transparent areas of pre-built surfaces (never used as a drawing colour)
+SPRITE_COLORKEY = (1, 2, 3)
@@ -8,6 +8,8 @@ import pygame
 import sys
 import os
 
+from fonts import get_font
+
 def create_demo_preview():
     """Create a demo preview image showing game features"""
     
@@ -27,15 +29,9 @@ def create_demo_preview():
     RED = (255, 100, 100)
     
     # Fonts
-    try:
-        font_large = pygame.font.Font(None, 48)
-        font_medium = pygame.font.Font(None, 32)
-        font_small = pygame.font.Font(None, 24)
-    except:
-        print("Using default font")
-        font_large = pygame.font.Font(None, 48)
-        font_medium = pygame.font.Font(None, 32)
-        font_small = pygame.font.Font(None, 24)
+    font_large = get_font(48)
+    font_medium = get_font(32)
+    font_small = get_font(24)
     
     # Fill background
     surface.fill(BLACK)
@@ -8,6 +8,8 @@ import pygame
 import sys
 import os
 
+from fonts import get_font
+
 def create_video_thumbnail():
     """Create a video thumbnail that looks like a video player"""
     
@@ -29,16 +31,10 @@ def create_video_thumbnail():
     DARK_GRAY = (64, 64, 64)
     
     # Fonts
-    try:
-        font_large = pygame.font.Font(None, 48)
-        font_medium = pygame.font.Font(None, 32)
-        font_small = pygame.font.Font(None, 24)
-        font_tiny = pygame.font.Font(None, 18)
-    except:
-        font_large = pygame.font.Font(None, 48)
-        font_medium = pygame.font.Font(None, 32)
-        font_small = pygame.font.Font(None, 24)
-        font_tiny = pygame.font.Font(None, 18)
+    font_large = get_font(48)
+    font_medium = get_font(32)
+    font_small = get_font(24)
+    font_tiny = get_font(18)
     
     # Fill background with dark color (like video player)
     surface.fill(BLACK)
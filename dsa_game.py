@@ -1,29 +1,36 @@
 import pygame
+import argparse
 import sys
+import math
 import time
 import random
 from enum import Enum
 from typing import List, Dict, Any
 
+from animation import animation_clock
+from assets import get_sprite_atlas
+from canvas import Canvas, get_render_scale, set_render_scale
+from config import (SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_SIZE, FPS, RENDER_SCALE, SCALE_MODE, SCALE_MODES,
+                    BLACK, WHITE, GREEN, RED, YELLOW, CYAN, GRAY,
+                    SPRITE_COLORKEY, MENU_FONT_SIZES, LEVEL_FONT_SIZES, OVERLAY_FONT_SIZE)
+from fonts import font_registry, get_font
+from frame_pacer import FramePacer
+from game_clock import FixedTimestep, MonotonicClock
+from level_registry import level_registry
+from particles import Channel, ParticleField, ParticleSystem
+from perf_overlay import PerfOverlay
+from puzzle_bank import get_puzzle_bank
+from render_cache import GlowText, SurfaceCache, render_text
+from replay import Recording, new_seed, seeded_level
+from scaled_display import ScaledDisplay, parse_size
+
 # Initialize Pygame
 pygame.init()
 
-# Constants
-SCREEN_WIDTH = 1024
-SCREEN_HEIGHT = 768
-FPS = 60
-
-# Colors (Retro palette)
-BLACK = (0, 0, 0)
-WHITE = (255, 255, 255)
-GREEN = (0, 255, 0)
-RED = (255, 0, 0)
-BLUE = (0, 0, 255)
-YELLOW = (255, 255, 0)
-PURPLE = (255, 0, 255)
-CYAN = (0, 255, 255)
-ORANGE = (255, 165, 0)
-GRAY = (128, 128, 128)
+# Level completion fireworks: particles per burst and colour multipliers
+CELEBRATION_BURSTS = 5
+CELEBRATION_PARTICLES = 400
+CELEBRATION_PALETTE = [(1, 1, 0), (0, 1, 0), (0, 1, 1), (1, 0, 1), (1, 0.65, 0)]
 
 class GameState(Enum):
     MENU = 1
@@ -33,33 +40,90 @@ class GameState(Enum):
     SCOREBOARD = 5
 
 class DSAGame:
-    def __init__(self):
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    def __init__(self, dirty_rects=False, adaptive_fps=True, window_size=None,
+                 scale_mode=SCALE_MODE, resizable=False, game_clock=None, record_dir=None,
+                 puzzle_index=None, render_scale=RENDER_SCALE):
+        # Fonts, sprites and layers are made at the render scale from here on;
+        # levels pre-built at another scale hold fonts of the wrong size
+        if render_scale != get_render_scale():
+            level_registry.discard_prewarmed()
+        set_render_scale(render_scale)
+        # Everything is drawn on self.screen in logical coordinates, at the render scale
+        self.display = ScaledDisplay(SCREEN_SIZE, window_size, scale_mode, resizable, render_scale)
+        self.screen = Canvas(self.display.canvas, render_scale, SCREEN_SIZE)
         pygame.display.set_caption("DSA Learning Adventure")
         self.clock = pygame.time.Clock()
-        self.font_large = pygame.font.Font(None, 48)
-        self.font_medium = pygame.font.Font(None, 32)
-        self.font_small = pygame.font.Font(None, 24)
+        self.pacer = FramePacer(active_fps=FPS, enabled=adaptive_fps)
+        # Level logic advances in fixed steps of simulated time taken from this clock
+        self.game_clock = game_clock or MonotonicClock()
+        self.timestep = FixedTimestep()
+        # Shared fonts; the level sizes are loaded now so starting a level never waits on them
+        font_registry.preload(MENU_FONT_SIZES + LEVEL_FONT_SIZES + (OVERLAY_FONT_SIZE,))
+        self.font_large, self.font_medium, self.font_small = (get_font(size) for size in MENU_FONT_SIZES)
+        
+        # Pre-built button surfaces keyed on (text, width, height, color, bg_color)
+        self.button_cache = SurfaceCache(max_size=32)
+        
+        # Level select card column, rebuilt when the level registry changes
+        self.level_cards_layer = None
+        self.level_cards_key = None
+        
+        # Rendered high score tables and the high_scores_version they show
+        self.scoreboard_layer = None
+        self.scoreboard_layer_version = None
+        self.menu_scores_layer = None
+        self.menu_scores_layer_version = None
+        
+        # Animated titles, pre-baked over the range their glow intensity covers
+        self.menu_title = GlowText(
+            self.font_large, "DSA LEARNING ADVENTURE", (3, 2, 1),
+            lambda glow, offset: (0, max(20, glow - offset * 15), max(10, glow - offset * 10)),
+            GREEN, (20, 80))
+        self.scoreboard_title = GlowText(
+            self.font_large, "HIGH SCORES", (3, 2, 1),
+            lambda glow, offset: (0, max(0, glow - offset * 20), 0),
+            GREEN, (50, 150))
+        self.game_over_title = GlowText(
+            self.font_large, "GAME OVER", (4, 3, 2, 1),
+            lambda glow, offset: (max(50, glow - offset * 20), 0, 0),
+            RED, (50, 150))
+        
+        # Frame timing overlay (toggled with F3)
+        self.perf_overlay = PerfOverlay(get_font(OVERLAY_FONT_SIZE))
         
         self.state = GameState.MENU
         self.current_level = None
         self.score = 0
         self.high_scores = self.load_high_scores()
-        
-        # Level definitions
-        self.levels = {
-            1: {"name": "Array Basics", "time_limit": 60, "difficulty": "Easy"},
-            2: {"name": "Stack Operations", "time_limit": 45, "difficulty": "Easy"},
-            3: {"name": "Queue Management", "time_limit": 45, "difficulty": "Easy"},
-            4: {"name": "Binary Search", "time_limit": 30, "difficulty": "Medium"},
-            # Placeholders for future levels
-            5: {"name": "Linked Lists", "time_limit": 40, "difficulty": "Medium", "locked": True},
-            6: {"name": "Binary Trees", "time_limit": 50, "difficulty": "Medium", "locked": True},
-            7: {"name": "Hash Tables", "time_limit": 35, "difficulty": "Medium", "locked": True},
-            8: {"name": "Graph Traversal", "time_limit": 60, "difficulty": "Hard", "locked": True},
-            9: {"name": "Dynamic Programming", "time_limit": 90, "difficulty": "Hard", "locked": True},
-            10: {"name": "Sorting Algorithms", "time_limit": 45, "difficulty": "Medium", "locked": True},
-        }
+        # Bumped whenever high_scores changes; scoreboard renders are cached against it
+        self.high_scores_version = 0
+        
+        # Levels come from level_registry; at most one is pre-built per frame on
+        # the level select and game over screens so starting it is instant
+        self.prewarm_levels = True
+        
+        # Opt-in session recording (see replay.py): each level played is saved
+        # to record_dir; recorded levels are built from a fresh seed, not pre-warmed
+        self.record_dir = record_dir
+        self.recording = None
+        # Start every level on this puzzle bank puzzle (see puzzle_bank.py)
+        self.puzzle_index = puzzle_index
+        if record_dir or puzzle_index is not None:
+            self.prewarm_levels = False
+        
+        # "tiled" blits pre-rendered layers, "immediate" draws every dot each frame
+        self.background_mode = "tiled"
+        self.background_grid_layer = None
+        
+        # Decorative particles and the level completion celebration
+        self.build_particle_effects()
+        
+        # Opt-in dirty-rectangle presentation (see present_frame)
+        self.dirty_rect_mode = dirty_rects
+        self.frame_dirty_rects = []
+        self.previous_dirty_rects = []
+        self.full_redraw = True
+        self.presented_state = None
         
         self.running = True
         
@@ -85,72 +149,174 @@ class DSAGame:
         """Add a new high score"""
         self.high_scores.append((name, score))
         self.high_scores = sorted(self.high_scores, key=lambda x: x[1], reverse=True)[:10]
+        self.high_scores_version += 1
         self.save_high_scores()
     
     def draw_animated_background(self):
         """Draw animated retro background"""
-        current_time = pygame.time.get_ticks()
+        # Floating particles stay inside this band
+        self.mark_dirty((0, 76, SCREEN_WIDTH, 200))
+        if self.background_mode == "tiled":
+            self.draw_background_tiled()
+        else:
+            self.draw_background_immediate()
+    
+    def draw_background_immediate(self):
+        """Draw the background with per-frame circle calls (reference path for benchmarks)"""
+        current_time = animation_clock.ticks
         
-        # Moving grid pattern
+        # Moving grid pattern (held still in dirty-rect mode so it stays composited)
         grid_size = 50
-        offset = (current_time // 50) % grid_size
+        offset = self.background_grid_offset(current_time, grid_size)
         
         for x in range(-grid_size, SCREEN_WIDTH + grid_size, grid_size):
             for y in range(-grid_size, SCREEN_HEIGHT + grid_size, grid_size):
-                pygame.draw.circle(self.screen, (0, 20, 40), 
-                                 (x + offset, y + offset), 2)
+                self.screen.circle((0, 20, 40), (x + offset, y + offset), 2)
         
         # Floating particles
         for i in range(20):
             x = (current_time // 10 + i * 50) % SCREEN_WIDTH
-            y = 100 + 50 * (i % 4) + 20 * pygame.math.Vector2(1, 0).rotate(current_time / 20 + i).y
-            color_intensity = int(128 + 127 * pygame.math.Vector2(1, 0).rotate(current_time / 30 + i).x)
+            y = 100 + 50 * (i % 4) + 20 * animation_clock.wave_sin(20, i)
+            color_intensity = int(128 + 127 * animation_clock.wave_cos(30, i))
             color = (color_intensity // 4, color_intensity // 2, color_intensity)
-            pygame.draw.circle(self.screen, color, (int(x), int(y)), 3)
+            self.screen.circle(color, (int(x), int(y)), 3)
+    
+    def background_grid_offset(self, current_time, grid_size):
+        """Scroll offset of the dot grid"""
+        if self.dirty_rect_mode:
+            return 0
+        return (current_time // 50) % grid_size
+    
+    def build_background_layers(self):
+        """Pre-render the dot grid layer"""
+        grid_size = 50
+        
+        # Grid layer is one cell larger than the screen on every side so any
+        # scroll offset can be cut out of it with a single blit
+        layer = Canvas.new((SCREEN_WIDTH + 2 * grid_size, SCREEN_HEIGHT + 2 * grid_size))
+        layer.fill(BLACK)
+        for x in range(0, layer.get_width() + grid_size, grid_size):
+            for y in range(0, layer.get_height() + grid_size, grid_size):
+                layer.circle((0, 20, 40), (x, y), 2)
+        layer = layer.surface
+        if pygame.display.get_surface() is not None:
+            layer = layer.convert()
+        layer.set_colorkey(BLACK, pygame.RLEACCEL)
+        self.background_grid_layer = layer
+    
+    def draw_background_tiled(self):
+        """Draw the background from the pre-rendered grid layer and particle paths"""
+        if self.background_grid_layer is None:
+            self.build_background_layers()
+        current_time = animation_clock.ticks
+        
+        # Moving grid pattern: cut the visible window out of the wrap-around layer
+        grid_size = 50
+        offset = self.background_grid_offset(current_time, grid_size)
+        window = (grid_size - offset, grid_size - offset, SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.screen.blit(self.background_grid_layer, (0, 0), self.screen.to_pixels(window))
+        
+        # Floating particles
+        self.background_particles.draw(self.screen, current_time)
+    
+    def build_particle_effects(self):
+        """Create the decorative particle fields and the celebration system
+        
+        The fields reproduce the paths of the original per-dot loops: waves
+        are in radians per millisecond with a per-particle phase step.
+        """
+        degree = math.radians(1)
+        self.background_particles = ParticleField(
+            20,
+            x=Channel([i * 50 for i in range(20)], drift=0.1, wave="none"),
+            y=Channel([100 + 50 * (i % 4) for i in range(20)], 20, degree / 20, degree, "sin"),
+            radius=Channel(3, wave="none"),
+            intensity=Channel(128, 127, degree / 30, degree),
+            tint=(0.25, 0.5, 1),
+            wrap_width=SCREEN_WIDTH)
+        self.menu_particles = ParticleField(
+            10,
+            x=Channel(SCREEN_WIDTH // 2, 250, 1 / 1500, 0.6),
+            y=Channel(SCREEN_HEIGHT // 2, 150, 1 / 1500, 0.6, "sin"),
+            radius=Channel(2, 1, 2 / 1500, 1.2),
+            intensity=Channel(100, 50, 3 / 1500, 1.8),
+            tint=(1, 0, 0.5))
+        self.game_over_particles = ParticleField(
+            8,
+            x=Channel(SCREEN_WIDTH // 2, 150, 1 / 800, 0.8),
+            y=Channel(400, 80, 2 / 800, 1.6, "sin"),
+            radius=Channel(1, 2, 3 / 800, 2.4, "abs_cos"),
+            intensity=Channel(150, 50, 4 / 800, 3.2),
+            tint=(1, 0, 0))
+        self.celebration = ParticleSystem(CELEBRATION_PALETTE,
+                                          capacity=CELEBRATION_BURSTS * CELEBRATION_PARTICLES)
+    
+    def celebrate(self):
+        """Launch fireworks over the level select screen"""
+        for i in range(CELEBRATION_BURSTS):
+            x = SCREEN_WIDTH * (i + 1) // (CELEBRATION_BURSTS + 1)
+            y = random.randint(120, 300)
+            self.celebration.burst(CELEBRATION_PARTICLES, x, y)
     
     def draw_retro_button(self, text, x, y, width, height, color=WHITE, bg_color=None):
         """Draw a retro-style button with 3D effect"""
+        button_surface = self.button_cache.get((text, width, height, color, bg_color),
+                                               self.build_retro_button,
+                                               text, width, height, color, bg_color)
+        self.screen.blit(button_surface, (x, y))
+        return pygame.Rect(x, y, width, height)
+    
+    def build_retro_button(self, text, width, height, color, bg_color):
+        """Composite shadow, border, label and highlight of a button into one surface"""
+        # Only the corners uncovered by the shadow offset stay transparent
+        button_surface = Canvas.new((width + 3, height + 3))
+        button_surface.fill(SPRITE_COLORKEY)
+        
         # Shadow
-        shadow_rect = pygame.Rect(x + 3, y + 3, width, height)
-        pygame.draw.rect(self.screen, (50, 50, 50), shadow_rect)
+        shadow_rect = pygame.Rect(3, 3, width, height)
+        button_surface.rect((50, 50, 50), shadow_rect)
         
         # Main button
-        button_rect = pygame.Rect(x, y, width, height)
+        button_rect = pygame.Rect(0, 0, width, height)
         if bg_color:
-            pygame.draw.rect(self.screen, bg_color, button_rect)
-        pygame.draw.rect(self.screen, color, button_rect, 3)
+            button_surface.rect(bg_color, button_rect)
+        button_surface.rect(color, button_rect, 3)
         
         # Text (render first to ensure visibility)
-        text_surface = self.font_medium.render(text, True, WHITE)
-        text_rect = text_surface.get_rect(center=(x + width//2, y + height//2))
-        self.screen.blit(text_surface, text_rect)
+        text_surface = render_text(self.font_medium, text, True, WHITE)
+        text_rect = button_surface.rect_of(text_surface, center=(width//2, height//2))
+        button_surface.blit(text_surface, text_rect)
         
         # Subtle highlight (reduced opacity and size to not cover text)
-        highlight_rect = pygame.Rect(x + 2, y + 2, width - 4, height // 6)
-        highlight_surface = pygame.Surface((width - 4, height // 6))
+        highlight_rect = pygame.Rect(2, 2, width - 4, height // 6)
+        highlight_surface = pygame.Surface(button_surface.to_pixels(highlight_rect).size)
         highlight_surface.set_alpha(30)
         highlight_surface.fill((255, 255, 255))
-        self.screen.blit(highlight_surface, (x + 2, y + 2))
+        button_surface.blit(highlight_surface, highlight_rect)
         
-        return button_rect
+        button_surface = button_surface.surface
+        if pygame.display.get_surface() is not None:
+            button_surface = button_surface.convert()
+        button_surface.set_colorkey(SPRITE_COLORKEY, pygame.RLEACCEL)
+        return button_surface
     
     def draw_persistent_scoreboard(self, screen):
         """Draw persistent scoreboard in top right corner"""
         # Scoreboard background
         score_rect = pygame.Rect(SCREEN_WIDTH - 250, 10, 240, 80)
-        pygame.draw.rect(screen, (0, 0, 50), score_rect)
-        pygame.draw.rect(screen, CYAN, score_rect, 2)
+        screen.rect((0, 0, 50), score_rect)
+        screen.rect(CYAN, score_rect, 2)
         
         # Current score
         score_text = f"Total Score: {self.score:,}"
-        score_surface = self.font_medium.render(score_text, True, WHITE)
+        score_surface = render_text(self.font_medium, score_text, True, WHITE)
         screen.blit(score_surface, (SCREEN_WIDTH - 240, 25))
         
         # High score for comparison
         if self.high_scores:
             high_score = self.high_scores[0][1]
             high_text = f"High Score: {high_score:,}"
-            high_surface = self.font_small.render(high_text, True, YELLOW)
+            high_surface = render_text(self.font_small, high_text, True, YELLOW)
             screen.blit(high_surface, (SCREEN_WIDTH - 240, 50))
             
             # Progress indicator
@@ -161,14 +327,14 @@ class DSAGame:
                 bar_x = SCREEN_WIDTH - 240
                 bar_y = 70
                 
-                pygame.draw.rect(screen, GRAY, (bar_x, bar_y, bar_width, bar_height))
-                pygame.draw.rect(screen, GREEN, (bar_x, bar_y, int(bar_width * progress), bar_height))
-                pygame.draw.rect(screen, WHITE, (bar_x, bar_y, bar_width, bar_height), 1)
+                screen.rect(GRAY, (bar_x, bar_y, bar_width, bar_height))
+                screen.rect(GREEN, (bar_x, bar_y, int(bar_width * progress), bar_height))
+                screen.rect(WHITE, (bar_x, bar_y, bar_width, bar_height), 1)
     
     def draw_text_centered(self, text, font, color, y_pos):
         """Draw centered text"""
-        text_surface = font.render(text, True, color)
-        text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, y_pos))
+        text_surface = render_text(font, text, True, color)
+        text_rect = self.screen.rect_of(text_surface, center=(SCREEN_WIDTH // 2, y_pos))
         self.screen.blit(text_surface, text_rect)
         return text_rect
     
@@ -189,10 +355,11 @@ class DSAGame:
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
                 self.state = GameState.MENU
-            elif pygame.K_1 <= event.key <= pygame.K_4:
+            elif pygame.K_1 <= event.key <= pygame.K_9:
                 level_num = event.key - pygame.K_0
-                self.current_level = level_num
-                self.start_level(level_num)
+                if level_registry.is_playable(level_num):
+                    self.current_level = level_num
+                    self.start_level(level_num)
     
     def handle_game_over_events(self, event):
         """Handle game over events"""
@@ -209,102 +376,226 @@ class DSAGame:
                 # Go to level select (keep accumulated score)
                 self.state = GameState.LEVEL_SELECT
     
-    def start_level(self, level_num):
-        """Start a specific level"""
-        from levels import get_level_instance
-        self.current_level_instance = get_level_instance(level_num)
-        self.level_start_time = time.time()
+    def start_level(self, level_num, seed=None):
+        """Start a specific level, from seed if given"""
+        if seed is None and not self.record_dir and self.puzzle_index is None:
+            self.current_level_instance = level_registry.take(level_num)
+        else:
+            if seed is None:
+                seed = new_seed()
+            self.current_level_instance = seeded_level(level_num, seed, self.puzzle_index)
+            if self.record_dir:
+                self.recording = Recording(level_num, seed, self.puzzle_index)
         self.state = GameState.PLAYING
     
+    def save_recording(self, result):
+        """Write the session being recorded, if any, with how it ended"""
+        if self.recording:
+            self.recording.finish(self.current_level_instance, result)
+            self.recording.save(self.record_dir)
+            self.recording = None
+    
+    def prewarm_candidates(self):
+        """Levels most likely to be started next, best guess first"""
+        current = getattr(self, 'current_level', None)
+        if self.state == GameState.GAME_OVER:
+            return [current] if current else []
+        candidates = []
+        if current:
+            candidates += [current + 1, current]
+        candidates += [level_num for level_num, _ in level_registry.items()]
+        return candidates
+    
+    def prewarm_next_level(self):
+        """Build the first candidate level that is not ready yet"""
+        for level_num in self.prewarm_candidates():
+            if level_registry.prewarm(level_num):
+                return level_num
+        return None
+    
     def run(self):
         """Main game loop"""
+        overlay = self.perf_overlay
         while self.running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                
-                if self.state == GameState.MENU:
-                    self.handle_menu_events(event)
-                elif self.state == GameState.LEVEL_SELECT:
-                    self.handle_level_select_events(event)
-                elif self.state == GameState.PLAYING:
-                    if hasattr(self, 'current_level_instance'):
-                        self.current_level_instance.handle_event(event)
-                elif self.state == GameState.SCOREBOARD:
-                    if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                        self.state = GameState.MENU
-                elif self.state == GameState.GAME_OVER:
-                    self.handle_game_over_events(event)
+            overlay.begin_frame()
+            phase_start = time.perf_counter()
+            self.process_events()
+            phase_end = time.perf_counter()
+            overlay.record("event", phase_end - phase_start)
+            
+            phase_start = phase_end
+            self.update()
+            phase_end = time.perf_counter()
+            overlay.record("update", phase_end - phase_start)
             
-            # Update game state
-            if self.state == GameState.PLAYING and hasattr(self, 'current_level_instance'):
-                result = self.current_level_instance.update()
-                if result == "completed":
-                    level_score = self.current_level_instance.get_score()
-                    self.score += level_score
-                    # Check if it's a new high score
-                    if self.high_scores and self.score > self.high_scores[-1][1]:
-                        self.add_high_score("PLAYER", self.score)
-                    self.state = GameState.LEVEL_SELECT
-                elif result == "failed":
-                    self.state = GameState.GAME_OVER
+            phase_start = phase_end
+            self.draw_frame()
+            phase_end = time.perf_counter()
+            overlay.record("draw", phase_end - phase_start)
             
-            # Draw everything
-            self.screen.fill(BLACK)
+            overlay_rect = overlay.draw(self.screen, self.clock)
+            if overlay_rect:
+                self.mark_dirty(overlay_rect)
+            
+            phase_start = time.perf_counter()
+            self.present_frame()
+            overlay.record("present", time.perf_counter() - phase_start)
+            overlay.end_frame()
+            # Levels always run at full rate; menus may be throttled when idle
+            self.pacer.wait(self.clock, animating=self.state == GameState.PLAYING)
+        
+        if self.state == GameState.PLAYING:
+            # Quit mid-level: keep the session so far
+            self.save_recording("playing")
+        if self.pacer.enabled:
+            print(self.pacer.summary())
+        pygame.quit()
+        sys.exit()
+    
+    def process_events(self):
+        """Dispatch pending events to the active screen or level"""
+        for event in pygame.event.get():
+            self.pacer.note_event(event)
+            if event.type == pygame.QUIT:
+                self.running = False
+            elif event.type == pygame.VIDEORESIZE:
+                self.display.resize(event.size)
+                self.full_redraw = True
+            elif event.type == pygame.KEYDOWN:
+                # Input can change any part of the screen
+                self.full_redraw = True
+                if event.key == PerfOverlay.TOGGLE_KEY:
+                    self.perf_overlay.toggle()
+                    continue
             
             if self.state == GameState.MENU:
-                self.draw_menu()
+                self.handle_menu_events(event)
             elif self.state == GameState.LEVEL_SELECT:
-                self.draw_level_select()
+                self.handle_level_select_events(event)
             elif self.state == GameState.PLAYING:
                 if hasattr(self, 'current_level_instance'):
-                    self.current_level_instance.draw(self.screen)
-                    # Add persistent scoreboard to all levels
-                    self.draw_persistent_scoreboard(self.screen)
+                    if self.recording and event.type == pygame.KEYDOWN:
+                        self.recording.key(event.key)
+                    self.current_level_instance.handle_event(event)
             elif self.state == GameState.SCOREBOARD:
-                self.draw_scoreboard()
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                    self.state = GameState.MENU
             elif self.state == GameState.GAME_OVER:
-                self.draw_game_over()
-            
-            pygame.display.flip()
-            self.clock.tick(FPS)
-        
-        pygame.quit()
-        sys.exit()
+                self.handle_game_over_events(event)
+    
+    def update(self):
+        """Update game state"""
+        # Pre-build levels once the waiting screen is already on display
+        if (self.prewarm_levels and self.state in (GameState.LEVEL_SELECT, GameState.GAME_OVER)
+                and self.presented_state == self.state):
+            self.prewarm_next_level()
+        # The clock is read once per frame; levels only see whole fixed steps of it
+        now = self.game_clock.now()
+        if self.state == GameState.PLAYING and hasattr(self, 'current_level_instance'):
+            level_start = time.perf_counter()
+            result = "playing"
+            for _ in range(self.timestep.advance(now)):
+                result = self.current_level_instance.step(self.timestep.step)
+                if self.recording:
+                    self.recording.step()
+                if result != "playing":
+                    break
+            self.perf_overlay.record("level_update", time.perf_counter() - level_start)
+            if result != "playing":
+                self.save_recording(result)
+            if result == "completed":
+                level_score = self.current_level_instance.get_score()
+                self.score += level_score
+                # Check if it's a new high score
+                if self.high_scores and self.score > self.high_scores[-1][1]:
+                    self.add_high_score("PLAYER", self.score)
+                self.celebrate()
+                self.state = GameState.LEVEL_SELECT
+            elif result == "failed":
+                self.state = GameState.GAME_OVER
+        else:
+            # Time spent outside a level does not count towards it
+            self.timestep.reset(now)
+    
+    def draw_frame(self):
+        """Draw everything for the current state"""
+        animation_clock.sample()
+        self.frame_dirty_rects = []
+        self.screen.fill(BLACK)
+        
+        if self.state == GameState.MENU:
+            self.draw_menu()
+        elif self.state == GameState.LEVEL_SELECT:
+            self.draw_level_select()
+        elif self.state == GameState.PLAYING:
+            if hasattr(self, 'current_level_instance'):
+                level = self.current_level_instance
+                level.track_dirty_rects = self.dirty_rect_mode
+                level_start = time.perf_counter()
+                level.draw(self.screen)
+                self.perf_overlay.record("level_draw", time.perf_counter() - level_start)
+                # Add persistent scoreboard to all levels
+                self.draw_persistent_scoreboard(self.screen)
+                
+                level_rects = level.take_dirty_rects()
+                if level_rects is None:
+                    self.full_redraw = True
+                else:
+                    self.frame_dirty_rects.extend(level_rects)
+        elif self.state == GameState.SCOREBOARD:
+            self.draw_scoreboard()
+        elif self.state == GameState.GAME_OVER:
+            self.draw_game_over()
+    
+    def present_frame(self):
+        """Push the finished frame to the display
+        
+        In dirty-rect mode only the areas reported through mark_dirty() this
+        frame and the last one are updated; everything else stays as it was
+        composited on the last full redraw.
+        """
+        if self.state != self.presented_state:
+            self.presented_state = self.state
+            self.full_redraw = True
+        
+        if not self.dirty_rect_mode or self.full_redraw:
+            self.display.present()
+            self.full_redraw = False
+        else:
+            to_pixels = self.screen.to_pixels
+            self.display.present([to_pixels(rect) for rect in self.previous_dirty_rects + self.frame_dirty_rects])
+        self.previous_dirty_rects = self.frame_dirty_rects
+    
+    def mark_dirty(self, rect):
+        """Report an area of the screen that changed this frame"""
+        if self.dirty_rect_mode:
+            self.frame_dirty_rects.append(pygame.Rect(rect))
     
     def draw_menu(self):
         """Draw main menu with enhanced graphics"""
         self.draw_animated_background()
         
         # Animated title with glow effect
-        current_time = pygame.time.get_ticks()
-        glow_intensity = int(50 + 30 * pygame.math.Vector2(1, 0).rotate(current_time / 500).x)
-        
-        # Title glow (reduced intensity to not overwhelm text)
-        for offset in range(3, 0, -1):
-            glow_color = (0, max(20, glow_intensity - offset * 15), max(10, glow_intensity - offset * 10))
-            title_surface = self.font_large.render("DSA LEARNING ADVENTURE", True, glow_color)
-            title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2 + offset, 150 + offset))
-            self.screen.blit(title_surface, title_rect)
+        current_time = animation_clock.ticks
+        glow_intensity = int(50 + 30 * animation_clock.cos("menu_glow"))
         
-        # Main title (ensure it's clearly visible)
-        main_title = self.font_large.render("DSA LEARNING ADVENTURE", True, GREEN)
-        title_rect = main_title.get_rect(center=(SCREEN_WIDTH // 2, 150))
-        self.screen.blit(main_title, title_rect)
+        # Title with glow (reduced intensity to not overwhelm text)
+        self.mark_dirty(self.menu_title.draw(self.screen, (SCREEN_WIDTH // 2, 150), glow_intensity))
         
         # Animated subtitle box
-        subtitle_y = 200 + 10 * pygame.math.Vector2(1, 0).rotate(current_time / 1000).y
+        subtitle_y = 200 + 10 * animation_clock.sin("menu_subtitle_bob")
         title_rect = pygame.Rect(150, int(subtitle_y), 724, 80)
+        self.mark_dirty(title_rect)
         
         # Gradient effect simulation (reduced intensity)
         for i in range(3):
             color_val = 20 + i * 15
             inner_rect = pygame.Rect(title_rect.x + i, title_rect.y + i, 
                                    title_rect.width - 2*i, title_rect.height - 2*i)
-            pygame.draw.rect(self.screen, (0, color_val, color_val), inner_rect, 2)
+            self.screen.rect((0, color_val, color_val), inner_rect, 2)
         
-        subtitle_text = self.font_medium.render("Master Data Structures & Algorithms", True, WHITE)
-        subtitle_rect = subtitle_text.get_rect(center=(SCREEN_WIDTH // 2, int(subtitle_y) + 40))
+        subtitle_text = render_text(self.font_medium, "Master Data Structures & Algorithms", True, WHITE)
+        subtitle_rect = self.screen.rect_of(subtitle_text, center=(SCREEN_WIDTH // 2, int(subtitle_y) + 40))
         self.screen.blit(subtitle_text, subtitle_rect)
         
         # Enhanced menu buttons with better text visibility
@@ -319,38 +610,52 @@ class DSAGame:
         # Amazon Q Developer Attribution
         attribution_y = SCREEN_HEIGHT - 40
         attribution_rect = pygame.Rect(50, attribution_y - 10, SCREEN_WIDTH - 100, 35)
-        pygame.draw.rect(self.screen, (20, 20, 50), attribution_rect)
-        pygame.draw.rect(self.screen, CYAN, attribution_rect, 1)
+        self.screen.rect((20, 20, 50), attribution_rect)
+        self.screen.rect(CYAN, attribution_rect, 1)
         
         attribution_text = "Built using Amazon Q Developer CLI for AWS Games Challenge June 2025"
-        attribution_surface = self.font_small.render(attribution_text, True, CYAN)
-        attribution_text_rect = attribution_surface.get_rect(center=(SCREEN_WIDTH // 2, attribution_y + 7))
+        attribution_surface = render_text(self.font_small, attribution_text, True, CYAN)
+        attribution_text_rect = self.screen.rect_of(attribution_surface, center=(SCREEN_WIDTH // 2, attribution_y + 7))
         self.screen.blit(attribution_surface, attribution_text_rect)
         
         # Animated decorative elements (reduced intensity)
-        for i in range(10):
-            angle = current_time / 1500 + i * 0.6
-            x = SCREEN_WIDTH // 2 + 250 * pygame.math.Vector2(1, 0).rotate(angle * 57.3).x
-            y = SCREEN_HEIGHT // 2 + 150 * pygame.math.Vector2(1, 0).rotate(angle * 57.3).y
-            size = 2 + 1 * pygame.math.Vector2(1, 0).rotate(angle * 2 * 57.3).x
-            color_intensity = int(100 + 50 * pygame.math.Vector2(1, 0).rotate(angle * 3 * 57.3).x)
-            color = (color_intensity, 0, color_intensity // 2)
-            pygame.draw.circle(self.screen, color, (int(x), int(y)), max(1, int(size)))
+        self.mark_dirty(self.menu_particles.draw(self.screen, current_time))
     
     def draw_main_menu_scoreboard(self):
         """Draw a compact scoreboard on the main menu"""
+        # Score list is re-rendered only when a high score is added
+        if self.menu_scores_layer_version != self.high_scores_version:
+            self.menu_scores_layer = self.build_main_menu_scoreboard()
+            self.menu_scores_layer_version = self.high_scores_version
+        self.screen.blit(self.menu_scores_layer, (50, 320))
+        
+        # Current session score if any
+        if self.score > 0:
+            current_rect = pygame.Rect(60, 490, 180, 25)
+            self.screen.rect((0, 50, 0), current_rect)
+            self.screen.rect(GREEN, current_rect, 1)
+            
+            current_text = f"Current: {self.score:,}"
+            current_surface = render_text(self.font_small, current_text, True, GREEN)
+            current_text_rect = self.screen.rect_of(current_surface, center=(150, 502))
+            self.screen.blit(current_surface, current_text_rect)
+    
+    def build_main_menu_scoreboard(self):
+        """Render the main menu high score box (panel origin at 50, 320)"""
+        panel = Canvas.new((200, 200))
+        
         # Scoreboard background
-        score_rect = pygame.Rect(50, 320, 200, 200)
-        pygame.draw.rect(self.screen, (0, 0, 30), score_rect)
-        pygame.draw.rect(self.screen, YELLOW, score_rect, 2)
+        score_rect = pygame.Rect(0, 0, 200, 200)
+        panel.rect((0, 0, 30), score_rect)
+        panel.rect(YELLOW, score_rect, 2)
         
         # Title
-        title_text = self.font_medium.render("HIGH SCORES", True, YELLOW)
-        title_rect = title_text.get_rect(center=(150, 340))
-        self.screen.blit(title_text, title_rect)
+        title_text = render_text(self.font_medium, "HIGH SCORES", True, YELLOW)
+        title_rect = panel.rect_of(title_text, center=(100, 20))
+        panel.blit(title_text, title_rect)
         
         # Top 5 scores
-        y_start = 365
+        y_start = 45
         for i, (name, score) in enumerate(self.high_scores[:5]):
             y_pos = y_start + i * 25
             
@@ -366,40 +671,59 @@ class DSAGame:
             
             # Score text
             score_text = f"{i+1}. {name[:6]} {score:,}"
-            score_surface = self.font_small.render(score_text, True, color)
-            self.screen.blit(score_surface, (65, y_pos))
+            score_surface = render_text(self.font_small, score_text, True, color)
+            panel.blit(score_surface, (15, y_pos))
         
-        # Current session score if any
-        if self.score > 0:
-            current_rect = pygame.Rect(60, 490, 180, 25)
-            pygame.draw.rect(self.screen, (0, 50, 0), current_rect)
-            pygame.draw.rect(self.screen, GREEN, current_rect, 1)
-            
-            current_text = f"Current: {self.score:,}"
-            current_surface = self.font_small.render(current_text, True, GREEN)
-            current_text_rect = current_surface.get_rect(center=(150, 502))
-            self.screen.blit(current_surface, current_text_rect)
+        panel = panel.surface
+        if pygame.display.get_surface() is not None:
+            panel = panel.convert()
+        return panel
     
     def draw_level_select(self):
         """Draw level selection screen with enhanced graphics"""
         self.draw_animated_background()
         
         # Animated header
-        current_time = pygame.time.get_ticks()
-        header_y = 80 + 5 * pygame.math.Vector2(1, 0).rotate(current_time / 800).y
-        self.draw_text_centered("SELECT LEVEL", self.font_large, GREEN, int(header_y))
+        header_y = 80 + 5 * animation_clock.sin("level_select_header_bob")
+        self.mark_dirty(self.draw_text_centered("SELECT LEVEL", self.font_large, GREEN, int(header_y)))
+        
+        # Level cards (pre-built, rebuilt only when the level registry changes)
+        if level_registry.version != self.level_cards_key:
+            self.level_cards_layer = self.build_level_cards()
+            self.level_cards_key = level_registry.version
+        self.screen.blit(self.level_cards_layer, ((SCREEN_WIDTH - 900) // 2, 180))
+        
+        # Instructions with animated background
+        inst_y = 720
+        inst_rect = pygame.Rect(50, inst_y - 10, SCREEN_WIDTH - 100, 60)
+        self.screen.rect((0, 0, 50), inst_rect)
+        self.screen.rect(CYAN, inst_rect, 2)
+        
+        self.draw_text_centered("Press 1-4 to select available levels", self.font_small, YELLOW, inst_y + 5)
+        self.draw_text_centered("Press ESC to return to menu", self.font_small, WHITE, inst_y + 25)
         
-        # Level cards
-        y_start = 180
+        # Level completion fireworks
+        if len(self.celebration):
+            self.celebration.update(animation_clock.ticks)
+            celebration_rect = self.celebration.draw(self.screen)
+            if celebration_rect:
+                self.mark_dirty(celebration_rect)
+    
+    def build_level_cards(self):
+        """Draw every level card into one colour-keyed layer"""
         card_width = 900
         card_height = 45
-        
-        for level_num, level_info in self.levels.items():
-            y_pos = y_start + (level_num - 1) * 55
-            card_x = (SCREEN_WIDTH - card_width) // 2
+        levels = level_registry.items()
+        rows = levels[-1][0] if levels else 0
+        layer = Canvas.new((card_width, max(1, rows * 55 - 10)))
+        layer.fill(SPRITE_COLORKEY)
+        
+        for level_num, level_info in levels:
+            y_pos = (level_num - 1) * 55
+            card_x = 0
             
             # Determine colors and status
-            if level_info.get("locked", False):
+            if level_info.locked:
                 bg_color = (30, 30, 30)
                 border_color = GRAY
                 text_color = GRAY
@@ -415,8 +739,8 @@ class DSAGame:
                     text_color = GRAY
                 
                 difficulty_colors = {"Easy": GREEN, "Medium": YELLOW, "Hard": RED}
-                diff_color = difficulty_colors.get(level_info['difficulty'], WHITE)
-                status = f" - {level_info['difficulty']} ({level_info['time_limit']}s)"
+                diff_color = difficulty_colors.get(level_info.difficulty, WHITE)
+                status = f" - {level_info.difficulty} ({level_info.time_limit}s)"
             
             # Draw level card
             card_rect = pygame.Rect(card_x, y_pos, card_width, card_height)
@@ -425,146 +749,145 @@ class DSAGame:
             for i in range(3):
                 inner_rect = pygame.Rect(card_x + i, y_pos + i, card_width - 2*i, card_height - 2*i)
                 shade = max(0, bg_color[0] + i * 10), max(0, bg_color[1] + i * 10), max(0, bg_color[2] + i * 10)
-                pygame.draw.rect(self.screen, shade, inner_rect)
+                layer.rect(shade, inner_rect)
             
-            pygame.draw.rect(self.screen, border_color, card_rect, 3)
+            layer.rect(border_color, card_rect, 3)
             
             # Level number circle
             circle_x = card_x + 30
             circle_y = y_pos + card_height // 2
-            pygame.draw.circle(self.screen, border_color, (circle_x, circle_y), 18, 3)
-            num_text = self.font_medium.render(str(level_num), True, text_color)
-            num_rect = num_text.get_rect(center=(circle_x, circle_y))
-            self.screen.blit(num_text, num_rect)
+            layer.circle(border_color, (circle_x, circle_y), 18, 3)
+            num_text = render_text(self.font_medium, str(level_num), True, text_color)
+            num_rect = layer.rect_of(num_text, center=(circle_x, circle_y))
+            layer.blit(num_text, num_rect)
             
             # Level info
-            info_text = f"{level_info['name']}{status}"
-            info_surface = self.font_medium.render(info_text, True, text_color)
-            self.screen.blit(info_surface, (card_x + 70, y_pos + 12))
+            info_text = f"{level_info.name}{status}"
+            info_surface = render_text(self.font_medium, info_text, True, text_color)
+            layer.blit(info_surface, (card_x + 70, y_pos + 12))
             
             # Difficulty indicator
-            if not level_info.get("locked", False):
+            if not level_info.locked:
                 diff_rect = pygame.Rect(card_x + card_width - 100, y_pos + 10, 80, 25)
-                diff_bg = difficulty_colors.get(level_info['difficulty'], GRAY)
-                pygame.draw.rect(self.screen, diff_bg, diff_rect)
-                diff_text = self.font_small.render(level_info['difficulty'], True, BLACK)
-                diff_text_rect = diff_text.get_rect(center=diff_rect.center)
-                self.screen.blit(diff_text, diff_text_rect)
-        
-        # Instructions with animated background
-        inst_y = 720
-        inst_rect = pygame.Rect(50, inst_y - 10, SCREEN_WIDTH - 100, 60)
-        pygame.draw.rect(self.screen, (0, 0, 50), inst_rect)
-        pygame.draw.rect(self.screen, CYAN, inst_rect, 2)
-        
-        self.draw_text_centered("Press 1-4 to select available levels", self.font_small, YELLOW, inst_y + 5)
-        self.draw_text_centered("Press ESC to return to menu", self.font_small, WHITE, inst_y + 25)
+                diff_bg = difficulty_colors.get(level_info.difficulty, GRAY)
+                layer.rect(diff_bg, diff_rect)
+                diff_text = render_text(self.font_small, level_info.difficulty, True, BLACK)
+                diff_text_rect = layer.rect_of(diff_text, center=diff_rect.center)
+                layer.blit(diff_text, diff_text_rect)
+        
+        layer = layer.surface
+        if pygame.display.get_surface() is not None:
+            layer = layer.convert()
+        layer.set_colorkey(SPRITE_COLORKEY, pygame.RLEACCEL)
+        return layer
     
     def draw_scoreboard(self):
         """Draw high scores with enhanced graphics"""
         self.draw_animated_background()
         
         # Animated title
-        current_time = pygame.time.get_ticks()
-        title_glow = int(100 + 50 * pygame.math.Vector2(1, 0).rotate(current_time / 600).x)
+        title_glow = int(100 + 50 * animation_clock.cos("scoreboard_glow"))
         
         # Title with glow
-        for offset in range(3, 0, -1):
-            glow_color = (0, title_glow - offset * 20, 0)
-            title_surface = self.font_large.render("HIGH SCORES", True, glow_color)
-            title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2 + offset, 100 + offset))
-            self.screen.blit(title_surface, title_rect)
+        self.mark_dirty(self.scoreboard_title.draw(self.screen, (SCREEN_WIDTH // 2, 100), title_glow))
         
-        self.draw_text_centered("HIGH SCORES", self.font_large, GREEN, 100)
+        # Score table is re-rendered only when a high score is added
+        if self.scoreboard_layer_version != self.high_scores_version:
+            self.scoreboard_layer = self.build_scoreboard_table()
+            self.scoreboard_layer_version = self.high_scores_version
+        self.screen.blit(self.scoreboard_layer, (200, 180))
+        
+        # Instructions
+        self.draw_text_centered("Press ESC to return to menu", self.font_small, WHITE, 650)
+    
+    def build_scoreboard_table(self):
+        """Render the high score board (table origin at 200, 180)"""
+        # Rows may run past the bottom of the board, so the rest stays transparent
+        table_height = max(400, 70 + len(self.high_scores) * 35 - 10)
+        table = Canvas.new((624, table_height))
+        table.fill(SPRITE_COLORKEY)
         
         # Scoreboard background
-        board_rect = pygame.Rect(200, 180, 624, 400)
-        pygame.draw.rect(self.screen, (0, 0, 30), board_rect)
-        pygame.draw.rect(self.screen, CYAN, board_rect, 3)
+        board_rect = pygame.Rect(0, 0, 624, 400)
+        table.rect((0, 0, 30), board_rect)
+        table.rect(CYAN, board_rect, 3)
         
         # Header
-        header_rect = pygame.Rect(220, 200, 584, 40)
-        pygame.draw.rect(self.screen, (0, 50, 50), header_rect)
-        rank_text = self.font_medium.render("RANK", True, WHITE)
-        name_text = self.font_medium.render("NAME", True, WHITE)
-        score_text = self.font_medium.render("SCORE", True, WHITE)
+        header_rect = pygame.Rect(20, 20, 584, 40)
+        table.rect((0, 50, 50), header_rect)
+        rank_text = render_text(self.font_medium, "RANK", True, WHITE)
+        name_text = render_text(self.font_medium, "NAME", True, WHITE)
+        score_text = render_text(self.font_medium, "SCORE", True, WHITE)
         
-        self.screen.blit(rank_text, (240, 210))
-        self.screen.blit(name_text, (350, 210))
-        self.screen.blit(score_text, (650, 210))
+        table.blit(rank_text, (40, 30))
+        table.blit(name_text, (150, 30))
+        table.blit(score_text, (450, 30))
         
         # Scores with alternating backgrounds
-        y_start = 250
+        y_start = 70
         for i, (name, score) in enumerate(self.high_scores):
             y_pos = y_start + i * 35
             
             # Alternating row colors
-            row_rect = pygame.Rect(220, y_pos - 5, 584, 30)
+            row_rect = pygame.Rect(20, y_pos - 5, 584, 30)
             row_color = (20, 20, 40) if i % 2 == 0 else (10, 10, 20)
-            pygame.draw.rect(self.screen, row_color, row_rect)
+            table.rect(row_color, row_rect)
             
             # Rank medal for top 3
             rank_color = YELLOW if i == 0 else (192, 192, 192) if i == 1 else (205, 127, 50) if i == 2 else WHITE
             
             # Draw rank with medal effect for top 3
             if i < 3:
-                medal_x, medal_y = 250, y_pos + 10
-                pygame.draw.circle(self.screen, rank_color, (medal_x, medal_y), 12)
-                pygame.draw.circle(self.screen, BLACK, (medal_x, medal_y), 12, 2)
-                rank_surface = self.font_small.render(str(i+1), True, BLACK)
-                rank_rect = rank_surface.get_rect(center=(medal_x, medal_y))
-                self.screen.blit(rank_surface, rank_rect)
+                medal_x, medal_y = 50, y_pos + 10
+                get_sprite_atlas().draw(table, f"medal_{i + 1}", (medal_x, medal_y))
+                rank_surface = render_text(self.font_small, str(i+1), True, BLACK)
+                rank_rect = table.rect_of(rank_surface, center=(medal_x, medal_y))
+                table.blit(rank_surface, rank_rect)
             else:
-                rank_surface = self.font_medium.render(f"{i+1:2d}.", True, rank_color)
-                self.screen.blit(rank_surface, (240, y_pos))
+                rank_surface = render_text(self.font_medium, f"{i+1:2d}.", True, rank_color)
+                table.blit(rank_surface, (40, y_pos))
             
             # Name and score
-            name_surface = self.font_medium.render(name, True, WHITE)
-            score_surface = self.font_medium.render(f"{score:,}", True, rank_color)
+            name_surface = render_text(self.font_medium, name, True, WHITE)
+            score_surface = render_text(self.font_medium, f"{score:,}", True, rank_color)
             
-            self.screen.blit(name_surface, (350, y_pos))
-            score_rect = score_surface.get_rect(right=750)
+            table.blit(name_surface, (150, y_pos))
+            score_rect = table.rect_of(score_surface, right=550)
             score_rect.y = y_pos
-            self.screen.blit(score_surface, score_rect)
+            table.blit(score_surface, score_rect)
         
-        # Instructions
-        self.draw_text_centered("Press ESC to return to menu", self.font_small, WHITE, 650)
+        table = table.surface
+        if pygame.display.get_surface() is not None:
+            table = table.convert()
+        table.set_colorkey(SPRITE_COLORKEY, pygame.RLEACCEL)
+        return table
     
     def draw_game_over(self):
         """Draw game over screen with enhanced graphics"""
         self.draw_animated_background()
         
         # Animated "GAME OVER" with dramatic effect
-        current_time = pygame.time.get_ticks()
+        current_time = animation_clock.ticks
         
         # Pulsing red glow (reduced intensity)
-        glow_intensity = int(100 + 50 * pygame.math.Vector2(1, 0).rotate(current_time / 300).x)
-        
-        # Multiple glow layers (reduced)
-        for offset in range(4, 0, -1):
-            glow_color = (max(50, glow_intensity - offset * 20), 0, 0)
-            title_surface = self.font_large.render("GAME OVER", True, glow_color)
-            title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2 + offset, 250 + offset))
-            self.screen.blit(title_surface, title_rect)
+        glow_intensity = int(100 + 50 * animation_clock.cos("game_over_glow"))
         
-        # Main title
-        main_title = self.font_large.render("GAME OVER", True, RED)
-        title_rect = main_title.get_rect(center=(SCREEN_WIDTH // 2, 250))
-        self.screen.blit(main_title, title_rect)
+        # Main title over multiple glow layers (reduced)
+        self.mark_dirty(self.game_over_title.draw(self.screen, (SCREEN_WIDTH // 2, 250), glow_intensity))
         
         # Score display with background
         score_rect = pygame.Rect(300, 350, 424, 80)
-        pygame.draw.rect(self.screen, (40, 0, 0), score_rect)
-        pygame.draw.rect(self.screen, RED, score_rect, 3)
+        self.screen.rect((40, 0, 0), score_rect)
+        self.screen.rect(RED, score_rect, 3)
         
-        score_text = self.font_medium.render(f"Final Score: {self.score:,}", True, WHITE)
-        score_text_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, 390))
+        score_text = render_text(self.font_medium, f"Final Score: {self.score:,}", True, WHITE)
+        score_text_rect = self.screen.rect_of(score_text, center=(SCREEN_WIDTH // 2, 390))
         self.screen.blit(score_text, score_text_rect)
         
         # Check if it's a high score
         if self.high_scores and self.score > self.high_scores[-1][1]:
-            high_score_text = self.font_medium.render("NEW HIGH SCORE!", True, YELLOW)
-            high_score_rect = high_score_text.get_rect(center=(SCREEN_WIDTH // 2, 320))
+            high_score_text = render_text(self.font_medium, "NEW HIGH SCORE!", True, YELLOW)
+            high_score_rect = self.screen.rect_of(high_score_text, center=(SCREEN_WIDTH // 2, 320))
             self.screen.blit(high_score_text, high_score_rect)
         
         # Enhanced control options with better text visibility
@@ -574,15 +897,49 @@ class DSAGame:
         self.draw_retro_button("PRESS ESC FOR MAIN MENU", 250, button_y + 140, 524, 50, CYAN, (0, 20, 20))
         
         # Animated failure particles (reduced intensity)
-        for i in range(8):
-            angle = current_time / 800 + i * 0.8
-            x = SCREEN_WIDTH // 2 + 150 * pygame.math.Vector2(1, 0).rotate(angle * 57.3).x
-            y = 400 + 80 * pygame.math.Vector2(1, 0).rotate(angle * 2 * 57.3).y
-            size = 1 + 2 * abs(pygame.math.Vector2(1, 0).rotate(angle * 3 * 57.3).x)
-            color_intensity = int(150 + 50 * pygame.math.Vector2(1, 0).rotate(angle * 4 * 57.3).x)
-            color = (color_intensity, 0, 0)
-            pygame.draw.circle(self.screen, color, (int(x), int(y)), max(1, int(size)))
+        self.mark_dirty(self.game_over_particles.draw(self.screen, current_time))
 
 if __name__ == "__main__":
-    game = DSAGame()
+    parser = argparse.ArgumentParser(description="DSA Learning Adventure")
+    parser.add_argument("--dirty-rects", action="store_true",
+                        help="only push changed screen areas to the display")
+    parser.add_argument("--no-adaptive-fps", action="store_true",
+                        help="always run at full frame rate, even when idle or unfocused")
+    parser.add_argument("--window", metavar="WIDTHxHEIGHT",
+                        help=f"window size; the game is laid out at {SCREEN_WIDTH}x{SCREEN_HEIGHT} and scaled to fit")
+    parser.add_argument("--render-scale", type=float, default=RENDER_SCALE, metavar="SCALE",
+                        help="draw at this fraction of the layout size (e.g. 0.5 on slow machines)")
+    parser.add_argument("--scale-mode", choices=SCALE_MODES, default=SCALE_MODE,
+                        help="how the game is scaled to a window of a different size")
+    parser.add_argument("--resizable", action="store_true",
+                        help="allow the window to be resized while playing")
+    parser.add_argument("--record", metavar="DIR",
+                        help="save a replay of every level played to this directory (see replay.py)")
+    parser.add_argument("--puzzle", type=int, metavar="N",
+                        help="start every level on puzzle N of the puzzle bank (see puzzle_bank.py)")
+    args = parser.parse_args()
+    
+    if args.puzzle is not None:
+        bank = get_puzzle_bank()
+        if bank is None:
+            parser.error("--puzzle: no puzzle bank; generate one with puzzle_bank.py")
+        if not all(0 <= args.puzzle < bank.count(level_num) for level_num in bank.sections):
+            parser.error(f"--puzzle: choose a puzzle from 0 to {min(map(bank.count, bank.sections)) - 1}")
+    
+    window_size = None
+    if args.window:
+        try:
+            window_size = parse_size(args.window)
+        except ValueError as e:
+            parser.error(f"--window: {e}")
+    
+    try:
+        set_render_scale(args.render_scale)
+    except ValueError as e:
+        parser.error(f"--render-scale: {e}")
+    
+    game = DSAGame(dirty_rects=args.dirty_rects, adaptive_fps=not args.no_adaptive_fps,
+                   window_size=window_size, scale_mode=args.scale_mode, resizable=args.resizable,
+                   record_dir=args.record, puzzle_index=args.puzzle, render_scale=args.render_scale)
+    print(font_registry.report())
     game.run()
@@ -0,0 +1,71 @@
+"""
+Shared font registry for DSA Learning Adventure
+
+Each (face, size) is loaded and parsed once per process and the same
+pygame.font.Font instance is handed to the menus, every level and the
+tools. Restarting a level no longer reloads its fonts, and the text cache
+in render_cache.py sees one stable key per font. Sizes are logical: fonts
+are loaded at the render scale (canvas.py) so text is drawn at the size of
+everything around it.
+"""
+import time
+
+import pygame
+
+from canvas import get_render_scale
+
+
+class FontRegistry:
+    """Loads each (face, size) once and records how long loading took"""
+
+    def __init__(self):
+        self._fonts = {}
+        self.load_ms = {}
+        self._quit_hooked = False
+
+    def __len__(self):
+        return len(self._fonts)
+
+    def get(self, size, face=None):
+        """Shared font for a logical size; face is a font file path or None for the default font"""
+        key = (face, max(1, round(size * get_render_scale())))
+        font = self._fonts.get(key)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            if not self._quit_hooked:
+                # Fonts die with pygame.quit(); forget them so the next get() reloads
+                pygame.register_quit(self.clear)
+                self._quit_hooked = True
+            start = time.perf_counter()
+            font = pygame.font.Font(face, key[1])
+            self.load_ms[key] = (time.perf_counter() - start) * 1000
+            self._fonts[key] = font
+        return font
+
+    def clear(self):
+        self._fonts.clear()
+        self.load_ms.clear()
+        self._quit_hooked = False
+
+    def preload(self, sizes, face=None):
+        """Load fonts up front so the first screen that uses them does not stall"""
+        for size in sizes:
+            self.get(size, face)
+
+    def total_load_ms(self):
+        return sum(self.load_ms.values())
+
+    def report(self):
+        faces = {face or "default" for face, _ in self._fonts}
+        return (f"Loaded {len(self._fonts)} fonts ({', '.join(sorted(faces))}) "
+                f"in {self.total_load_ms():.1f} ms")
+
+
+# Shared by the game, the levels and the tools
+font_registry = FontRegistry()
+
+
+def get_font(size, face=None):
+    """Shared font instance for (face, size)"""
+    return font_registry.get(size, face)
@@ -0,0 +1,110 @@
+"""
+Adaptive frame pacing for DSA Learning Adventure
+
+Runs at the full frame rate while a level is being played (even in the
+background, so its clock keeps pace with real time) or the player is using
+the menus. Outside a level it drops to a low rate once a menu screen has
+sat without input for a while or the window loses focus, and blocks in
+pygame.event.wait() while the window is minimized. Any input returns to
+the full rate immediately.
+"""
+import time
+
+import pygame
+
+# Events that count as the player being present
+INPUT_EVENTS = (
+    pygame.KEYDOWN,
+    pygame.KEYUP,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEMOTION,
+    pygame.ACTIVEEVENT,
+    pygame.WINDOWFOCUSGAINED,
+    pygame.WINDOWSHOWN,
+    pygame.WINDOWRESTORED,
+)
+
+
+class FramePacer:
+    """Chooses the frame rate for each frame and estimates the CPU time saved"""
+
+    def __init__(self, active_fps=60, idle_fps=10, unfocused_fps=5,
+                 idle_timeout_ms=10000, hidden_wait_ms=500, enabled=True):
+        self.active_fps = active_fps
+        self.idle_fps = idle_fps
+        self.unfocused_fps = unfocused_fps
+        self.idle_timeout_ms = idle_timeout_ms
+        self.hidden_wait_ms = hidden_wait_ms
+        self.enabled = enabled
+
+        self.mode = "active"
+        self.last_input = pygame.time.get_ticks()
+        self.last_cpu = time.process_time()
+        self.last_wall = time.perf_counter()
+        self.active_cpu_per_frame = 0.0
+        self.frames_skipped = 0.0
+        self.cpu_saved = 0.0
+
+    def note_event(self, event):
+        """Return to the full frame rate when the player does anything"""
+        if event.type in INPUT_EVENTS:
+            self.last_input = pygame.time.get_ticks()
+
+    def choose_mode(self, animating):
+        """Pick the pacing mode; animating screens always run at full rate"""
+        if not self.enabled or animating:
+            return "active"
+        if not pygame.display.get_active():
+            return "hidden"
+        if not pygame.key.get_focused():
+            return "unfocused"
+        if pygame.time.get_ticks() - self.last_input < self.idle_timeout_ms:
+            return "active"
+        return "idle"
+
+    def wait(self, clock, animating):
+        """Wait out the rest of the frame according to the current mode"""
+        self.account_frame()
+        self.mode = self.choose_mode(animating)
+
+        if self.mode == "hidden":
+            # Sleep until something happens, then hand the event back to the loop
+            event = pygame.event.wait(self.hidden_wait_ms)
+            if event.type != pygame.NOEVENT:
+                pygame.event.post(event)
+            clock.tick()
+        elif self.mode == "unfocused":
+            clock.tick(self.unfocused_fps)
+        elif self.mode == "idle":
+            clock.tick(self.idle_fps)
+        else:
+            clock.tick(self.active_fps)
+
+    def account_frame(self):
+        """Charge the frame that just ended to the mode it was paced in"""
+        cpu = time.process_time()
+        wall = time.perf_counter()
+        cpu_used = cpu - self.last_cpu
+        wall_elapsed = wall - self.last_wall
+        self.last_cpu = cpu
+        self.last_wall = wall
+
+        if self.mode == "active":
+            self.active_cpu_per_frame += (cpu_used - self.active_cpu_per_frame) * 0.05
+        else:
+            # The previous frame covered this much wall time at the low rate
+            skipped = max(0.0, wall_elapsed * self.active_fps - 1)
+            self.frames_skipped += skipped
+            self.cpu_saved += skipped * self.active_cpu_per_frame
+
+    def stats(self):
+        return {
+            "mode": self.mode,
+            "frames_skipped": int(self.frames_skipped),
+            "cpu_saved_s": self.cpu_saved,
+            "active_cpu_per_frame_ms": self.active_cpu_per_frame * 1000,
+        }
+
+    def summary(self):
+        return (f"Adaptive pacing skipped {int(self.frames_skipped):,} frames, "
+                f"saving about {self.cpu_saved:.1f}s of CPU time")
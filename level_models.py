@@ -0,0 +1,431 @@
+"""
+Level state models for DSA Learning Adventure
+
+Each level's game state and rules live in a plain Python model with
+__slots__: no pygame, no fonts, no surfaces. The classes in levels.py wrap
+a model, turn key presses into calls on it and draw it. Models are cheap
+to create and copy(), so the simulator can play them by the million, and
+every change bumps version so a renderer knows when what it drew is stale.
+
+Actions are ordinary methods (push, search_left, ...). Time only moves
+when step() is called with simulated seconds (see game_clock.py). Random
+numbers come from the model's own rng, seeded by the caller, so a level is
+reproducible from its seed. Levels with a fixed puzzle (puzzle_bank.py)
+can start from one instead of generating it.
+"""
+import copy
+import random
+from array import array
+from collections import deque
+from itertools import accumulate
+
+from structures import ProcessedSummary, RingBuffer, SequenceMatcher
+
+
+class LevelModel:
+    """State shared by every level: time limit, simulated time and score"""
+
+    __slots__ = ("time_limit", "elapsed", "score", "version", "seed", "_rng")
+
+    def __init__(self, time_limit, seed=None):
+        self.time_limit = time_limit
+        # Every random number the level uses comes from rng, seeded with this
+        self.seed = seed
+        self._rng = None
+        # Simulated seconds played, advanced by step() rather than read from the OS clock
+        self.elapsed = 0.0
+        self.score = 0
+        # Bumped by every action that changes what the level looks like
+        self.version = 0
+
+    def copy(self):
+        """Independent copy of the state (containers are copied, not shared)"""
+        clone = object.__new__(type(self))
+        for cls in type(self).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                if hasattr(self, name):
+                    setattr(clone, name, copy.copy(getattr(self, name)))
+        return clone
+
+    @property
+    def rng(self):
+        """The level's random stream, seeded on first use (a level started from a puzzle may never need it)"""
+        if self._rng is None:
+            self._rng = random.Random(self.seed)
+        return self._rng
+
+    def changed(self):
+        self.version += 1
+
+    def begin(self):
+        """Start the level's timers; called when play starts (the level may have been pre-built)"""
+        self.elapsed = 0.0
+
+    def step(self, dt):
+        """Advance by dt simulated seconds and run the rules; returns update()'s result"""
+        self.elapsed += dt
+        return self.update()
+
+    def get_remaining_time(self):
+        return max(0, self.time_limit - self.elapsed)
+
+    def is_time_up(self):
+        return self.get_remaining_time() <= 0
+
+    def get_score(self):
+        # Bonus points for remaining time
+        time_bonus = int(self.get_remaining_time() * 10)
+        return self.score + time_bonus
+
+    def update(self):
+        """Check win/lose conditions: "playing", "completed" or "failed" """
+        raise NotImplementedError
+
+
+class ArrayModel(LevelModel):
+    """Level 1: find the target value in an unsorted array"""
+
+    __slots__ = ("array", "positions", "target", "selected_index", "attempts", "max_attempts")
+
+    # Array sizes: the normal game and the large array mode
+    SIZE = 10
+    LARGE_SIZE = 5000
+    # Pre-generated puzzles: SIZE values and the target
+    PUZZLE_SIZE = SIZE
+    PUZZLE_HAS_TARGET = True
+
+    def __init__(self, time_limit, size=SIZE, seed=None, puzzle=None):
+        super().__init__(time_limit, seed)
+        self.max_attempts = 3
+        if puzzle is not None:
+            self.load_puzzle(puzzle)
+        else:
+            self.new_array(size)
+
+    def new_array(self, size):
+        """Start over on a fresh array of size unique values"""
+        self.array = self.generate_unique_array(size)
+        self.index_array()
+        self.target = self.rng.choice(self.array)
+        self.selected_index = 0
+        self.attempts = 0
+        self.generate_new_target()
+        self.changed()
+
+    def load_puzzle(self, puzzle):
+        """Start on a pre-generated array and target"""
+        self.array = list(puzzle.values)
+        self.index_array()
+        self.target = puzzle.target
+        self.selected_index = 0
+        self.attempts = 0
+        self.changed()
+
+    def generate_unique_array(self, size=SIZE):
+        """Generate array with unique numbers"""
+        if size <= 10:
+            return self.rng.sample(range(1, 51), size)  # unique numbers from 1-50
+        return self.rng.sample(range(1, size * 5 + 1), size)
+
+    def index_array(self):
+        """Rebuild the value -> index map (after the array is created or shuffled)"""
+        self.positions = {value: index for index, value in enumerate(self.array)}
+
+    def start_large_array(self):
+        """Switch to an array of thousands of values"""
+        if len(self.array) != self.LARGE_SIZE:
+            self.new_array(self.LARGE_SIZE)
+
+    def generate_puzzle(self):
+        """(values, target) for a new puzzle, from the rng (for puzzle_bank.py)"""
+        values = self.generate_unique_array(self.SIZE)
+        return values, self.rng.choice(values)
+
+    @classmethod
+    def valid_puzzle(cls, values, target):
+        """Unique values from 1-50 containing the target"""
+        return (len(values) == cls.SIZE and len(set(values)) == cls.SIZE and
+                all(1 <= value <= 50 for value in values) and target in values)
+
+    def generate_new_target(self):
+        self.target = self.rng.choice(self.array)
+        self.attempts = 0
+
+    def select(self, index):
+        """Move the selection (clamped to the array)"""
+        self.selected_index = max(0, min(index, len(self.array) - 1))
+        self.changed()
+
+    def move(self, offset):
+        self.select(self.selected_index + offset)
+
+    def linear_scan_comparisons(self):
+        """Comparisons a linear scan from index 0 makes before reaching the target"""
+        return self.positions[self.target] + 1
+
+    def check_selection(self):
+        self.attempts += 1
+        if self.array[self.selected_index] == self.target:
+            self.score += 100
+            self.generate_new_target()
+            # Shuffle array to make it harder
+            self.rng.shuffle(self.array)
+            self.index_array()
+        else:
+            self.score = max(0, self.score - 20)
+
+        if self.attempts >= self.max_attempts:
+            self.generate_new_target()
+        self.changed()
+
+    def update(self):
+        if self.is_time_up():
+            return "failed"
+        if self.score >= 500:  # Win condition
+            return "completed"
+        return "playing"
+
+
+class StackModel(LevelModel):
+    """Level 2: build the target sequence on top of a stack"""
+
+    __slots__ = ("stack", "target_sequence", "matcher", "match_states", "current_target_index", "operations")
+
+    OPERATION_LOG_SIZE = 32
+    SEQUENCE_LENGTH = 5
+    # Pre-generated puzzles: the target sequence
+    PUZZLE_SIZE = SEQUENCE_LENGTH
+    PUZZLE_HAS_TARGET = False
+
+    def __init__(self, time_limit, seed=None, puzzle=None):
+        super().__init__(time_limit, seed)
+        self.stack = []
+        self.set_target(puzzle.values if puzzle is not None else self.generate_unique_sequence())
+        self.operations = deque(maxlen=self.OPERATION_LOG_SIZE)  # (op, value) tuples
+
+    def generate_unique_sequence(self):
+        """Generate sequence with unique numbers"""
+        return self.rng.sample(range(1, 10), self.SEQUENCE_LENGTH)  # 5 unique numbers from 1-9
+
+    def generate_puzzle(self):
+        """(values, target) for a new puzzle, from the rng (for puzzle_bank.py)"""
+        return self.generate_unique_sequence(), None
+
+    @classmethod
+    def valid_puzzle(cls, values, target):
+        """Unique values from 1-9"""
+        return (len(values) == cls.SEQUENCE_LENGTH and len(set(values)) == len(values) and
+                all(1 <= value <= 9 for value in values))
+
+    def set_target(self, sequence):
+        """Aim for a new target sequence, matching it against the current stack"""
+        self.target_sequence = list(sequence)
+        self.matcher = SequenceMatcher(self.target_sequence)
+        # Matcher state for every stack depth (match_states[d] describes stack[:d]),
+        # so a pop restores the previous state instead of rescanning the stack
+        self.match_states = [0]
+        for value in self.stack:
+            self.match_states.append(self.matcher.step(self.match_states[-1], value))
+        # Length of the target prefix that the top of the stack currently ends with
+        self.current_target_index = self.match_states[-1]
+        self.changed()
+
+    def push(self, value):
+        self.stack.append(value)
+        self.match_states.append(self.matcher.step(self.match_states[-1], value))
+        self.operations.append(("PUSH", value))
+        self.check_progress()
+
+    def pop(self):
+        if self.stack:
+            value = self.stack.pop()
+            self.match_states.pop()
+            self.operations.append(("POP", value))
+            self.check_progress()
+
+    def check_progress(self):
+        """Check if the top of the stack ends with the target sequence (bottom to top)"""
+        self.current_target_index = self.match_states[-1]
+        if self.current_target_index == len(self.target_sequence):
+            self.score += 100  # Bonus for completing sequence
+        self.changed()
+
+    def update(self):
+        if self.is_time_up():
+            return "failed"
+        # Only complete when ALL targets in sequence are matched consecutively
+        if self.current_target_index >= len(self.target_sequence):
+            return "completed"
+        return "playing"
+
+
+class QueueModel(LevelModel):
+    """Level 3: serve customers in arrival order"""
+
+    __slots__ = ("queue", "processed", "customer_id", "target_processed", "spawn_timer",
+                 "spawn_interval", "spawn_batch", "rush_hour")
+
+    # Queue sizes: the normal game and rush hour
+    CAPACITY = 15
+    RUSH_HOUR_CAPACITY = 10000
+    # Rush hour brings customers in waves of RUSH_HOUR_BATCH every RUSH_HOUR_INTERVAL seconds
+    RUSH_HOUR_INTERVAL = 0.2
+    RUSH_HOUR_BATCH = 40
+
+    def __init__(self, time_limit, rush_hour=False, seed=None):
+        super().__init__(time_limit, seed)
+        self.queue = RingBuffer(self.CAPACITY)
+        self.processed = ProcessedSummary(recent=8)
+        self.customer_id = 1
+        self.target_processed = 10
+        self.spawn_timer = 0.0  # level time of the last spawn
+        self.spawn_interval = 2.0  # seconds
+        self.spawn_batch = 1
+        self.rush_hour = False
+        if rush_hour:
+            self.start_rush_hour()
+
+    def begin(self):
+        super().begin()
+        self.spawn_timer = 0.0
+
+    def start_rush_hour(self):
+        """Switch to a queue of thousands of customers arriving in waves"""
+        if self.rush_hour:
+            return
+        self.rush_hour = True
+        self.queue = RingBuffer(self.RUSH_HOUR_CAPACITY, self.queue)
+        self.spawn_interval = self.RUSH_HOUR_INTERVAL
+        self.spawn_batch = self.RUSH_HOUR_BATCH
+        self.changed()
+
+    def add_customer(self):
+        if self.queue.append(self.customer_id):  # False when the queue is full
+            self.customer_id += 1
+            self.changed()
+
+    def process_customer(self):
+        if self.queue:
+            customer = self.queue.popleft()  # FIFO
+            self.processed.add(customer)
+            self.score += 25
+            self.changed()
+
+    def update(self):
+        try:
+            # Auto-spawn customers
+            if self.elapsed - self.spawn_timer > self.spawn_interval:
+                for _ in range(self.spawn_batch):
+                    self.add_customer()
+                self.spawn_timer = self.elapsed
+
+            if self.is_time_up():
+                return "failed"
+            if len(self.processed) >= self.target_processed:
+                return "completed"
+            return "playing"
+        except Exception as e:
+            print(f"QueueLevel update error: {e}")
+            return "failed"
+
+
+class BinarySearchModel(LevelModel):
+    """Level 4: find the target in a sorted array by halving the search range"""
+
+    __slots__ = ("array", "target", "left", "right", "mid", "comparisons", "max_comparisons", "found")
+
+    # Array sizes: the normal game and the large search mode
+    SIZE = 15
+    LARGE_SIZE = 1_000_000
+    # Pre-generated puzzles: SIZE sorted values and the target
+    PUZZLE_SIZE = SIZE
+    PUZZLE_HAS_TARGET = True
+
+    def __init__(self, time_limit, size=SIZE, seed=None, puzzle=None):
+        super().__init__(time_limit, seed)
+        if puzzle is not None:
+            self.new_search(puzzle=puzzle)
+        else:
+            self.new_search(size)
+
+    def new_search(self, size=SIZE, puzzle=None):
+        """Start over on a fresh sorted array of size unique values, or on a pre-generated one"""
+        if puzzle is not None:
+            # Read-only here, so the puzzle's values are used as they are
+            self.array = puzzle.values
+            self.target = puzzle.target
+        else:
+            self.array = self.generate_array(size)
+            self.target = self.rng.choice(self.array)
+        self.left = 0
+        self.right = len(self.array) - 1
+        self.mid = (self.left + self.right) // 2
+        self.comparisons = 0
+        # Binary search needs at most ceil(log2(n + 1)) comparisons
+        self.max_comparisons = len(self.array).bit_length()
+        self.found = False
+        self.changed()
+
+    def generate_array(self, size):
+        """Sorted unique values"""
+        if size <= 100:
+            return sorted(self.rng.sample(range(1, 101), size))  # unique numbers from 1-100
+        # A running sum of random gaps is already sorted and unique; stored compactly
+        return array("l", accumulate(self.rng.choices((1, 2, 3), k=size)))
+
+    def generate_puzzle(self):
+        """(values, target) for a new puzzle, from the rng (for puzzle_bank.py)"""
+        values = self.generate_array(self.SIZE)
+        return values, self.rng.choice(values)
+
+    @classmethod
+    def valid_puzzle(cls, values, target):
+        """Strictly increasing values from 1-100 containing the target"""
+        return (len(values) == cls.SIZE and all(a < b for a, b in zip(values, values[1:])) and
+                1 <= values[0] and values[-1] <= 100 and target in values)
+
+    def start_large_search(self):
+        """Switch to searching an array of a million values"""
+        if len(self.array) != self.LARGE_SIZE:
+            self.new_search(self.LARGE_SIZE)
+
+    def search_left(self):
+        if not self.found and self.left <= self.right:
+            self.comparisons += 1
+            if self.array[self.mid] > self.target:
+                self.right = self.mid - 1
+                self.score += 20
+            else:
+                self.score = max(0, self.score - 10)
+            self.update_mid()
+            self.changed()
+
+    def search_right(self):
+        if not self.found and self.left <= self.right:
+            self.comparisons += 1
+            if self.array[self.mid] < self.target:
+                self.left = self.mid + 1
+                self.score += 20
+            else:
+                self.score = max(0, self.score - 10)
+            self.update_mid()
+            self.changed()
+
+    def check_found(self):
+        if self.array[self.mid] == self.target:
+            self.found = True
+            self.score += 100
+        else:
+            self.score = max(0, self.score - 20)
+        self.changed()
+
+    def update_mid(self):
+        if self.left <= self.right:
+            self.mid = (self.left + self.right) // 2
+
+    def update(self):
+        if self.is_time_up() or self.comparisons >= self.max_comparisons:
+            return "failed" if not self.found else "completed"
+        if self.found:
+            return "completed"
+        return "playing"
@@ -0,0 +1,150 @@
+"""
+Level registry for DSA Learning Adventure
+
+Level classes register themselves with their metadata using the
+@register_level decorator; future levels are listed as locked
+placeholders. The modules that define levels are only imported the first
+time the registry is queried, and levels are only constructed when asked
+for. While the player is on the level select screen the game pre-builds
+the level they are most likely to pick next (see prewarm()), so starting
+it is just handing over an instance that already exists.
+"""
+import importlib
+import time
+
+from puzzle_bank import get_puzzle_bank
+
+# Modules whose import registers levels
+LEVEL_MODULES = ("levels",)
+
+
+class LevelInfo:
+    """Metadata for one level, shown on the level select screen"""
+
+    __slots__ = ("number", "name", "time_limit", "difficulty", "level_class")
+
+    def __init__(self, number, name, time_limit, difficulty, level_class=None):
+        self.number = number
+        self.name = name
+        self.time_limit = time_limit
+        self.difficulty = difficulty
+        self.level_class = level_class
+
+    @property
+    def locked(self):
+        """Placeholders without an implementation cannot be played yet"""
+        return self.level_class is None
+
+
+class LevelRegistry:
+    """Level metadata by number, lazy construction and pre-warmed instances"""
+
+    def __init__(self, modules=LEVEL_MODULES):
+        self.modules = modules
+        self.loaded = False
+        self._levels = {}
+        self._prewarmed = {}
+        self._quit_hooked = False
+        # Bumped whenever a level is added; the level select cards are cached against it
+        self.version = 0
+        self.last_build_ms = 0.0
+
+    def register(self, number, name, time_limit, difficulty):
+        """Class decorator registering a playable level"""
+        def decorator(level_class):
+            info = LevelInfo(number, name, time_limit, difficulty, level_class)
+            level_class.level_info = info
+            self._add(info)
+            return level_class
+        return decorator
+
+    def placeholder(self, number, name, time_limit, difficulty):
+        """List a level that is not implemented yet (shown as locked)"""
+        if number in self._levels and not self._levels[number].locked:
+            return
+        self._add(LevelInfo(number, name, time_limit, difficulty))
+
+    def _add(self, info):
+        self._levels[info.number] = info
+        self._prewarmed.pop(info.number, None)
+        self.version += 1
+
+    def load(self):
+        """Import the level modules once so their levels register themselves"""
+        if not self.loaded:
+            self.loaded = True
+            for module in self.modules:
+                importlib.import_module(module)
+
+    def items(self):
+        """(number, LevelInfo) pairs in level order"""
+        self.load()
+        return sorted(self._levels.items())
+
+    def info(self, number):
+        self.load()
+        return self._levels.get(number)
+
+    def is_playable(self, number):
+        info = self.info(number)
+        return info is not None and not info.locked
+
+    def create(self, number, seed=None, puzzle_index=None):
+        """Construct a new instance of a playable level
+
+        seed makes its random numbers repeatable; puzzle_index starts it on
+        that puzzle from the puzzle bank (levels without puzzles ignore it).
+        """
+        info = self.info(number)
+        if info is None or info.locked:
+            raise ValueError(f"Level {number} not implemented yet!")
+        options = {}
+        if seed is not None:
+            options["seed"] = seed
+        if puzzle_index is not None:
+            bank = get_puzzle_bank()
+            if bank is None:
+                raise ValueError("No puzzle bank; generate one with puzzle_bank.py")
+            puzzle = bank.puzzle(number, puzzle_index)
+            if puzzle is not None:
+                options["puzzle"] = puzzle
+        start = time.perf_counter()
+        level = info.level_class(**options)
+        self.last_build_ms = (time.perf_counter() - start) * 1000
+        return level
+
+    def prewarm(self, number):
+        """Build a level ahead of time; returns True if an instance was built"""
+        if number in self._prewarmed or not self.is_playable(number):
+            return False
+        if not self._quit_hooked:
+            import pygame
+
+            # Pre-built levels hold fonts that die with pygame.quit()
+            pygame.register_quit(self.discard_prewarmed)
+            self._quit_hooked = True
+        self._prewarmed[number] = self.create(number)
+        return True
+
+    def is_prewarmed(self, number):
+        return number in self._prewarmed
+
+    def take(self, number):
+        """Hand over a level ready to play, pre-warmed if possible
+
+        The level's timers start now, not when it was built.
+        """
+        level = self._prewarmed.pop(number, None)
+        if level is None:
+            level = self.create(number)
+        level.begin()
+        return level
+
+    def discard_prewarmed(self):
+        self._prewarmed.clear()
+        self._quit_hooked = False
+
+
+# Shared by the game, the levels module and the tools
+level_registry = LevelRegistry()
+register_level = level_registry.register
@@ -1,58 +1,96 @@
 import pygame
-import random
-import time
 from abc import ABC, abstractmethod
+from itertools import islice
 
-# Constants
-SCREEN_WIDTH = 1024
-SCREEN_HEIGHT = 768
-
-# Colors
-BLACK = (0, 0, 0)
-WHITE = (255, 255, 255)
-GREEN = (0, 255, 0)
-RED = (255, 0, 0)
-BLUE = (0, 0, 255)
-YELLOW = (255, 255, 0)
-PURPLE = (255, 0, 255)
-CYAN = (0, 255, 255)
-ORANGE = (255, 165, 0)
-GRAY = (128, 128, 128)
+from animation import animation_clock, cos_deg, sin_deg
+from assets import get_sprite_atlas
+from config import (SCREEN_WIDTH, SCREEN_HEIGHT, BLACK, WHITE, GREEN, RED, BLUE, YELLOW, PURPLE,
+                    CYAN, ORANGE, GRAY, LEVEL_FONT_SIZES)
+from fonts import get_font
+from level_models import ArrayModel, BinarySearchModel, QueueModel, StackModel
+from level_registry import level_registry, register_level
+from render_cache import render_text
 
 class BaseLevel(ABC):
-    def __init__(self, time_limit):
-        self.time_limit = time_limit
-        self.start_time = time.time()
-        self.score = 0
-        self.completed = False
-        self.failed = False
-        self.font_large = pygame.font.Font(None, 36)
-        self.font_medium = pygame.font.Font(None, 24)
-        self.font_small = pygame.font.Font(None, 18)
+    """Input and drawing for one level; its state and rules live in self.model (level_models.py)
+
+    Attributes the level does not have itself are read from the model, so
+    level.score or level.push(3) work on the level as before.
+    """
+    # Set by @register_level
+    level_info = None
+    # The level_models.py class holding this level's state
+    model_class = None
+    
+    def __init__(self, model):
+        self.model = model
+        self.font_large, self.font_medium, self.font_small = (get_font(size) for size in LEVEL_FONT_SIZES)
+        
+        # Dirty-rectangle reporting, switched on by the game in dirty-rect mode
+        self.track_dirty_rects = False
+        self.dirty_rects = []
+        self.needs_full_redraw = True
+        # Model version on screen; any change to the model is presented in full
+        self.presented_version = model.version
+    
+    def __getattr__(self, name):
+        # Only reached for attributes the level itself does not have
+        if name == "model":
+            raise AttributeError(name)
+        return getattr(self.model, name)
+    
+    def mark_dirty(self, rect):
+        """Report an area of the screen that changed this frame"""
+        if self.track_dirty_rects:
+            self.dirty_rects.append(pygame.Rect(rect))
     
-    def get_remaining_time(self):
-        elapsed = time.time() - self.start_time
-        return max(0, self.time_limit - elapsed)
+    def request_full_redraw(self):
+        """Ask for the whole screen to be presented on the next frame"""
+        self.needs_full_redraw = True
     
-    def is_time_up(self):
-        return self.get_remaining_time() <= 0
+    def take_dirty_rects(self):
+        """Return the areas changed since the last call, or None for a full redraw"""
+        rects = self.dirty_rects
+        self.dirty_rects = []
+        if self.needs_full_redraw or self.presented_version != self.model.version:
+            self.needs_full_redraw = False
+            self.presented_version = self.model.version
+            return None
+        return rects
+    
+    def background_ticks(self):
+        """Time used by decorative backgrounds (held still while tracking dirty rects)"""
+        if self.track_dirty_rects:
+            return 0
+        return animation_clock.ticks
+    
+    def begin(self):
+        """Start the level's timers; called when play starts (the level may have been pre-built)"""
+        self.model.begin()
+    
+    def step(self, dt):
+        """Advance the level by dt simulated seconds and run its logic; returns update()'s result"""
+        return self.model.step(dt)
+    
+    def update(self):
+        """Check win/lose conditions: "playing", "completed" or "failed" """
+        return self.model.update()
     
     def get_score(self):
-        # Bonus points for remaining time
-        time_bonus = int(self.get_remaining_time() * 10)
-        return self.score + time_bonus
+        return self.model.get_score()
     
     def draw_hud(self, screen):
         """Draw enhanced heads-up display with time and score (left side only)"""
         # HUD background (smaller to not conflict with persistent scoreboard)
         hud_rect = pygame.Rect(10, 10, 280, 100)
-        pygame.draw.rect(screen, (0, 0, 50), hud_rect)
-        pygame.draw.rect(screen, CYAN, hud_rect, 2)
+        self.mark_dirty(hud_rect)
+        get_sprite_atlas().draw(screen, "hud_panel", hud_rect.topleft)
         
         # Time display with progress bar
-        remaining_time = self.get_remaining_time()
+        model = self.model
+        remaining_time = model.get_remaining_time()
         time_text = f"Time: {int(remaining_time)}s"
-        time_surface = self.font_medium.render(time_text, True, YELLOW)
+        time_surface = render_text(self.font_medium, time_text, True, YELLOW)
         screen.blit(time_surface, (20, 20))
         
         # Time progress bar
@@ -61,10 +99,10 @@ class BaseLevel(ABC):
         bar_x, bar_y = 20, 45
         
         # Background bar
-        pygame.draw.rect(screen, GRAY, (bar_x, bar_y, bar_width, bar_height))
+        screen.rect(GRAY, (bar_x, bar_y, bar_width, bar_height))
         
         # Progress bar
-        progress = remaining_time / self.time_limit
+        progress = remaining_time / model.time_limit
         progress_width = int(bar_width * progress)
         
         if progress > 0.5:
@@ -74,301 +112,259 @@ class BaseLevel(ABC):
         else:
             bar_color = RED
             
-        pygame.draw.rect(screen, bar_color, (bar_x, bar_y, progress_width, bar_height))
-        pygame.draw.rect(screen, WHITE, (bar_x, bar_y, bar_width, bar_height), 1)
+        screen.rect(bar_color, (bar_x, bar_y, progress_width, bar_height))
+        screen.rect(WHITE, (bar_x, bar_y, bar_width, bar_height), 1)
         
         # Level score display (not total score - that's in persistent scoreboard)
-        level_score_text = f"Level Score: {self.score:,}"
-        score_surface = self.font_medium.render(level_score_text, True, WHITE)
+        level_score_text = f"Level Score: {model.score:,}"
+        score_surface = render_text(self.font_medium, level_score_text, True, WHITE)
         screen.blit(score_surface, (20, 70))
         
         # Time warning with pulsing effect
         if remaining_time < 10:
-            current_time = pygame.time.get_ticks()
-            alpha = int(128 + 127 * pygame.math.Vector2(1, 0).rotate(current_time / 100).x)
+            alpha = int(128 + 127 * animation_clock.cos("hud_warning_pulse"))
             warning_color = (255, alpha // 2, alpha // 2)
-            warning = self.font_medium.render("TIME RUNNING OUT!", True, warning_color)
-            screen.blit(warning, (320, 20))
+            warning = render_text(self.font_medium, "TIME RUNNING OUT!", True, warning_color)
+            self.mark_dirty(screen.blit(warning, (320, 20)))
     
     @abstractmethod
     def handle_event(self, event):
         pass
     
-    @abstractmethod
-    def update(self):
-        pass
-    
     @abstractmethod
     def draw(self, screen):
+        """Draw the level on a Canvas (canvas.py) in logical coordinates"""
         pass
 
+@register_level(1, "Array Basics", time_limit=60, difficulty="Easy")
 class ArrayLevel(BaseLevel):
     """Level 1: Array Basics - Find elements in array"""
-    def __init__(self):
-        super().__init__(60)  # 60 seconds
-        self.array = self.generate_unique_array()
-        self.target = random.choice(self.array)
-        self.selected_index = 0
-        self.attempts = 0
-        self.max_attempts = 3
-        self.generate_new_target()
-    
-    def generate_unique_array(self):
-        """Generate array with unique numbers"""
-        return random.sample(range(1, 51), 10)  # 10 unique numbers from 1-50
+    model_class = ArrayModel
+    # Cells that fit across the screen
+    VISIBLE_CELLS = 10
     
-    def generate_new_target(self):
-        self.target = random.choice(self.array)
-        self.attempts = 0
+    def __init__(self, size=ArrayModel.SIZE, model=None, seed=None, puzzle=None):
+        # Time limit from the registry
+        super().__init__(model or self.model_class(self.level_info.time_limit, size, seed, puzzle))
+        # First array index shown in the viewport
+        self.scroll = 0
     
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_LEFT and self.selected_index > 0:
-                self.selected_index -= 1
-            elif event.key == pygame.K_RIGHT and self.selected_index < len(self.array) - 1:
-                self.selected_index += 1
+            model = self.model
+            if event.key == pygame.K_LEFT:
+                model.move(-1)
+            elif event.key == pygame.K_RIGHT:
+                model.move(1)
+            elif event.key == pygame.K_PAGEUP:
+                model.move(-self.VISIBLE_CELLS)
+            elif event.key == pygame.K_PAGEDOWN:
+                model.move(self.VISIBLE_CELLS)
+            elif event.key == pygame.K_HOME:
+                model.select(0)
+            elif event.key == pygame.K_END:
+                model.select(len(model.array) - 1)
             elif event.key == pygame.K_SPACE:
-                self.check_selection()
+                model.check_selection()
+            elif event.key == pygame.K_l:
+                model.start_large_array()
     
-    def check_selection(self):
-        self.attempts += 1
-        if self.array[self.selected_index] == self.target:
-            self.score += 100
-            self.generate_new_target()
-            # Shuffle array to make it harder
-            random.shuffle(self.array)
-        else:
-            self.score = max(0, self.score - 20)
-            
-        if self.attempts >= self.max_attempts:
-            self.generate_new_target()
-    
-    def update(self):
-        if self.is_time_up():
-            return "failed"
-        if self.score >= 500:  # Win condition
-            return "completed"
-        return "playing"
+    def follow_selection(self):
+        """Scroll the viewport just enough to keep the selection visible; returns the cells shown"""
+        model = self.model
+        count = min(len(model.array), self.VISIBLE_CELLS)
+        self.scroll = min(self.scroll, len(model.array) - count)
+        if model.selected_index < self.scroll:
+            self.scroll = model.selected_index
+        elif model.selected_index >= self.scroll + count:
+            self.scroll = model.selected_index - count + 1
+        return count
     
     def draw(self, screen):
+        model = self.model
         screen.fill(BLACK)
         self.draw_hud(screen)
         
         # Animated background grid
-        current_time = pygame.time.get_ticks()
-        for i in range(0, 1024, 50):
-            alpha = int(30 + 20 * pygame.math.Vector2(1, 0).rotate(current_time / 1000 + i / 100).x)
+        background_time = self.background_ticks()
+        for i in range(0, SCREEN_WIDTH, 50):
+            alpha = int(30 + 20 * cos_deg(background_time / 1000 + i / 100))
             color = (0, alpha, alpha // 2)
-            pygame.draw.line(screen, color, (i, 120), (i, 768), 1)
+            screen.line(color, (i, 120), (i, SCREEN_HEIGHT), 1)
         
         # Enhanced instructions with background
         inst_rect = pygame.Rect(40, 140, 944, 60)
-        pygame.draw.rect(screen, (0, 30, 0), inst_rect)
-        pygame.draw.rect(screen, GREEN, inst_rect, 2)
+        screen.rect((0, 30, 0), inst_rect)
+        screen.rect(GREEN, inst_rect, 2)
         
-        inst_text = f"Find {self.target} in the array! Use LEFT/RIGHT arrows and SPACE to select"
-        inst_surface = self.font_medium.render(inst_text, True, WHITE)
+        inst_text = f"Find {model.target} in the array! Use LEFT/RIGHT arrows and SPACE to select"
+        inst_surface = render_text(self.font_medium, inst_text, True, WHITE)
         screen.blit(inst_surface, (60, 160))
         
         # Target highlight
-        target_text = f"TARGET: {self.target}"
-        target_surface = self.font_large.render(target_text, True, YELLOW)
+        target_text = f"TARGET: {model.target}"
+        target_surface = render_text(self.font_large, target_text, True, YELLOW)
         target_rect = pygame.Rect(60, 220, 200, 50)
-        pygame.draw.rect(screen, (50, 50, 0), target_rect)
-        pygame.draw.rect(screen, YELLOW, target_rect, 3)
+        screen.rect((50, 50, 0), target_rect)
+        screen.rect(YELLOW, target_rect, 3)
         screen.blit(target_surface, (70, 235))
         
-        # Enhanced array visualization
+        # Enhanced array visualization: only the cells in the viewport
         start_x = 100
         start_y = 300
         cell_width = 70
         cell_height = 50
-        
-        for i, value in enumerate(self.array):
-            x = start_x + i * (cell_width + 15)
+        atlas = get_sprite_atlas()
+        count = self.follow_selection()
+        target_index = model.positions[model.target]
+        
+        for column in range(count):
+            i = self.scroll + column
+            value = model.array[i]
+            x = start_x + column * (cell_width + 15)
             y = start_y
             
-            # 3D cell effect
-            # Shadow
-            shadow_rect = pygame.Rect(x + 3, y + 3, cell_width, cell_height)
-            pygame.draw.rect(screen, (30, 30, 30), shadow_rect)
-            
-            # Main cell
-            cell_rect = pygame.Rect(x, y, cell_width, cell_height)
-            
-            # Color based on selection and value
-            if i == self.selected_index:
-                # Animated selection
-                glow = int(100 + 50 * pygame.math.Vector2(1, 0).rotate(current_time / 200).x)
-                cell_color = (glow, glow, 0)
-                border_color = YELLOW
-                pygame.draw.rect(screen, cell_color, cell_rect)
-            elif value == self.target:
-                cell_color = (0, 50, 0)
-                border_color = GREEN
-                pygame.draw.rect(screen, cell_color, cell_rect)
+            # 3D cell (shadow, border and highlight) from the sprite atlas,
+            # colour based on selection and value
+            if i == model.selected_index:
+                # Animated selection fill under the cell frame
+                cell_rect = pygame.Rect(x, y, cell_width, cell_height)
+                glow = int(100 + 50 * animation_clock.cos("array_selection_glow"))
+                screen.rect((glow, glow, 0), cell_rect)
+                atlas.draw(screen, "array_cell_selected", (x, y))
+                self.mark_dirty(cell_rect)
+            elif i == target_index:
+                atlas.draw(screen, "array_cell_target", (x, y))
             else:
-                cell_color = (30, 30, 50)
-                border_color = WHITE
-                pygame.draw.rect(screen, cell_color, cell_rect)
-            
-            pygame.draw.rect(screen, border_color, cell_rect, 3)
-            
-            # Highlight effect
-            highlight_rect = pygame.Rect(x + 2, y + 2, cell_width - 4, cell_height // 3)
-            pygame.draw.rect(screen, (255, 255, 255, 30), highlight_rect)
-            
-            # Value text with shadow
-            text_shadow = self.font_medium.render(str(value), True, BLACK)
-            screen.blit(text_shadow, (x + cell_width//2 - 8, y + cell_height//2 - 8))
-            
-            text = self.font_medium.render(str(value), True, WHITE)
-            text_rect = text.get_rect(center=(x + cell_width//2, y + cell_height//2))
+                atlas.draw(screen, "array_cell", (x, y))
+            
+            # Value text with shadow (offset from the text itself for the long values of a large array)
+            text = render_text(self.font_medium, str(value), True, WHITE)
+            text_rect = screen.rect_of(text, center=(x + cell_width//2, y + cell_height//2))
+            text_shadow = render_text(self.font_medium, str(value), True, BLACK)
+            if value < 100:
+                screen.blit(text_shadow, (x + cell_width//2 - 8, y + cell_height//2 - 8))
+            else:
+                screen.blit(text_shadow, text_rect.move(3, 0))
             screen.blit(text, text_rect)
             
             # Index label
-            index_text = self.font_small.render(str(i), True, GRAY)
-            index_rect = index_text.get_rect(center=(x + cell_width//2, y - 15))
+            index_text = render_text(self.font_small, str(i), True, GRAY)
+            index_rect = screen.rect_of(index_text, center=(x + cell_width//2, y - 15))
             screen.blit(index_text, index_rect)
         
         # Enhanced attempts display
         attempts_rect = pygame.Rect(50, 400, 300, 80)
-        pygame.draw.rect(screen, (50, 0, 0), attempts_rect)
-        pygame.draw.rect(screen, RED, attempts_rect, 2)
+        screen.rect((50, 0, 0), attempts_rect)
+        screen.rect(RED, attempts_rect, 2)
         
-        attempts_text = f"Attempts: {self.attempts}/{self.max_attempts}"
-        attempts_surface = self.font_medium.render(attempts_text, True, WHITE)
+        attempts_text = f"Attempts: {model.attempts}/{model.max_attempts}"
+        attempts_surface = render_text(self.font_medium, attempts_text, True, WHITE)
         screen.blit(attempts_surface, (70, 420))
         
         # Visual attempt indicators
-        for i in range(self.max_attempts):
+        for i in range(model.max_attempts):
             circle_x = 70 + i * 30
             circle_y = 450
-            if i < self.attempts:
-                pygame.draw.circle(screen, RED, (circle_x, circle_y), 8)
-            else:
-                pygame.draw.circle(screen, GRAY, (circle_x, circle_y), 8, 2)
+            marker = "attempt_used" if i < model.attempts else "attempt_left"
+            atlas.draw(screen, marker, (circle_x, circle_y))
         
         # Progress indicator
-        progress_text = f"Score needed: 500 | Current: {self.score}"
-        progress_surface = self.font_small.render(progress_text, True, WHITE)
+        progress_text = f"Score needed: 500 | Current: {model.score}"
+        progress_surface = render_text(self.font_small, progress_text, True, WHITE)
         screen.blit(progress_surface, (400, 450))
+        
+        # How much work a linear search does for the same target
+        scan_text = f"Linear scan: {model.linear_scan_comparisons()} comparisons to reach {model.target}"
+        scan_surface = render_text(self.font_small, scan_text, True, CYAN)
+        screen.blit(scan_surface, (400, 425))
+        
+        if len(model.array) > count:
+            self.draw_overview(screen, count, target_index)
+    
+    def draw_overview(self, screen, count, target_index):
+        """Whole array compressed into one bar: viewport, selection and target"""
+        model = self.model
+        size = len(model.array)
+        bar = pygame.Rect(300, 232, 650, 12)
+        screen.rect((20, 20, 30), bar)
+        
+        def bar_x(index):
+            return bar.x + index * bar.width // size
+        
+        window_x = bar_x(self.scroll)
+        screen.rect(WHITE, (window_x, bar.y - 2, max(3, bar_x(self.scroll + count) - window_x),
+                            bar.height + 4), 1)
+        target_x = bar_x(target_index)
+        screen.line(GREEN, (target_x, bar.y - 4), (target_x, bar.bottom + 3), 2)
+        selected_x = bar_x(model.selected_index)
+        screen.line(YELLOW, (selected_x, bar.y - 4), (selected_x, bar.bottom + 3), 2)
+        screen.rect(GRAY, bar, 1)
+        
+        caption = f"{size:,} values | showing {self.scroll:,}-{self.scroll + count - 1:,} | PAGE UP/DOWN, HOME/END jump"
+        screen.blit(render_text(self.font_small, caption, True, GRAY), (bar.x, bar.bottom + 6))
 
+@register_level(2, "Stack Operations", time_limit=45, difficulty="Easy")
 class StackLevel(BaseLevel):
     """Level 2: Stack Operations - Push and Pop correctly"""
-    def __init__(self):
-        super().__init__(45)  # 45 seconds
-        self.stack = []
-        self.target_sequence = self.generate_unique_sequence()
-        self.current_target_index = 0
-        self.operations = []
-        self.sequence_matches = []  # Track which targets have been matched
-    
-    def generate_unique_sequence(self):
-        """Generate sequence with unique numbers"""
-        return random.sample(range(1, 10), 5)  # 5 unique numbers from 1-9
+    model_class = StackModel
+    VISIBLE_OPERATIONS = 6
+
+    def __init__(self, model=None, seed=None, puzzle=None):
+        # Time limit from the registry
+        super().__init__(model or self.model_class(self.level_info.time_limit, seed, puzzle))
         
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
             if pygame.K_1 <= event.key <= pygame.K_9:
                 number = event.key - pygame.K_0
-                self.push(number)
+                self.model.push(number)
             elif event.key == pygame.K_SPACE:
-                self.pop()
-    
-    def push(self, value):
-        self.stack.append(value)
-        self.operations.append(f"PUSH {value}")
-        self.check_progress()
-    
-    def pop(self):
-        if self.stack:
-            value = self.stack.pop()
-            self.operations.append(f"POP {value}")
-            # Reset progress when popping - need to rebuild sequence
-            self.reset_progress()
-    
-    def reset_progress(self):
-        """Reset progress when stack is modified by popping"""
-        self.current_target_index = 0
-        self.sequence_matches = []
-        self.check_progress()
-    
-    def check_progress(self):
-        """Check if current stack matches the target sequence from bottom to top"""
-        # Reset progress tracking
-        self.current_target_index = 0
-        self.sequence_matches = []
-        
-        # Check if stack contains the target sequence in order from bottom
-        if len(self.stack) >= len(self.target_sequence):
-            # Check if the last N elements match the target sequence
-            stack_suffix = self.stack[-len(self.target_sequence):]
-            if stack_suffix == self.target_sequence:
-                self.sequence_matches = list(range(len(self.target_sequence)))
-                self.current_target_index = len(self.target_sequence)
-                # Award points for complete sequence
-                if len(self.sequence_matches) == len(self.target_sequence):
-                    self.score += 100  # Bonus for completing sequence
-    
-    def update(self):
-        if self.is_time_up():
-            return "failed"
-        # Only complete when ALL targets in sequence are matched consecutively
-        if (self.current_target_index >= len(self.target_sequence) and 
-            len(self.sequence_matches) == len(self.target_sequence)):
-            return "completed"
-        return "playing"
+                self.model.pop()
     
     def draw(self, screen):
+        model = self.model
         screen.fill(BLACK)
         self.draw_hud(screen)
         
         # Animated background
-        current_time = pygame.time.get_ticks()
+        background_time = self.background_ticks()
         for i in range(5):
-            y = 150 + i * 100 + 20 * pygame.math.Vector2(1, 0).rotate(current_time / 1000 + i).y
-            pygame.draw.line(screen, (20, 20, 40), (0, int(y)), (1024, int(y)), 1)
+            y = 150 + i * 100 + 20 * sin_deg(background_time / 1000 + i)
+            screen.line((20, 20, 40), (0, int(y)), (SCREEN_WIDTH, int(y)), 1)
         
         # Enhanced instructions
         inst_rect = pygame.Rect(40, 110, 944, 80)
-        pygame.draw.rect(screen, (30, 0, 30), inst_rect)
-        pygame.draw.rect(screen, PURPLE, inst_rect, 2)
+        screen.rect((30, 0, 30), inst_rect)
+        screen.rect(PURPLE, inst_rect, 2)
         
         inst_text = "Create the target sequence using stack operations!"
-        inst_surface = self.font_medium.render(inst_text, True, WHITE)
+        inst_surface = render_text(self.font_medium, inst_text, True, WHITE)
         screen.blit(inst_surface, (60, 130))
         
         inst_text2 = "Build the sequence on your stack from LEFT to RIGHT (bottom to top)"
-        inst_surface2 = self.font_medium.render(inst_text2, True, YELLOW)
+        inst_surface2 = render_text(self.font_medium, inst_text2, True, YELLOW)
         screen.blit(inst_surface2, (60, 155))
         
         controls_text = "Press 1-9 to PUSH numbers, SPACE to POP from top"
-        controls_surface = self.font_small.render(controls_text, True, CYAN)
+        controls_surface = render_text(self.font_small, controls_text, True, CYAN)
         screen.blit(controls_surface, (60, 175))
         
         # Enhanced target sequence display
         target_rect = pygame.Rect(50, 210, 500, 60)
-        pygame.draw.rect(screen, (0, 50, 0), target_rect)
-        pygame.draw.rect(screen, GREEN, target_rect, 3)
+        screen.rect((0, 50, 0), target_rect)
+        screen.rect(GREEN, target_rect, 3)
         
-        target_label = self.font_medium.render("TARGET SEQUENCE:", True, GREEN)
+        target_label = render_text(self.font_medium, "TARGET SEQUENCE:", True, GREEN)
         screen.blit(target_label, (70, 220))
         
         # Draw target sequence with progress
-        for i, num in enumerate(self.target_sequence):
+        for i, num in enumerate(model.target_sequence):
             x = 70 + i * 60
             y = 240
             
-            # Check if this position is matched in current stack
-            is_matched = False
-            if len(self.stack) >= len(self.target_sequence):
-                stack_suffix = self.stack[-len(self.target_sequence):]
-                if i < len(stack_suffix) and stack_suffix[i] == num:
-                    is_matched = True
-            
-            # Highlight based on match status
-            if is_matched:
+            # Highlight the part of the target the top of the stack already ends with
+            if i < model.current_target_index:
                 color = GREEN
                 bg_color = (0, 100, 0)
             else:
@@ -377,18 +373,18 @@ class StackLevel(BaseLevel):
             
             # Draw target number
             num_rect = pygame.Rect(x, y, 40, 30)
-            pygame.draw.rect(screen, bg_color, num_rect)
-            pygame.draw.rect(screen, color, num_rect, 2)
+            screen.rect(bg_color, num_rect)
+            screen.rect(color, num_rect, 2)
             
-            num_text = self.font_medium.render(str(num), True, color)
-            num_text_rect = num_text.get_rect(center=num_rect.center)
+            num_text = render_text(self.font_medium, str(num), True, color)
+            num_text_rect = screen.rect_of(num_text, center=num_rect.center)
             screen.blit(num_text, num_text_rect)
             
             # Arrow between numbers
-            if i < len(self.target_sequence) - 1:
+            if i < len(model.target_sequence) - 1:
                 arrow_x = x + 45
                 arrow_y = y + 15
-                pygame.draw.polygon(screen, WHITE, [
+                screen.polygon(WHITE, [
                     (arrow_x, arrow_y - 5),
                     (arrow_x, arrow_y + 5),
                     (arrow_x + 10, arrow_y)
@@ -402,153 +398,134 @@ class StackLevel(BaseLevel):
         
         # Stack base
         base_rect = pygame.Rect(stack_x - 10, stack_y + 10, cell_width + 20, 20)
-        pygame.draw.rect(screen, GRAY, base_rect)
-        
-        # Stack elements with 3D effect
-        for i, value in enumerate(reversed(self.stack)):
+        screen.rect(GRAY, base_rect)
+        
+        # Stack elements with 3D effect; elements of a deep stack that would be
+        # above the top of the screen are skipped
+        atlas = get_sprite_atlas()
+        visible = min(len(model.stack), (stack_y + cell_height) // (cell_height + 5) + 1)
+        for i in range(visible):
+            value = model.stack[-1 - i]
             y = stack_y - i * (cell_height + 5)
-            
-            # Shadow
-            shadow_rect = pygame.Rect(stack_x + 3, y + 3, cell_width, cell_height)
-            pygame.draw.rect(screen, (20, 20, 20), shadow_rect)
-            
-            # Main element
             element_rect = pygame.Rect(stack_x, y, cell_width, cell_height)
             
             # Color based on position
-            if i == len(self.stack) - 1:  # Top element
-                bg_color = (50, 50, 100)
-                border_color = CYAN
+            if i == len(model.stack) - 1:  # Top element
+                atlas.draw(screen, "stack_element_top", element_rect.topleft)
             else:
-                bg_color = (30, 30, 60)
-                border_color = WHITE
-            
-            pygame.draw.rect(screen, bg_color, element_rect)
-            pygame.draw.rect(screen, border_color, element_rect, 2)
-            
-            # Highlight
-            highlight_rect = pygame.Rect(stack_x + 2, y + 2, cell_width - 4, cell_height // 3)
-            pygame.draw.rect(screen, (255, 255, 255, 50), highlight_rect)
+                atlas.draw(screen, "stack_element", element_rect.topleft)
             
             # Value
-            text = self.font_medium.render(str(value), True, WHITE)
-            text_rect = text.get_rect(center=element_rect.center)
+            text = render_text(self.font_medium, str(value), True, WHITE)
+            text_rect = screen.rect_of(text, center=element_rect.center)
             screen.blit(text, text_rect)
             
             # Stack level indicator
-            level_text = self.font_small.render(f"[{len(self.stack) - i - 1}]", True, GRAY)
+            level_text = render_text(self.font_small, f"[{len(model.stack) - i - 1}]", True, GRAY)
             screen.blit(level_text, (stack_x - 30, y + cell_height // 2 - 8))
         
         # Stack label with animation
-        stack_label_y = stack_y + 50 + 5 * pygame.math.Vector2(1, 0).rotate(current_time / 800).y
-        stack_label = self.font_large.render("STACK", True, PURPLE)
-        label_rect = stack_label.get_rect(center=(stack_x + cell_width // 2, int(stack_label_y)))
-        screen.blit(stack_label, label_rect)
+        stack_label_y = stack_y + 50 + 5 * animation_clock.sin("stack_label_bob")
+        stack_label = render_text(self.font_large, "STACK", True, PURPLE)
+        label_rect = screen.rect_of(stack_label, center=(stack_x + cell_width // 2, int(stack_label_y)))
+        self.mark_dirty(screen.blit(stack_label, label_rect))
         
         # LIFO indicator
-        lifo_text = self.font_small.render("(Last In, First Out)", True, GRAY)
-        lifo_rect = lifo_text.get_rect(center=(stack_x + cell_width // 2, int(stack_label_y) + 25))
-        screen.blit(lifo_text, lifo_rect)
+        lifo_text = render_text(self.font_small, "(Last In, First Out)", True, GRAY)
+        lifo_rect = screen.rect_of(lifo_text, center=(stack_x + cell_width // 2, int(stack_label_y) + 25))
+        self.mark_dirty(screen.blit(lifo_text, lifo_rect))
         
         # Enhanced operations history
         ops_rect = pygame.Rect(50, 320, 400, 150)
-        pygame.draw.rect(screen, (0, 0, 30), ops_rect)
-        pygame.draw.rect(screen, BLUE, ops_rect, 2)
+        screen.rect((0, 0, 30), ops_rect)
+        screen.rect(BLUE, ops_rect, 2)
         
-        ops_title = self.font_medium.render("RECENT OPERATIONS:", True, BLUE)
+        ops_title = render_text(self.font_medium, "RECENT OPERATIONS:", True, BLUE)
         screen.blit(ops_title, (70, 330))
         
-        for i, op in enumerate(self.operations[-6:]):
-            op_color = YELLOW if "PUSH" in op else ORANGE
-            op_surface = self.font_small.render(f"• {op}", True, op_color)
+        shown = len(model.operations) - self.VISIBLE_OPERATIONS
+        for i, (op, value) in enumerate(islice(model.operations, max(0, shown), None)):
+            op_color = YELLOW if op == "PUSH" else ORANGE
+            op_surface = render_text(self.font_small, f"• {op} {value}", True, op_color)
             screen.blit(op_surface, (70, 355 + i * 20))
         
         # Progress indicator
-        progress = (len(self.sequence_matches) / len(self.target_sequence)) * 100
-        progress_text = f"Progress: {progress:.0f}% ({len(self.sequence_matches)}/{len(self.target_sequence)} targets matched)"
-        progress_surface = self.font_small.render(progress_text, True, WHITE)
+        progress = (model.current_target_index / len(model.target_sequence)) * 100
+        progress_text = f"Progress: {progress:.0f}% ({model.current_target_index}/{len(model.target_sequence)} targets matched)"
+        progress_surface = render_text(self.font_small, progress_text, True, WHITE)
         screen.blit(progress_surface, (600, 300))
         
         # Show completion requirement
-        if len(self.sequence_matches) < len(self.target_sequence):
+        if model.current_target_index < len(model.target_sequence):
             req_text = "Complete the ENTIRE sequence to win!"
-            req_surface = self.font_small.render(req_text, True, YELLOW)
+            req_surface = render_text(self.font_small, req_text, True, YELLOW)
             screen.blit(req_surface, (600, 320))
 
+@register_level(3, "Queue Management", time_limit=45, difficulty="Easy")
 class QueueLevel(BaseLevel):
     """Level 3: Queue Management - Process customers in order"""
-    def __init__(self):
-        super().__init__(45)  # 45 seconds
-        self.queue = []
-        self.processed = []
-        self.customer_id = 1
-        self.target_processed = 10
-        self.spawn_timer = pygame.time.get_ticks()  # Initialize with current time
-        self.spawn_interval = 2000  # milliseconds
+    model_class = QueueModel
+    # Customer boxes that fit on the queue track
+    VISIBLE_SLOTS = 10
+    
+    def __init__(self, rush_hour=False, model=None, seed=None):
+        # Time limit from the registry
+        super().__init__(model or self.model_class(self.level_info.time_limit, rush_hour, seed))
+        # Position of the first customer shown on the track
+        self.scroll = 0
         
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_SPACE:
-                self.process_customer()
+                self.model.process_customer()
             elif event.key == pygame.K_a:
-                self.add_customer()
-    
-    def add_customer(self):
-        if len(self.queue) < 15:  # Limit queue size to prevent overflow
-            self.queue.append(self.customer_id)
-            self.customer_id += 1
-    
-    def process_customer(self):
-        if self.queue:
-            customer = self.queue.pop(0)  # FIFO
-            self.processed.append(customer)
-            self.score += 25
+                self.model.add_customer()
+            elif event.key == pygame.K_h:
+                self.model.start_rush_hour()
+            elif event.key == pygame.K_RIGHT:
+                self.scroll_to(self.scroll + 1)
+            elif event.key == pygame.K_LEFT:
+                self.scroll_to(self.scroll - 1)
+            elif event.key == pygame.K_PAGEDOWN:
+                self.scroll_to(self.scroll + self.VISIBLE_SLOTS)
+            elif event.key == pygame.K_PAGEUP:
+                self.scroll_to(self.scroll - self.VISIBLE_SLOTS)
+            elif event.key == pygame.K_HOME:
+                self.scroll_to(0)
+            elif event.key == pygame.K_END:
+                self.scroll_to(len(self.model.queue))
     
-    def update(self):
-        try:
-            # Auto-spawn customers
-            current_time = pygame.time.get_ticks()
-            if current_time - self.spawn_timer > self.spawn_interval:
-                self.add_customer()
-                self.spawn_timer = current_time
-            
-            if self.is_time_up():
-                return "failed"
-            if len(self.processed) >= self.target_processed:
-                return "completed"
-            return "playing"
-        except Exception as e:
-            print(f"QueueLevel update error: {e}")
-            return "failed"
+    def scroll_to(self, position):
+        """Scroll the track, keeping a full window of customers in view"""
+        self.scroll = max(0, min(position, len(self.model.queue) - self.VISIBLE_SLOTS))
     
     def draw(self, screen):
+        model = self.model
         screen.fill(BLACK)
         self.draw_hud(screen)
         
-        # Animated background
-        current_time = pygame.time.get_ticks()
-        
         # Moving queue lines
+        background_time = self.background_ticks()
         for i in range(10):
             y = 200 + i * 50
-            x_offset = (current_time // 20 + i * 10) % 100
-            pygame.draw.line(screen, (20, 40, 20), (x_offset, y), (x_offset + 50, y), 1)
+            x_offset = (background_time // 20 + i * 10) % 100
+            screen.line((20, 40, 20), (x_offset, y), (x_offset + 50, y), 1)
         
         # Enhanced instructions
         inst_rect = pygame.Rect(40, 110, 944, 100)
-        pygame.draw.rect(screen, (0, 40, 40), inst_rect)
-        pygame.draw.rect(screen, CYAN, inst_rect, 2)
+        screen.rect((0, 40, 40), inst_rect)
+        screen.rect(CYAN, inst_rect, 2)
         
-        inst_text = f"🎯 GOAL: Process {self.target_processed} customers using FIFO (First In, First Out) order!"
-        inst_surface = self.font_medium.render(inst_text, True, WHITE)
+        inst_text = f"🎯 GOAL: Process {model.target_processed} customers using FIFO (First In, First Out) order!"
+        inst_surface = render_text(self.font_medium, inst_text, True, WHITE)
         screen.blit(inst_surface, (60, 130))
         
         inst_text2 = "📋 CONTROLS: Press 'A' to ADD customer to queue | Press 'SPACE' to PROCESS next customer"
-        inst_surface2 = self.font_small.render(inst_text2, True, YELLOW)
+        inst_surface2 = render_text(self.font_small, inst_text2, True, YELLOW)
         screen.blit(inst_surface2, (60, 155))
         
         inst_text3 = "💡 TIP: Customers are processed in the order they arrive (first come, first served)"
-        inst_surface3 = self.font_small.render(inst_text3, True, CYAN)
+        inst_surface3 = render_text(self.font_small, inst_text3, True, CYAN)
         screen.blit(inst_surface3, (60, 175))
         
         # Queue visualization with 3D effect
@@ -557,8 +534,8 @@ class QueueLevel(BaseLevel):
         
         # Queue background track
         track_rect = pygame.Rect(queue_start_x - 20, queue_y - 10, 800, 70)
-        pygame.draw.rect(screen, (20, 20, 40), track_rect)
-        pygame.draw.rect(screen, BLUE, track_rect, 2)
+        screen.rect((20, 20, 40), track_rect)
+        screen.rect(BLUE, track_rect, 2)
         
         # Queue direction arrow
         arrow_points = [
@@ -568,356 +545,345 @@ class QueueLevel(BaseLevel):
             (queue_start_x + 750, queue_y + 25),
             (queue_start_x + 740, queue_y + 35)
         ]
-        pygame.draw.lines(screen, YELLOW, False, arrow_points, 2)
-        
-        # Draw queue elements
-        for i, customer in enumerate(self.queue):
-            x = queue_start_x + i * 80
-            
-            # Customer shadow
-            shadow_rect = pygame.Rect(x + 3, queue_y + 3, 70, 50)
-            pygame.draw.rect(screen, (20, 20, 20), shadow_rect)
-            
-            # Customer box
+        screen.lines(YELLOW, False, arrow_points, 2)
+        
+        # Draw only the customers in the visible window of the queue (kept full as customers leave)
+        atlas = get_sprite_atlas()
+        self.scroll_to(self.scroll)
+        visible = model.queue.window(self.scroll, self.VISIBLE_SLOTS)
+        for slot, customer in enumerate(visible):
+            i = self.scroll + slot
+            x = queue_start_x + slot * 80
             customer_rect = pygame.Rect(x, queue_y, 70, 50)
             
             # Color based on position
             if i == 0:  # Next to be processed
-                bg_color = (0, 100, 0)
-                border_color = GREEN
-                # Pulsing effect
-                pulse = int(20 + 30 * abs(pygame.math.Vector2(1, 0).rotate(current_time / 200).x))
+                # Pulsing fill under the customer box frame
+                pulse = int(20 + 30 * abs(animation_clock.cos("queue_front_pulse")))
                 bg_color = (max(0, pulse), max(100, 100 + pulse), max(0, pulse))
+                screen.rect(bg_color, customer_rect)
+                atlas.draw(screen, "queue_customer_front", customer_rect.topleft)
+                self.mark_dirty(customer_rect)
             else:
-                bg_color = (0, 50, 100)
-                border_color = BLUE
-            
-            pygame.draw.rect(screen, bg_color, customer_rect)
-            pygame.draw.rect(screen, border_color, customer_rect, 3)
-            
-            # Highlight
-            highlight_rect = pygame.Rect(x + 2, queue_y + 2, 66, 15)
-            pygame.draw.rect(screen, (255, 255, 255, 30), highlight_rect)
+                atlas.draw(screen, "queue_customer", customer_rect.topleft)
             
             # Customer ID
-            text = self.font_medium.render(str(customer), True, WHITE)
-            text_rect = text.get_rect(center=customer_rect.center)
+            text = render_text(self.font_medium, str(customer), True, WHITE)
+            text_rect = screen.rect_of(text, center=customer_rect.center)
             screen.blit(text, text_rect)
             
             # Position indicator
-            pos_text = self.font_small.render(f"#{i+1}", True, GRAY)
+            pos_text = render_text(self.font_small, f"#{i+1}", True, GRAY)
             screen.blit(pos_text, (x + 5, queue_y - 20))
         
         # Queue labels
-        queue_label = self.font_large.render("QUEUE (FIFO)", True, BLUE)
+        queue_label = render_text(self.font_large, "QUEUE (FIFO)", True, BLUE)
         screen.blit(queue_label, (queue_start_x, 200))
         
-        fifo_desc = self.font_small.render("First In, First Out", True, GRAY)
+        fifo_desc = render_text(self.font_small, "First In, First Out", True, GRAY)
         screen.blit(fifo_desc, (queue_start_x + 200, 205))
         
         # Processing area
         process_rect = pygame.Rect(50, 350, 400, 120)
-        pygame.draw.rect(screen, (0, 50, 0), process_rect)
-        pygame.draw.rect(screen, GREEN, process_rect, 3)
+        screen.rect((0, 50, 0), process_rect)
+        screen.rect(GREEN, process_rect, 3)
         
-        process_title = self.font_medium.render("PROCESSING STATUS", True, GREEN)
+        process_title = render_text(self.font_medium, "PROCESSING STATUS", True, GREEN)
         screen.blit(process_title, (70, 365))
         
-        processed_text = f"Processed: {len(self.processed)}/{self.target_processed}"
-        processed_surface = self.font_medium.render(processed_text, True, WHITE)
+        processed_text = f"Processed: {len(model.processed)}/{model.target_processed}"
+        processed_surface = render_text(self.font_medium, processed_text, True, WHITE)
         screen.blit(processed_surface, (70, 395))
         
         # Progress bar
-        progress = len(self.processed) / self.target_processed
+        progress = min(1.0, len(model.processed) / model.target_processed)
         bar_width = 300
         bar_height = 20
         bar_x, bar_y = 70, 420
         
-        pygame.draw.rect(screen, GRAY, (bar_x, bar_y, bar_width, bar_height))
-        pygame.draw.rect(screen, GREEN, (bar_x, bar_y, int(bar_width * progress), bar_height))
-        pygame.draw.rect(screen, WHITE, (bar_x, bar_y, bar_width, bar_height), 2)
+        screen.rect(GRAY, (bar_x, bar_y, bar_width, bar_height))
+        screen.rect(GREEN, (bar_x, bar_y, int(bar_width * progress), bar_height))
+        screen.rect(WHITE, (bar_x, bar_y, bar_width, bar_height), 2)
         
         # Recently processed customers
         recent_rect = pygame.Rect(500, 350, 450, 120)
-        pygame.draw.rect(screen, (30, 30, 0), recent_rect)
-        pygame.draw.rect(screen, YELLOW, recent_rect, 2)
+        screen.rect((30, 30, 0), recent_rect)
+        screen.rect(YELLOW, recent_rect, 2)
         
-        recent_title = self.font_medium.render("RECENTLY PROCESSED", True, YELLOW)
+        recent_title = render_text(self.font_medium, "RECENTLY PROCESSED", True, YELLOW)
         screen.blit(recent_title, (520, 365))
         
         # Show last processed customers
-        for i, customer in enumerate(self.processed[-8:]):
+        for i, customer in enumerate(model.processed.recent):
             x = 520 + (i % 4) * 100
             y = 395 + (i // 4) * 35
             
             # Processed customer indicator
-            pygame.draw.circle(screen, GREEN, (x + 20, y + 15), 15)
-            pygame.draw.circle(screen, WHITE, (x + 20, y + 15), 15, 2)
+            atlas.draw(screen, "processed_customer", (x + 20, y + 15))
             
-            text = self.font_small.render(str(customer), True, BLACK)
-            text_rect = text.get_rect(center=(x + 20, y + 15))
+            text = render_text(self.font_small, str(customer), True, BLACK)
+            text_rect = screen.rect_of(text, center=(x + 20, y + 15))
             screen.blit(text, text_rect)
         
         # Queue statistics
-        stats_text = f"Queue Length: {len(self.queue)} | Next Customer ID: {self.customer_id}"
-        stats_surface = self.font_small.render(stats_text, True, WHITE)
+        stats_text = f"Queue Length: {len(model.queue):,} | Next Customer ID: {model.customer_id:,}"
+        stats_surface = render_text(self.font_small, stats_text, True, WHITE)
         screen.blit(stats_surface, (100, 500))
+        
+        # Rush hour status and scrolling through long queues
+        if model.rush_hour:
+            mode_text = f"RUSH HOUR! Up to {model.queue.capacity:,} customers"
+            mode_color = ORANGE
+        else:
+            mode_text = "Press 'H' to start RUSH HOUR"
+            mode_color = GRAY
+        mode_surface = render_text(self.font_small, mode_text, True, mode_color)
+        screen.blit(mode_surface, (100, 520))
+        if len(model.queue) > self.VISIBLE_SLOTS:
+            last_shown = self.scroll + len(visible)
+            window_text = (f"Showing #{self.scroll + 1:,}-#{last_shown:,} of {len(model.queue):,}"
+                           " | LEFT/RIGHT, PAGE UP/DOWN, HOME/END to scroll")
+            window_surface = render_text(self.font_small, window_text, True, CYAN)
+            screen.blit(window_surface, (100, 540))
 
+@register_level(4, "Binary Search", time_limit=30, difficulty="Medium")
 class BinarySearchLevel(BaseLevel):
     """Level 4: Binary Search - Find target efficiently"""
-    def __init__(self):
-        super().__init__(30)  # 30 seconds
-        self.array = sorted(random.sample(range(1, 101), 15))  # 15 unique numbers from 1-100
-        self.target = random.choice(self.array)
-        self.left = 0
-        self.right = len(self.array) - 1
-        self.mid = (self.left + self.right) // 2
-        self.comparisons = 0
-        self.max_comparisons = 4  # log2(15) ≈ 4
-        self.found = False
+    model_class = BinarySearchModel
+    # Cells shown around the middle of the search
+    VISIBLE_CELLS = 15
+    # Each zoom out shows every ZOOM_FACTOR times fewer indices (large arrays only)
+    ZOOM_FACTOR = 10
+    
+    def __init__(self, size=BinarySearchModel.SIZE, model=None, seed=None, puzzle=None):
+        # Time limit from the registry
+        super().__init__(model or self.model_class(self.level_info.time_limit, size, seed, puzzle))
+        # Zoom level: position in zoom_strides(), 0 shows every index
+        self.zoom = 0
         
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_LEFT:  # Target is smaller
-                self.search_left()
+                self.model.search_left()
             elif event.key == pygame.K_RIGHT:  # Target is larger
-                self.search_right()
+                self.model.search_right()
             elif event.key == pygame.K_SPACE:  # Found it
-                self.check_found()
-    
-    def search_left(self):
-        if not self.found and self.left <= self.right:
-            self.comparisons += 1
-            if self.array[self.mid] > self.target:
-                self.right = self.mid - 1
-                self.score += 20
-            else:
-                self.score = max(0, self.score - 10)
-            self.update_mid()
-    
-    def search_right(self):
-        if not self.found and self.left <= self.right:
-            self.comparisons += 1
-            if self.array[self.mid] < self.target:
-                self.left = self.mid + 1
-                self.score += 20
-            else:
-                self.score = max(0, self.score - 10)
-            self.update_mid()
+                self.model.check_found()
+            elif event.key == pygame.K_l:
+                self.model.start_large_search()
+            elif event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+                self.set_zoom(self.zoom + 1)
+            elif event.key in (pygame.K_EQUALS, pygame.K_PLUS, pygame.K_KP_PLUS):
+                self.set_zoom(self.zoom - 1)
     
-    def check_found(self):
-        if self.array[self.mid] == self.target:
-            self.found = True
-            self.score += 100
-        else:
-            self.score = max(0, self.score - 20)
+    def zoom_strides(self):
+        """Index step between neighbouring cells at each zoom level, up to the whole array"""
+        count = min(len(self.model.array), self.VISIBLE_CELLS)
+        widest = max(1, (len(self.model.array) - 1) // count)
+        strides = [1]
+        while strides[-1] * self.ZOOM_FACTOR < widest:
+            strides.append(strides[-1] * self.ZOOM_FACTOR)
+        if strides[-1] < widest:
+            strides.append(widest)
+        return strides
     
-    def update_mid(self):
-        if self.left <= self.right:
-            self.mid = (self.left + self.right) // 2
+    def set_zoom(self, zoom):
+        self.zoom = max(0, min(zoom, len(self.zoom_strides()) - 1))
+        self.request_full_redraw()
     
-    def update(self):
-        if self.is_time_up() or self.comparisons >= self.max_comparisons:
-            return "failed" if not self.found else "completed"
-        if self.found:
-            return "completed"
-        return "playing"
+    def stride(self):
+        strides = self.zoom_strides()
+        return strides[min(self.zoom, len(strides) - 1)]
     
     def draw(self, screen):
+        model = self.model
         screen.fill(BLACK)
         self.draw_hud(screen)
         
-        # Animated background
-        current_time = pygame.time.get_ticks()
-        
         # Binary tree-like background pattern
+        background_time = self.background_ticks()
         for level in range(4):
             y = 150 + level * 100
             nodes = 2 ** level
             for i in range(nodes):
                 x = SCREEN_WIDTH // 2 + (i - nodes // 2) * (200 // (level + 1))
-                alpha = int(30 + 20 * pygame.math.Vector2(1, 0).rotate(current_time / 1000 + level + i).x)
+                alpha = int(30 + 20 * cos_deg(background_time / 1000 + level + i))
                 color = (alpha, alpha // 2, 0)
-                pygame.draw.circle(screen, color, (x, y), 3)
+                screen.circle(color, (x, y), 3)
         
         # Enhanced instructions
         inst_rect = pygame.Rect(40, 110, 944, 100)
-        pygame.draw.rect(screen, (50, 25, 0), inst_rect)
-        pygame.draw.rect(screen, ORANGE, inst_rect, 2)
+        screen.rect((50, 25, 0), inst_rect)
+        screen.rect(ORANGE, inst_rect, 2)
         
-        inst_text = f"🎯 GOAL: Find {self.target} using binary search! Divide and conquer!"
-        inst_surface = self.font_medium.render(inst_text, True, WHITE)
+        inst_text = f"🎯 GOAL: Find {model.target} using binary search! Divide and conquer!"
+        inst_surface = render_text(self.font_medium, inst_text, True, WHITE)
         screen.blit(inst_surface, (60, 130))
         
         inst_text2 = "📋 CONTROLS: LEFT ARROW = target is smaller | RIGHT ARROW = target is larger | SPACE = found it!"
-        inst_surface2 = self.font_small.render(inst_text2, True, YELLOW)
+        inst_surface2 = render_text(self.font_small, inst_text2, True, YELLOW)
         screen.blit(inst_surface2, (60, 155))
         
-        inst_text3 = f"💡 TIP: Compare {self.target} with middle element ({self.array[self.mid]}) and eliminate half the array"
-        inst_surface3 = self.font_small.render(inst_text3, True, CYAN)
+        inst_text3 = f"💡 TIP: Compare {model.target} with middle element ({model.array[model.mid]}) and eliminate half the array"
+        inst_surface3 = render_text(self.font_small, inst_text3, True, CYAN)
         screen.blit(inst_surface3, (60, 180))
         
         inst_text2 = "LEFT: target smaller | RIGHT: target larger | SPACE: found it!"
-        inst_surface2 = self.font_medium.render(inst_text2, True, YELLOW)
+        inst_surface2 = render_text(self.font_medium, inst_text2, True, YELLOW)
         screen.blit(inst_surface2, (60, 155))
         
         # Target display with animation
         target_rect = pygame.Rect(50, 210, 200, 60)
-        glow = int(50 + 30 * pygame.math.Vector2(1, 0).rotate(current_time / 400).x)
+        glow = int(50 + 30 * animation_clock.cos("search_target_glow"))
         target_bg = (glow, glow // 2, 0)
-        pygame.draw.rect(screen, target_bg, target_rect)
-        pygame.draw.rect(screen, ORANGE, target_rect, 3)
+        screen.rect(target_bg, target_rect)
+        self.mark_dirty(target_rect)
+        screen.rect(ORANGE, target_rect, 3)
         
-        target_label = self.font_small.render("TARGET:", True, ORANGE)
+        target_label = render_text(self.font_small, "TARGET:", True, ORANGE)
         screen.blit(target_label, (70, 225))
         
-        target_value = self.font_large.render(str(self.target), True, WHITE)
-        target_value_rect = target_value.get_rect(center=(150, 250))
+        target_value = render_text(self.font_large, str(model.target), True, WHITE)
+        target_value_rect = screen.rect_of(target_value, center=(150, 250))
         screen.blit(target_value, target_value_rect)
         
-        # Enhanced array visualization
+        # Enhanced array visualization: a window of cells around the middle,
+        # every stride-th index when zoomed out
         start_x = 50
         start_y = 300
         cell_width = 55
         cell_height = 50
+        first, count, stride = self.visible_window()
         
         # Array background
         array_bg = pygame.Rect(start_x - 10, start_y - 10, 
-                              len(self.array) * (cell_width + 5) + 15, cell_height + 20)
-        pygame.draw.rect(screen, (20, 20, 30), array_bg)
-        pygame.draw.rect(screen, WHITE, array_bg, 2)
-        
-        for i, value in enumerate(self.array):
-            x = start_x + i * (cell_width + 5)
+                              count * (cell_width + 5) + 15, cell_height + 20)
+        screen.rect((20, 20, 30), array_bg)
+        screen.rect(WHITE, array_bg, 2)
+        
+        atlas = get_sprite_atlas()
+        for column in range(count):
+            i = first + column * stride
+            value = model.array[i]
+            x = start_x + column * (cell_width + 5)
             y = start_y
             
-            # Cell shadow
-            shadow_rect = pygame.Rect(x + 2, y + 2, cell_width, cell_height)
-            pygame.draw.rect(screen, (20, 20, 20), shadow_rect)
-            
-            # Main cell
-            cell_rect = pygame.Rect(x, y, cell_width, cell_height)
-            
-            # Color coding with enhanced effects
-            if i < self.left or i > self.right:
+            # Color coding with enhanced effects (cells come from the sprite atlas)
+            if i < model.left or i > model.right:
                 # Out of search range
-                bg_color = (30, 30, 30)
-                border_color = GRAY
+                atlas.draw(screen, "search_cell_out", (x, y))
                 text_color = GRAY
-            elif i == self.mid:
-                # Current middle with pulsing effect
-                pulse = int(100 + 50 * pygame.math.Vector2(1, 0).rotate(current_time / 200).x)
-                bg_color = (pulse, pulse, 0)
-                border_color = YELLOW
+            elif i == model.mid:
+                # Current middle with pulsing fill under a glowing frame
+                cell_rect = pygame.Rect(x, y, cell_width, cell_height)
+                pulse = int(100 + 50 * animation_clock.cos("search_mid_pulse"))
+                screen.rect((pulse, pulse, 0), cell_rect)
+                atlas.draw(screen, "search_cell_mid", (x, y))
+                self.mark_dirty(cell_rect.inflate(10, 10))
                 text_color = BLACK
-                
-                # Add glow effect around middle
-                for glow_size in range(5, 0, -1):
-                    glow_rect = pygame.Rect(x - glow_size, y - glow_size, 
-                                          cell_width + 2*glow_size, cell_height + 2*glow_size)
-                    glow_alpha = 50 - glow_size * 10
-                    glow_color = (glow_alpha, glow_alpha, 0)
-                    pygame.draw.rect(screen, glow_color, glow_rect, 1)
             else:
                 # In search range
-                bg_color = (0, 50, 100)
-                border_color = BLUE
+                atlas.draw(screen, "search_cell", (x, y))
                 text_color = WHITE
             
-            pygame.draw.rect(screen, bg_color, cell_rect)
-            pygame.draw.rect(screen, border_color, cell_rect, 3)
-            
-            # Highlight effect
-            if i >= self.left and i <= self.right:
-                highlight_rect = pygame.Rect(x + 2, y + 2, cell_width - 4, cell_height // 3)
-                pygame.draw.rect(screen, (255, 255, 255, 40), highlight_rect)
-            
-            # Value with shadow
-            if text_color != BLACK:
-                text_shadow = self.font_medium.render(str(value), True, BLACK)
+            # Value with shadow (long values of a large array in the small font, unshadowed)
+            value_font = self.font_medium if value < 10000 else self.font_small
+            if text_color != BLACK and value_font is self.font_medium:
+                text_shadow = render_text(value_font, str(value), True, BLACK)
                 screen.blit(text_shadow, (x + cell_width//2 - 8, y + cell_height//2 - 6))
             
-            text = self.font_medium.render(str(value), True, text_color)
-            text_rect = text.get_rect(center=(x + cell_width//2, y + cell_height//2))
+            text = render_text(value_font, str(value), True, text_color)
+            text_rect = screen.rect_of(text, center=(x + cell_width//2, y + cell_height//2))
             screen.blit(text, text_rect)
             
             # Index label
-            index_color = YELLOW if i == self.mid else WHITE if self.left <= i <= self.right else GRAY
-            index_text = self.font_small.render(str(i), True, index_color)
-            index_rect = index_text.get_rect(center=(x + cell_width//2, y - 15))
+            index_color = YELLOW if i == model.mid else WHITE if model.left <= i <= model.right else GRAY
+            index_text = render_text(self.font_small, str(i), True, index_color)
+            index_rect = screen.rect_of(index_text, center=(x + cell_width//2, y - 15))
             screen.blit(index_text, index_rect)
         
-        # Search range indicators
-        if self.left <= self.right:
-            # Left boundary
-            left_x = start_x + self.left * (cell_width + 5) - 5
-            pygame.draw.line(screen, GREEN, (left_x, start_y - 30), (left_x, start_y + cell_height + 10), 3)
-            left_label = self.font_small.render("LEFT", True, GREEN)
+        # Search range indicators; a boundary outside the window is pinned to its edge
+        if model.left <= model.right:
+            column_width = cell_width + 5
+            window_left = start_x - 5
+            window_right = start_x + count * column_width
+            
+            # Left boundary (between cells when zoomed out)
+            left_x = start_x + (model.left - first) * column_width // stride - 5
+            left_text = "<LEFT" if left_x < window_left else "LEFT"
+            left_x = max(window_left, min(left_x, window_right))
+            screen.line(GREEN, (left_x, start_y - 30), (left_x, start_y + cell_height + 10), 3)
+            left_label = render_text(self.font_small, left_text, True, GREEN)
             screen.blit(left_label, (left_x - 15, start_y - 45))
             
             # Right boundary
-            right_x = start_x + self.right * (cell_width + 5) + cell_width + 5
-            pygame.draw.line(screen, RED, (right_x, start_y - 30), (right_x, start_y + cell_height + 10), 3)
-            right_label = self.font_small.render("RIGHT", True, RED)
+            right_x = start_x + (model.right - first) * column_width // stride + column_width
+            right_text = "RIGHT>" if right_x > window_right else "RIGHT"
+            right_x = max(window_left, min(right_x, window_right))
+            screen.line(RED, (right_x, start_y - 30), (right_x, start_y + cell_height + 10), 3)
+            right_label = render_text(self.font_small, right_text, True, RED)
             screen.blit(right_label, (right_x - 20, start_y - 45))
             
-            # Middle indicator
-            mid_x = start_x + self.mid * (cell_width + 5) + cell_width // 2
-            pygame.draw.polygon(screen, YELLOW, [
+            # Middle indicator (the middle is always one of the cells shown)
+            mid_x = start_x + (model.mid - first) // stride * column_width + cell_width // 2
+            screen.polygon(YELLOW, [
                 (mid_x - 10, start_y + cell_height + 15),
                 (mid_x + 10, start_y + cell_height + 15),
                 (mid_x, start_y + cell_height + 5)
             ])
-            mid_label = self.font_small.render("MID", True, YELLOW)
-            mid_rect = mid_label.get_rect(center=(mid_x, start_y + cell_height + 30))
+            mid_label = render_text(self.font_small, "MID", True, YELLOW)
+            mid_rect = screen.rect_of(mid_label, center=(mid_x, start_y + cell_height + 30))
             screen.blit(mid_label, mid_rect)
         
+        if len(model.array) > count:
+            self.draw_overview(screen, first, count, stride)
+        
         # Enhanced search info panel
         info_rect = pygame.Rect(50, 400, 600, 120)
-        pygame.draw.rect(screen, (0, 30, 30), info_rect)
-        pygame.draw.rect(screen, CYAN, info_rect, 2)
+        screen.rect((0, 30, 30), info_rect)
+        screen.rect(CYAN, info_rect, 2)
         
-        info_title = self.font_medium.render("BINARY SEARCH STATUS", True, CYAN)
+        info_title = render_text(self.font_medium, "BINARY SEARCH STATUS", True, CYAN)
         screen.blit(info_title, (70, 415))
         
-        if self.left <= self.right:
-            search_info = f"Search Range: [{self.left}, {self.right}] | Middle Index: {self.mid} | Middle Value: {self.array[self.mid]}"
-            search_surface = self.font_small.render(search_info, True, WHITE)
+        if model.left <= model.right:
+            search_info = f"Search Range: [{model.left}, {model.right}] | Middle Index: {model.mid} | Middle Value: {model.array[model.mid]}"
+            search_surface = render_text(self.font_small, search_info, True, WHITE)
             screen.blit(search_surface, (70, 445))
             
             # Comparison hint
-            if self.array[self.mid] < self.target:
-                hint = f"{self.array[self.mid]} < {self.target} → Search RIGHT half"
+            if model.array[model.mid] < model.target:
+                hint = f"{model.array[model.mid]} < {model.target} → Search RIGHT half"
                 hint_color = GREEN
-            elif self.array[self.mid] > self.target:
-                hint = f"{self.array[self.mid]} > {self.target} → Search LEFT half"
+            elif model.array[model.mid] > model.target:
+                hint = f"{model.array[model.mid]} > {model.target} → Search LEFT half"
                 hint_color = RED
             else:
-                hint = f"{self.array[self.mid]} = {self.target} → FOUND IT!"
+                hint = f"{model.array[model.mid]} = {model.target} → FOUND IT!"
                 hint_color = YELLOW
             
-            hint_surface = self.font_small.render(hint, True, hint_color)
+            hint_surface = render_text(self.font_small, hint, True, hint_color)
             screen.blit(hint_surface, (70, 470))
         
         # Comparisons counter with visual indicator
         comp_rect = pygame.Rect(700, 400, 250, 120)
-        pygame.draw.rect(screen, (30, 0, 30), comp_rect)
-        pygame.draw.rect(screen, PURPLE, comp_rect, 2)
+        screen.rect((30, 0, 30), comp_rect)
+        screen.rect(PURPLE, comp_rect, 2)
         
-        comp_title = self.font_medium.render("EFFICIENCY", True, PURPLE)
+        comp_title = render_text(self.font_medium, "EFFICIENCY", True, PURPLE)
         screen.blit(comp_title, (720, 415))
         
-        comparisons_text = f"Comparisons: {self.comparisons}/{self.max_comparisons}"
-        comp_surface = self.font_small.render(comparisons_text, True, WHITE)
+        comparisons_text = f"Comparisons: {model.comparisons}/{model.max_comparisons}"
+        comp_surface = render_text(self.font_small, comparisons_text, True, WHITE)
         screen.blit(comp_surface, (720, 445))
         
         # Efficiency bar
-        efficiency = 1 - (self.comparisons / self.max_comparisons)
+        efficiency = 1 - (model.comparisons / model.max_comparisons)
         bar_width = 200
         bar_height = 15
         bar_x, bar_y = 720, 470
         
-        pygame.draw.rect(screen, GRAY, (bar_x, bar_y, bar_width, bar_height))
+        screen.rect(GRAY, (bar_x, bar_y, bar_width, bar_height))
         
         if efficiency > 0.7:
             bar_color = GREEN
@@ -926,22 +892,62 @@ class BinarySearchLevel(BaseLevel):
         else:
             bar_color = RED
             
-        pygame.draw.rect(screen, bar_color, (bar_x, bar_y, int(bar_width * efficiency), bar_height))
-        pygame.draw.rect(screen, WHITE, (bar_x, bar_y, bar_width, bar_height), 1)
+        screen.rect(bar_color, (bar_x, bar_y, int(bar_width * efficiency), bar_height))
+        screen.rect(WHITE, (bar_x, bar_y, bar_width, bar_height), 1)
         
         efficiency_text = f"Efficiency: {efficiency*100:.0f}%"
-        eff_surface = self.font_small.render(efficiency_text, True, WHITE)
+        eff_surface = render_text(self.font_small, efficiency_text, True, WHITE)
         screen.blit(eff_surface, (720, 495))
 
+    def visible_window(self):
+        """First index, number of cells and index stride shown
+
+        The middle is always one of the cells, centred where the array allows.
+        """
+        model = self.model
+        size = len(model.array)
+        count = min(size, self.VISIBLE_CELLS)
+        stride = self.stride()
+        # Column of the middle: centred, unless the window would run off either end
+        column = max(count - 1 - (size - 1 - model.mid) // stride, min(count // 2, model.mid // stride))
+        return model.mid - column * stride, count, stride
+    
+    def draw_overview(self, screen, first, count, stride=1):
+        """Whole array compressed into one bar: search range, visible window and middle"""
+        model = self.model
+        size = len(model.array)
+        bar = pygame.Rect(280, 215, 690, 14)
+        screen.rect((30, 30, 30), bar)
+        
+        def bar_x(index):
+            return bar.x + index * bar.width // size
+        
+        if model.left <= model.right:
+            range_x = bar_x(model.left)
+            screen.rect((0, 50, 100), (range_x, bar.y, max(1, bar_x(model.right + 1) - range_x), bar.height))
+        window_x = bar_x(first)
+        window_end = first + (count - 1) * stride + 1
+        screen.rect(WHITE, (window_x, bar.y - 2, max(3, bar_x(window_end) - window_x),
+                            bar.height + 4), 1)
+        mid_x = bar_x(model.mid)
+        screen.line(YELLOW, (mid_x, bar.y - 4), (mid_x, bar.bottom + 3), 2)
+        screen.rect(GRAY, bar, 1)
+        
+        remaining = max(0, model.right - model.left + 1)
+        caption = f"{size:,} values | {remaining:,} left in range [{model.left:,}, {model.right:,}]"
+        if len(self.zoom_strides()) > 1:
+            shown = "every value" if stride == 1 else f"every {stride:,}th value"
+            caption += f" | zoom: {shown} (-/+)"
+        screen.blit(render_text(self.font_small, caption, True, GRAY), (bar.x, bar.bottom + 4))
+
 def get_level_instance(level_num):
     """Factory function to create level instances"""
-    if level_num == 1:
-        return ArrayLevel()
-    elif level_num == 2:
-        return StackLevel()
-    elif level_num == 3:
-        return QueueLevel()
-    elif level_num == 4:
-        return BinarySearchLevel()
-    else:
-        raise ValueError(f"Level {level_num} not implemented yet!")
+    return level_registry.create(level_num)
+
+# Placeholders for future levels
+level_registry.placeholder(5, "Linked Lists", time_limit=40, difficulty="Medium")
+level_registry.placeholder(6, "Binary Trees", time_limit=50, difficulty="Medium")
+level_registry.placeholder(7, "Hash Tables", time_limit=35, difficulty="Medium")
+level_registry.placeholder(8, "Graph Traversal", time_limit=60, difficulty="Hard")
+level_registry.placeholder(9, "Dynamic Programming", time_limit=90, difficulty="Hard")
+level_registry.placeholder(10, "Sorting Algorithms", time_limit=45, difficulty="Medium")
@@ -0,0 +1,276 @@
+"""
+Array-backed particle effects for DSA Learning Adventure
+
+Particle state (position, velocity, colour and lifetime) lives in flat
+arrays that are updated in a few vectorized operations per frame, and every
+particle is stamped with a pre-rendered sprite through one Surface.blits()
+call. Positions are logical (canvas.py) and the sprites are drawn at the
+render scale. NumPy is used when it is installed; otherwise the same arrays are
+plain lists updated in a loop, which is slower but keeps pygame the only
+hard dependency.
+
+ParticleField animates a fixed set of decorative particles along
+parametric paths (the menu, background and game over effects).
+ParticleSystem simulates short-lived physics particles such as the level
+completion celebration.
+"""
+import math
+import random
+
+import pygame
+
+from canvas import get_render_scale
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without NumPy
+    np = None
+
+# Colour intensities are quantized to this many sprite shades
+SHADES = 32
+
+
+class ParticleSprites:
+    """Pre-rendered circle sprites for every (colour, radius, shade) of a palette
+
+    Palette entries are RGB multipliers in [0, 1]; shade scales them from
+    black up to full brightness. Radii are logical; the sprites are drawn at
+    the render scale.
+    """
+
+    def __init__(self, palette, max_radius=3, colorkey=(1, 2, 3)):
+        self.max_radius = max_radius
+        self.scale = get_render_scale()
+        # Pixel radius of each logical radius at that scale
+        self.offsets = [0] + [max(1, round(radius * self.scale)) for radius in range(1, max_radius + 1)]
+        # sprites[colour][radius][shade]; radius 0 is unused
+        self.sprites = [
+            [[]] + [[self.build_sprite(tint, radius, shade, colorkey) for shade in range(SHADES)]
+                    for radius in range(1, max_radius + 1)]
+            for tint in palette
+        ]
+
+    def build_sprite(self, tint, radius, shade, colorkey):
+        intensity = int(255 * shade / (SHADES - 1))
+        color = tuple(int(intensity * channel) for channel in tint)
+        radius = self.offsets[radius]
+        sprite = pygame.Surface((radius * 2 + 1, radius * 2 + 1))
+        sprite.fill(colorkey)
+        pygame.draw.circle(sprite, color, (radius, radius), radius)
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert()
+        sprite.set_colorkey(colorkey, pygame.RLEACCEL)
+        return sprite
+
+    def stamp(self, screen, xs, ys, colors, radii, shades):
+        """Blit one sprite per particle onto a Canvas; returns the logical bounding rect or None
+
+        xs and ys are already in the canvas's pixels, so the positions are
+        scaled once per array rather than once per blit.
+        """
+        sprites = self.sprites
+        offsets = self.offsets
+        surface = screen.surface
+        surface.blits([
+            (sprites[c][r][s], (x - offsets[r], y - offsets[r]))
+            for x, y, c, r, s in zip(xs, ys, colors, radii, shades)
+        ], False)
+        if not xs:
+            return None
+        reach = offsets[self.max_radius] + 1
+        left, top = min(xs) - reach, min(ys) - reach
+        bounds = pygame.Rect(left, top, max(xs) + reach - left, max(ys) + reach - top)
+        return screen.to_logical(bounds.clip(surface.get_rect()))
+
+
+class Channel:
+    """One animated attribute: base + drift * t + amplitude * wave(rate * t + phase_step * i)
+
+    ``base`` may be a single number or one value per particle. Rates are in
+    radians per millisecond, drift in units per millisecond.
+    """
+
+    WAVES = ("cos", "sin", "abs_cos", "none")
+
+    def __init__(self, base, amplitude=0.0, rate=0.0, phase_step=0.0,
+                 wave="cos", base_step=0.0, drift=0.0):
+        if wave not in self.WAVES:
+            raise ValueError(f"Unknown wave: {wave}")
+        self.base = base
+        self.amplitude = amplitude
+        self.rate = rate
+        self.phase_step = phase_step
+        self.wave = wave
+        self.base_step = base_step
+        self.drift = drift
+
+    def bases(self, count):
+        if isinstance(self.base, (int, float)):
+            return [self.base + self.base_step * i for i in range(count)]
+        return [b + self.base_step * i for i, b in enumerate(self.base)]
+
+
+class ParticleField:
+    """Fixed set of decorative particles moving along parametric paths"""
+
+    def __init__(self, count, x, y, radius, intensity, tint, wrap_width=None, max_radius=3):
+        self.count = count
+        self.channels = (x, y, radius, intensity)
+        self.wrap_width = wrap_width
+        self.sprites = ParticleSprites([tint], max_radius)
+        self.colors = [0] * count
+        self.max_radius = max_radius
+        self.bases = [channel.bases(count) for channel in self.channels]
+        self.phases = [[channel.phase_step * i for i in range(count)] for channel in self.channels]
+        if np is not None:
+            self.bases = [np.array(b, dtype=np.float64) for b in self.bases]
+            self.phases = [np.array(p, dtype=np.float64) for p in self.phases]
+
+    def evaluate(self, channel_index, ticks):
+        channel = self.channels[channel_index]
+        base = self.bases[channel_index]
+        phase = self.phases[channel_index]
+        offset = channel.drift * ticks
+        angle = channel.rate * ticks
+
+        if np is not None:
+            if channel.wave == "none":
+                return base + offset
+            if channel.wave == "sin":
+                wave = np.sin(phase + angle)
+            else:
+                wave = np.cos(phase + angle)
+                if channel.wave == "abs_cos":
+                    wave = np.abs(wave)
+            return base + offset + channel.amplitude * wave
+
+        if channel.wave == "none":
+            return [b + offset for b in base]
+        func = math.sin if channel.wave == "sin" else math.cos
+        absolute = channel.wave == "abs_cos"
+        amplitude = channel.amplitude
+        values = []
+        for b, p in zip(base, phase):
+            wave = func(p + angle)
+            values.append(b + offset + amplitude * (abs(wave) if absolute else wave))
+        return values
+
+    def draw(self, screen, ticks):
+        """Update every particle for this time and stamp it on a Canvas; returns the bounding rect"""
+        scale = screen.scale
+        xs = self.evaluate(0, ticks)
+        ys = self.evaluate(1, ticks)
+        radii = self.evaluate(2, ticks)
+        intensities = self.evaluate(3, ticks)
+
+        if np is not None:
+            if self.wrap_width:
+                xs = np.mod(xs, self.wrap_width)
+            xs = (xs * scale).astype(np.int32).tolist()
+            ys = (ys * scale).astype(np.int32).tolist()
+            radii = np.clip(radii.astype(np.int32), 1, self.max_radius).tolist()
+            shades = np.clip((intensities * (SHADES - 1) / 255).astype(np.int32), 0, SHADES - 1).tolist()
+        else:
+            if self.wrap_width:
+                xs = [x % self.wrap_width for x in xs]
+            xs = [int(x * scale) for x in xs]
+            ys = [int(y * scale) for y in ys]
+            radii = [min(self.max_radius, max(1, int(r))) for r in radii]
+            shades = [min(SHADES - 1, max(0, int(c * (SHADES - 1) / 255))) for c in intensities]
+
+        return self.sprites.stamp(screen, xs, ys, self.colors, radii, shades)
+
+
+class ParticleSystem:
+    """Short-lived physics particles with velocity, gravity, colour, lifetime and fade"""
+
+    FIELDS = ("x", "y", "vx", "vy", "age", "life", "color", "radius")
+    INT_FIELDS = ("color", "radius")
+
+    def __init__(self, palette, capacity=5000, gravity=0.0004, max_radius=3):
+        self.palette = palette
+        self.capacity = capacity
+        self.gravity = gravity  # pixels per ms^2
+        self.max_radius = max_radius
+        self.sprites = ParticleSprites(palette, max_radius)
+        self.last_ticks = None
+        self.clear()
+
+    def clear(self):
+        for name in self.FIELDS:
+            if np is None:
+                setattr(self, name, [])
+            else:
+                setattr(self, name, np.zeros(0, dtype=np.int32 if name in self.INT_FIELDS else np.float64))
+
+    def __len__(self):
+        return len(self.x)
+
+    def burst(self, count, x, y, speed=(0.05, 0.35), lifetime=(600, 1600), rng=random):
+        """Emit particles from (x, y) in all directions (speed in px/ms, lifetime in ms)"""
+        count = min(count, self.capacity - len(self))
+        if count <= 0:
+            return
+        if not len(self):
+            self.last_ticks = None
+        angles = [rng.uniform(0, 2 * math.pi) for _ in range(count)]
+        speeds = [rng.uniform(*speed) for _ in range(count)]
+        new = {
+            "x": [float(x)] * count,
+            "y": [float(y)] * count,
+            "vx": [s * math.cos(a) for s, a in zip(speeds, angles)],
+            "vy": [s * math.sin(a) for s, a in zip(speeds, angles)],
+            "age": [0.0] * count,
+            "life": [rng.uniform(*lifetime) for _ in range(count)],
+            "color": [rng.randrange(len(self.palette)) for _ in range(count)],
+            "radius": [rng.randint(1, self.max_radius) for _ in range(count)],
+        }
+        for name, values in new.items():
+            current = getattr(self, name)
+            if np is None:
+                current.extend(values)
+            else:
+                setattr(self, name, np.concatenate((current, np.array(values, dtype=current.dtype))))
+
+    def update(self, ticks):
+        """Advance the simulation to ticks (milliseconds) and drop expired particles"""
+        dt = 0 if self.last_ticks is None else min(100, ticks - self.last_ticks)
+        self.last_ticks = ticks
+        if not len(self) or dt <= 0:
+            return
+
+        if np is not None:
+            self.vy += self.gravity * dt
+            self.x += self.vx * dt
+            self.y += self.vy * dt
+            self.age += dt
+            alive = self.age < self.life
+            if not alive.all():
+                for name in self.FIELDS:
+                    setattr(self, name, getattr(self, name)[alive])
+            return
+
+        keep = [i for i in range(len(self.x)) if self.age[i] + dt < self.life[i]]
+        for name in self.FIELDS:
+            values = getattr(self, name)
+            setattr(self, name, [values[i] for i in keep])
+        gravity = self.gravity * dt
+        for i in range(len(self.x)):
+            self.vy[i] += gravity
+            self.x[i] += self.vx[i] * dt
+            self.y[i] += self.vy[i] * dt
+            self.age[i] += dt
+
+    def draw(self, screen):
+        """Stamp every live particle on a Canvas, fading with age; returns the bounding rect"""
+        if not len(self):
+            return None
+        scale = screen.scale
+        if np is not None:
+            shades = ((1 - self.age / self.life) * (SHADES - 1)).astype(np.int32)
+            return self.sprites.stamp(screen, (self.x * scale).astype(np.int32).tolist(),
+                                      (self.y * scale).astype(np.int32).tolist(), self.color.tolist(),
+                                      self.radius.tolist(), shades.tolist())
+        shades = [int((1 - a / l) * (SHADES - 1)) for a, l in zip(self.age, self.life)]
+        return self.sprites.stamp(screen, [int(v * scale) for v in self.x], [int(v * scale) for v in self.y],
+                                  self.color, self.radius, shades)
@@ -0,0 +1,122 @@
+"""
+In-game performance overlay for DSA Learning Adventure
+
+Toggled with F3. Shows the current FPS, a rolling graph of frame times,
+the worst recent frame and how long the event, update and draw phases
+(including the active level's update() and draw()) are taking.
+"""
+import time
+from collections import deque
+
+import pygame
+
+# Phases timed by the main loop, in display order
+SECTIONS = ("event", "update", "level_update", "draw", "level_draw", "present")
+
+
+class PerfOverlay:
+    """Collects per-frame phase timings and draws them on top of the screen"""
+
+    TOGGLE_KEY = pygame.K_F3
+    HISTORY = 120            # frames shown in the graph
+    TEXT_REFRESH_MS = 250    # numbers are re-rendered at most this often
+    GRAPH_MAX_MS = 33.3      # top of the graph (two 60 FPS frames)
+    BUDGET_MS = 1000 / 60
+
+    def __init__(self, font, width=330, height=170):
+        self.font = font
+        self.visible = False
+        self.width = width
+        self.height = height
+        self.frame_times = deque(maxlen=self.HISTORY)
+        self.section_times = dict.fromkeys(SECTIONS, 0.0)
+        self.current_sections = dict.fromkeys(SECTIONS, 0.0)
+        self.frame_start = 0.0
+        self.lines = []
+        self.line_surfaces = []
+        self.next_text_refresh = 0
+        self.panel = None
+
+    def toggle(self):
+        self.visible = not self.visible
+        self.next_text_refresh = 0
+
+    def begin_frame(self):
+        self.frame_start = time.perf_counter()
+        for name in self.current_sections:
+            self.current_sections[name] = 0.0
+
+    def record(self, section, seconds):
+        """Add time spent in a phase during the current frame"""
+        self.current_sections[section] += seconds
+
+    def end_frame(self):
+        """Close the frame; time spent waiting in clock.tick() is not counted"""
+        self.frame_times.append((time.perf_counter() - self.frame_start) * 1000)
+        # Smooth the per-phase numbers so they are readable at 60 FPS
+        for name, seconds in self.current_sections.items():
+            self.section_times[name] += (seconds * 1000 - self.section_times[name]) * 0.1
+
+    def worst_frame_ms(self):
+        return max(self.frame_times) if self.frame_times else 0.0
+
+    def refresh_text(self, clock):
+        times = self.section_times
+        last = self.frame_times[-1] if self.frame_times else 0.0
+        self.lines = [
+            f"FPS: {clock.get_fps():.1f}",
+            f"Frame: {last:.2f} ms  (worst {self.worst_frame_ms():.2f} ms)",
+            f"Events: {times['event']:.2f}  Update: {times['update']:.2f}"
+            f"  (level {times['level_update']:.2f})",
+            f"Draw: {times['draw']:.2f}  (level {times['level_draw']:.2f})"
+            f"  Present: {times['present']:.2f}",
+        ]
+        # The numbers differ every refresh, so they bypass the shared text
+        # cache (they would only be misses there and evict the game's text);
+        # each refresh renders them once and they are reused until the next
+        self.line_surfaces = [self.font.render(line, True, (255, 255, 255)) for line in self.lines]
+
+    def get_rect(self, screen):
+        return pygame.Rect(screen.get_width() - self.width - 10,
+                           screen.get_height() - self.height - 10,
+                           self.width, self.height)
+
+    def draw(self, screen, clock):
+        """Draw the overlay on a Canvas if visible and return its rect (or None)"""
+        if not self.visible:
+            return None
+
+        now = pygame.time.get_ticks()
+        if now >= self.next_text_refresh:
+            self.refresh_text(clock)
+            self.next_text_refresh = now + self.TEXT_REFRESH_MS
+
+        rect = self.get_rect(screen)
+        if self.panel is None:
+            self.panel = pygame.Surface(screen.to_pixels(rect).size)
+            self.panel.set_alpha(200)
+            self.panel.fill((0, 0, 0))
+        screen.blit(self.panel, rect)
+        screen.rect((0, 255, 0), rect, 1)
+
+        for i, surface in enumerate(self.line_surfaces):
+            screen.blit(surface, (rect.x + 8, rect.y + 6 + i * 18))
+
+        # Rolling frame-time graph with the 60 FPS budget marked
+        graph = pygame.Rect(rect.x + 8, rect.y + 84, rect.width - 16, rect.height - 92)
+        screen.rect((40, 40, 40), graph, 1)
+        budget_y = graph.bottom - int(graph.height * self.BUDGET_MS / self.GRAPH_MAX_MS)
+        screen.line((255, 255, 0), (graph.x, budget_y), (graph.right - 1, budget_y))
+
+        if len(self.frame_times) > 1:
+            step = graph.width / (self.HISTORY - 1)
+            scale = graph.height / self.GRAPH_MAX_MS
+            points = [
+                (graph.x + int(i * step), graph.bottom - 1 - int(min(ms, self.GRAPH_MAX_MS) * scale))
+                for i, ms in enumerate(self.frame_times)
+            ]
+            worst = self.worst_frame_ms()
+            color = (0, 255, 0) if worst <= self.BUDGET_MS else (255, 80, 80)
+            screen.lines(color, False, points)
+
+        return rect
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Pre-generated puzzle bank for DSA Learning Adventure
+
+Puzzles (the array and target of level 1, the stack target of level 2,
+the sorted array and target of level 4) are generated offline by the
+level models themselves, checked with their valid_puzzle() and written
+as fixed-size records to one binary file. The game memory-maps the file,
+so picking puzzle N is a slice at a computed offset: nothing is generated
+and the file is never read in full. Giving a whole class the same puzzle
+number gives everyone the same puzzle.
+
+File layout (little-endian): a header (magic, version, section count),
+one section entry per level (level number, values per puzzle, whether a
+target index follows the values, puzzle count, file offset), then each
+section's records, one byte per value.
+
+Usage:
+    python3 puzzle_bank.py --count 100000
+    python3 dsa_game.py --puzzle 42
+"""
+import argparse
+import mmap
+import os
+import random
+import struct
+import sys
+import time
+
+MAGIC = b"DSAP"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sBB")
+SECTION = struct.Struct("<BBBxIQ")
+
+# Next to the game unless another path is given
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "puzzles.bin")
+
+
+class Puzzle:
+    """A level's starting values and, for levels that have one, its target"""
+
+    __slots__ = ("values", "target")
+
+    def __init__(self, values, target=None):
+        self.values = values
+        self.target = target
+
+
+class PuzzleBank:
+    """Read-only, memory-mapped puzzle file"""
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        with open(path, "rb") as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, section_count = HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a puzzle bank")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"unsupported puzzle bank version {version}")
+        # level number -> (values per puzzle, has target, puzzle count, offset)
+        self.sections = {}
+        for i in range(section_count):
+            level_num, size, has_target, count, offset = SECTION.unpack_from(self.map, HEADER.size + i * SECTION.size)
+            self.sections[level_num] = (size, bool(has_target), count, offset)
+
+    def count(self, level_num):
+        """Puzzles stored for a level (0 if it has none)"""
+        section = self.sections.get(level_num)
+        return section[2] if section else 0
+
+    def puzzle(self, level_num, index):
+        """Puzzle number index of a level, or None if the level has no puzzles"""
+        section = self.sections.get(level_num)
+        if section is None:
+            return None
+        size, has_target, count, offset = section
+        if not 0 <= index < count:
+            raise IndexError(f"level {level_num} has puzzles 0-{count - 1}, not {index}")
+        start = offset + index * (size + has_target)
+        values = self.map[start:start + size]
+        return Puzzle(values, values[self.map[start + size]] if has_target else None)
+
+    def close(self):
+        self.map.close()
+
+
+def generate(model_classes, count, seed=0, path=DEFAULT_PATH):
+    """Write count puzzles for each {level number: model class}; returns the file size"""
+    sections = []
+    for level_num, model_class in sorted(model_classes.items()):
+        # One model generates every puzzle of its level from one seeded stream
+        model = model_class(0, seed=random.Random(seed + level_num).getrandbits(64))
+        records = bytearray()
+        for _ in range(count):
+            values, target = model.generate_puzzle()
+            if not model_class.valid_puzzle(values, target):
+                raise ValueError(f"level {level_num} generated an invalid puzzle: {list(values)}, {target}")
+            records += bytes(values)
+            if model_class.PUZZLE_HAS_TARGET:
+                records.append(values.index(target))
+        sections.append((level_num, model_class, records))
+
+    header = bytearray(HEADER.pack(MAGIC, FORMAT_VERSION, len(sections)))
+    offset = HEADER.size + SECTION.size * len(sections)
+    for level_num, model_class, records in sections:
+        header += SECTION.pack(level_num, model_class.PUZZLE_SIZE, model_class.PUZZLE_HAS_TARGET, count, offset)
+        offset += len(records)
+    # Written aside and moved into place, so a running game never maps a half-written file
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(header)
+        for _, _, records in sections:
+            f.write(records)
+    os.replace(temp_path, path)
+    return offset
+
+
+_bank = None
+
+
+def get_puzzle_bank(path=DEFAULT_PATH):
+    """The shared puzzle bank, opened on first use; None if it has not been generated"""
+    global _bank
+    if _bank is None or _bank.path != path:
+        if not os.path.exists(path):
+            return None
+        _bank = PuzzleBank(path)
+    return _bank
+
+
+def puzzle_levels():
+    """{level number: model class} of the playable levels that use puzzles"""
+    from level_registry import level_registry
+
+    return {number: info.level_class.model_class for number, info in level_registry.items()
+            if not info.locked and hasattr(info.level_class.model_class, "generate_puzzle")}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate the puzzle bank")
+    parser.add_argument("--count", type=int, default=100000, help="puzzles per level")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--output", default=DEFAULT_PATH, help="puzzle bank file to write")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    size = generate(puzzle_levels(), args.count, args.seed, args.output)
+    print(f"Wrote {args.count:,} puzzles per level to {args.output} ({size:,} bytes) "
+          f"in {time.perf_counter() - start:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+"""
+Shared render caches for DSA Learning Adventure
+
+Most of the text on screen never changes between frames, so rendered
+surfaces are kept in a bounded LRU cache and reused instead of being
+rasterized again on every draw call.
+"""
+from collections import OrderedDict
+
+import pygame
+
+from canvas import get_render_scale
+
+
+class SurfaceCache:
+    """Bounded LRU cache of pre-built surfaces with hit/miss counters"""
+
+    def __init__(self, max_size=512):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, build, *args):
+        """Return the surface stored under key, calling build(*args) on a miss"""
+        entries = self._entries
+        surface = entries.get(key)
+        if surface is not None:
+            entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = build(*args)
+        self.store(key, surface)
+        return surface
+
+    def store(self, key, surface):
+        """Insert a surface, evicting the least recently used entry if full"""
+        entries = self._entries
+        entries[key] = surface
+        entries.move_to_end(key)
+        while len(entries) > self.max_size:
+            entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all cached surfaces and reset the counters"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        """Return cache size and hit/miss counters"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class TextCache(SurfaceCache):
+    """LRU cache of rendered text keyed by (font, text, antialias, color)"""
+
+    def render(self, font, text, antialias, color):
+        """Cached equivalent of font.render(text, antialias, color)"""
+        key = (font, text, antialias, tuple(color))
+        entries = self._entries
+        surface = entries.get(key)
+        if surface is not None:
+            entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.store(key, surface)
+        return surface
+
+
+# Shared by the menus and every level
+text_cache = TextCache(max_size=1024)
+
+
+def render_text(font, text, antialias, color):
+    """Render text through the shared cache (surfaces must not be modified)"""
+    return text_cache.render(font, text, antialias, color)
+
+
+class GlowText:
+    """Title text with offset glow layers, pre-baked for a range of intensities
+
+    The glyphs are rasterized once as a white mask; each glow layer is that
+    mask tinted by colour modulation. Intensities in ``intensity_range`` are
+    quantized to ``frames`` sprites that are all built up front, so drawing
+    is a single blit with no rasterization. Offsets are logical, like the
+    font size.
+    """
+
+    def __init__(self, font, text, offsets, glow_color, main_color, intensity_range, frames=16):
+        scale = get_render_scale()
+        self.offsets = sorted({max(1, round(offset * scale)) for offset in offsets}, reverse=True)
+        self.glow_color = glow_color
+        self.main_color = main_color
+        self.low, self.high = intensity_range
+        self.mask = font.render(text, True, (255, 255, 255))
+        self.frames = [self.build_frame(self.frame_intensity(i, frames)) for i in range(frames)]
+
+    def frame_intensity(self, index, frames):
+        return int(round(self.low + (self.high - self.low) * index / max(1, frames - 1)))
+
+    def tinted(self, color):
+        layer = self.mask.copy()
+        layer.fill(tuple(color[:3]) + (255,), special_flags=pygame.BLEND_RGBA_MULT)
+        return layer
+
+    def build_frame(self, intensity):
+        """Composite all glow layers and the main text into one sprite"""
+        reach = max(self.offsets) if self.offsets else 0
+        frame = pygame.Surface((self.mask.get_width() + reach, self.mask.get_height() + reach), pygame.SRCALPHA)
+        for offset in self.offsets:
+            frame.blit(self.tinted(self.glow_color(intensity, offset)), (offset, offset))
+        frame.blit(self.tinted(self.main_color), (0, 0))
+        if pygame.display.get_surface() is not None:
+            frame = frame.convert_alpha()
+        return frame
+
+    def draw(self, screen, center, intensity):
+        """Blit the frame closest to intensity with the main text centered on center (screen is a Canvas)"""
+        span = self.high - self.low
+        index = int((intensity - self.low) * (len(self.frames) - 1) / span + 0.5) if span else 0
+        frame = self.frames[max(0, min(len(self.frames) - 1, index))]
+        return screen.blit(frame, screen.rect_of(self.mask, center=center).topleft)
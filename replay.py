@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Session recording and replay for DSA Learning Adventure
+
+A recording holds a level number, the seed the level's random numbers were
+drawn from, the puzzle bank puzzle it started on (if any) and every key
+press fed to the level, stamped with the number of fixed steps (see
+game_clock.py) the level had run when it arrived.
+Levels only change through steps and key presses, so replaying the keys
+at the same steps reproduces the session exactly. Recordings are stored
+as varints: a typical key press costs two bytes.
+
+Replays run headless at full speed (no window, nothing drawn) to check
+the recorded score against the current rules, or can be watched at 1x.
+
+Usage:
+    python3 dsa_game.py --record recordings/
+    python3 replay.py recordings/*.dsar
+    python3 replay.py --watch --speed 2 recordings/level2-20261017-101500-123456.dsar
+"""
+import os
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import random
+import sys
+import time
+
+import pygame
+
+from game_clock import STEP
+from level_registry import level_registry
+
+MAGIC = b"DSAR"
+# Version 2 added the puzzle number; version 1 recordings are still read
+FORMAT_VERSION = 2
+EXTENSION = ".dsar"
+
+# Keys the levels respond to, stored as their position here (one byte);
+# only ever append, or older recordings decode to the wrong keys
+KEY_CODES = (
+    pygame.K_SPACE, pygame.K_LEFT, pygame.K_RIGHT,
+    pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4, pygame.K_5,
+    pygame.K_6, pygame.K_7, pygame.K_8, pygame.K_9,
+    pygame.K_a, pygame.K_h, pygame.K_l,
+    pygame.K_PAGEUP, pygame.K_PAGEDOWN, pygame.K_HOME, pygame.K_END,
+    pygame.K_MINUS, pygame.K_KP_MINUS, pygame.K_EQUALS, pygame.K_PLUS, pygame.K_KP_PLUS,
+)
+KEY_INDEX = {key: index for index, key in enumerate(KEY_CODES)}
+# Code 0 ends the key presses; other keys are stored after the table
+END_CODE = 0
+FIRST_KEY_CODE = 1
+OTHER_KEY_CODE = FIRST_KEY_CODE + len(KEY_CODES)
+
+# How the session ended
+RESULTS = ("playing", "completed", "failed")
+
+
+def write_varint(buffer, value):
+    """Append a non-negative int, 7 bits per byte, low bits first"""
+    while value >= 0x80:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def read_varint(data, offset):
+    """(value, next offset) of the varint starting at offset"""
+    value = 0
+    shift = 0
+    while True:
+        if offset >= len(data):
+            raise ValueError("truncated recording")
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def encode_key(key):
+    index = KEY_INDEX.get(key)
+    if index is not None:
+        return FIRST_KEY_CODE + index
+    return OTHER_KEY_CODE + key
+
+
+def decode_key(code):
+    if code < OTHER_KEY_CODE:
+        return KEY_CODES[code - FIRST_KEY_CODE]
+    return code - OTHER_KEY_CODE
+
+
+def session_score(level, result):
+    """Points a session earned: a won level includes its time bonus"""
+    return level.get_score() if result == "completed" else level.score
+
+
+def seeded_level(level_num, seed, puzzle_index=None):
+    """A new level of level_num with its random numbers drawn from seed, timers started"""
+    level = level_registry.create(level_num, seed, puzzle_index)
+    level.begin()
+    return level
+
+
+def new_seed():
+    return random.SystemRandom().randrange(1 << 32)
+
+
+class Recording:
+    """Key presses of one level session, by step"""
+
+    __slots__ = ("level_num", "seed", "puzzle_index", "events", "steps", "result", "score")
+
+    def __init__(self, level_num, seed, puzzle_index=None, events=None, steps=0, result="playing", score=0):
+        self.level_num = level_num
+        self.seed = seed
+        self.puzzle_index = puzzle_index  # puzzle bank puzzle, or None if generated from the seed
+        self.events = events if events is not None else []  # (step, key) in order
+        self.steps = steps  # steps the level ran
+        self.result = result
+        self.score = score
+
+    def step(self):
+        """Count one level step"""
+        self.steps += 1
+
+    def key(self, key):
+        """Record a key press arriving now"""
+        self.events.append((self.steps, key))
+
+    def finish(self, level, result):
+        self.result = result
+        self.score = session_score(level, result)
+
+    def to_bytes(self):
+        buffer = bytearray(MAGIC)
+        buffer.append(FORMAT_VERSION)
+        write_varint(buffer, self.level_num)
+        write_varint(buffer, self.seed)
+        write_varint(buffer, 0 if self.puzzle_index is None else self.puzzle_index + 1)
+        # Each key press: steps since the previous one, then the key
+        previous = 0
+        for step, key in self.events:
+            write_varint(buffer, step - previous)
+            write_varint(buffer, encode_key(key))
+            previous = step
+        write_varint(buffer, self.steps - previous)
+        write_varint(buffer, END_CODE)
+        write_varint(buffer, RESULTS.index(self.result))
+        write_varint(buffer, self.score)
+        return bytes(buffer)
+
+    @classmethod
+    def from_bytes(cls, data):
+        if data[:len(MAGIC)] != MAGIC:
+            raise ValueError("not a DSA replay")
+        version = data[len(MAGIC)]
+        if not 1 <= version <= FORMAT_VERSION:
+            raise ValueError(f"unsupported replay version {version}")
+        offset = len(MAGIC) + 1
+        level_num, offset = read_varint(data, offset)
+        seed, offset = read_varint(data, offset)
+        puzzle_index = None
+        if version >= 2:
+            puzzle, offset = read_varint(data, offset)
+            puzzle_index = puzzle - 1 if puzzle else None
+        events = []
+        step = 0
+        while True:
+            delta, offset = read_varint(data, offset)
+            code, offset = read_varint(data, offset)
+            step += delta
+            if code == END_CODE:
+                break
+            events.append((step, decode_key(code)))
+        result, offset = read_varint(data, offset)
+        score, offset = read_varint(data, offset)
+        return cls(level_num, seed, puzzle_index, events, step, RESULTS[result], score)
+
+    def save(self, directory):
+        """Write to a new file in directory; returns its path"""
+        os.makedirs(directory, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        path = os.path.join(directory, f"level{self.level_num}-{stamp}-{self.seed}{EXTENSION}")
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+        return path
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+
+def key_event(key):
+    return pygame.event.Event(pygame.KEYDOWN, key=key)
+
+
+def replay(recording):
+    """Play a recording back as fast as possible, drawing nothing; returns (result, score)"""
+    level = seeded_level(recording.level_num, recording.seed, recording.puzzle_index)
+    result = "playing"
+    steps = 0
+    for step, key in recording.events + [(recording.steps, None)]:
+        while steps < step and result == "playing":
+            result = level.step(STEP)
+            steps += 1
+        if result != "playing" or key is None:
+            break
+        level.handle_event(key_event(key))
+    return result, session_score(level, result)
+
+
+def watch(recording, speed=1.0):
+    """Show a recording in a window at speed times real time; returns (result, score)"""
+    import dsa_game
+    from config import FPS
+
+    game = dsa_game.DSAGame(adaptive_fps=False)
+    game.prewarm_levels = False
+    game.current_level = recording.level_num
+    level = seeded_level(recording.level_num, recording.seed, recording.puzzle_index)
+    game.current_level_instance = level
+    game.state = dsa_game.GameState.PLAYING
+    events = iter(recording.events)
+    pending = next(events, None)
+    result = "playing"
+    steps = 0
+    while result == "playing" and steps < recording.steps:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                return result, session_score(level, result)
+        # Key presses due before this step, as the game delivers them
+        while pending is not None and pending[0] <= steps:
+            level.handle_event(key_event(pending[1]))
+            game.full_redraw = True
+            pending = next(events, None)
+        result = level.step(STEP)
+        steps += 1
+        game.draw_frame()
+        game.present_frame()
+        game.clock.tick(FPS * speed)
+    return result, session_score(level, result)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay recorded level sessions")
+    parser.add_argument("paths", nargs="+", help="recordings (.dsar) to replay")
+    parser.add_argument("--watch", action="store_true", help="show the sessions in a window instead of replaying headless")
+    parser.add_argument("--speed", type=float, default=1.0, help="playback speed when watching")
+    args = parser.parse_args(argv)
+
+    if not args.watch:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    mismatches = 0
+    for path in args.paths:
+        recording = Recording.load(path)
+        start = time.perf_counter()
+        if args.watch:
+            result, score = watch(recording, args.speed)
+        else:
+            result, score = replay(recording)
+        duration = time.perf_counter() - start
+        matches = (result, score) == (recording.result, recording.score)
+        mismatches += not matches
+        print(f"{path}: level {recording.level_num}, {len(recording.events)} keys, "
+              f"{os.path.getsize(path)} bytes, recorded {recording.result} {recording.score}, "
+              f"replayed {result} {score} in {duration * 1000:.1f} ms{'' if matches else '  MISMATCH'}")
+    # Non-zero when the current rules score a session differently from real play
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""
+Scaled presentation for DSA Learning Adventure
+
+The game draws onto a canvas of the logical resolution from config.py
+times the render scale (see canvas.py). When the window is the same size
+the canvas is the display surface itself and nothing changes; otherwise the
+canvas is an offscreen surface that is scaled straight into the window when
+the frame is presented, letterboxed to keep its aspect ratio. Drawing cost
+depends only on the canvas size: a projector can show the game at 4K
+without extra drawing, and a render scale of 0.5 draws a quarter of the
+pixels whatever the window size. Scaling is a pass on top of the frame, so
+shrinking a full-size canvas into a small window costs more, not less;
+lower the render scale instead.
+"""
+import pygame
+
+from canvas import scaled_size
+from config import SCALE_MODES
+
+
+def parse_size(text):
+    """Parse a 'WIDTHxHEIGHT' command-line value into a (width, height) tuple"""
+    parts = text.lower().split("x")
+    try:
+        size = tuple(int(part) for part in parts)
+    except ValueError:
+        size = ()
+    if len(size) != 2 or min(size) <= 0:
+        raise ValueError(f"expected a size like 1920x1080, got {text!r}")
+    return size
+
+
+class ScaledDisplay:
+    """Owns the window and the canvas the game draws on"""
+
+    def __init__(self, canvas_size, window_size=None, scale_mode="integer", resizable=False, render_scale=1.0):
+        if scale_mode not in SCALE_MODES:
+            raise ValueError(f"Unknown scale mode: {scale_mode}")
+        # canvas_size is logical; the canvas has render_scale times its pixels
+        self.canvas_size = scaled_size(canvas_size, render_scale)
+        self.scale_mode = scale_mode
+        window_size = tuple(window_size or canvas_size)
+        self.offscreen = resizable or window_size != self.canvas_size
+
+        flags = pygame.RESIZABLE if resizable else 0
+        self.window = pygame.display.set_mode(window_size, flags)
+        if self.offscreen:
+            self.canvas = pygame.Surface(self.canvas_size).convert()
+        else:
+            self.canvas = self.window
+        self.target_rect = None
+        self.target = None
+        self.layout()
+
+    def layout(self):
+        """Work out where the canvas lands in the window for the current size"""
+        window_width, window_height = self.window.get_size()
+        canvas_width, canvas_height = self.canvas_size
+        fit = min(window_width / canvas_width, window_height / canvas_height)
+        if self.scale_mode == "integer" and fit >= 1:
+            fit = int(fit)
+        width = max(1, int(canvas_width * fit))
+        height = max(1, int(canvas_height * fit))
+        self.scale = fit
+        self.target_rect = pygame.Rect((window_width - width) // 2, (window_height - height) // 2,
+                                       width, height)
+        # The scaled frame is written straight into this part of the window
+        self.target = self.window.subsurface(self.target_rect) if self.offscreen else None
+        if self.offscreen:
+            self.window.fill((0, 0, 0))
+
+    def resize(self, size):
+        """Follow a window resize (VIDEORESIZE / WINDOWSIZECHANGED)"""
+        if not self.offscreen:
+            return
+        self.window = pygame.display.get_surface()
+        self.layout()
+
+    def window_rect(self, rect):
+        """Map a canvas rect to the window rect it is shown in"""
+        rect = pygame.Rect(rect)
+        if not self.offscreen:
+            return rect
+        left = self.target_rect.x + int(rect.x * self.scale)
+        top = self.target_rect.y + int(rect.y * self.scale)
+        right = self.target_rect.x + int(rect.right * self.scale + 0.999)
+        bottom = self.target_rect.y + int(rect.bottom * self.scale + 0.999)
+        return pygame.Rect(left, top, right - left, bottom - top).clip(self.target_rect)
+
+    def present(self, rects=None):
+        """Show the canvas; with rects (in canvas pixels) only those areas are pushed to the window"""
+        if self.offscreen and rects is not None and self.scale == int(self.scale):
+            # Whole-number scaling maps canvas pixels exactly, so only the changed areas are scaled
+            canvas_rect = self.canvas.get_rect()
+            window_rects = []
+            for rect in rects:
+                rect = canvas_rect.clip(rect)
+                if rect.width and rect.height:
+                    window_rect = self.window_rect(rect)
+                    pygame.transform.scale(self.canvas.subsurface(rect), window_rect.size,
+                                           self.window.subsurface(window_rect))
+                    window_rects.append(window_rect)
+            pygame.display.update(window_rects)
+            return
+        if self.offscreen:
+            if self.scale_mode == "smooth":
+                pygame.transform.smoothscale(self.canvas, self.target_rect.size, self.target)
+            else:
+                pygame.transform.scale(self.canvas, self.target_rect.size, self.target)
+        if rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update([self.window_rect(rect) for rect in rects])
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Headless level simulation for DSA Learning Adventure
+
+Plays complete games of the playable levels with scripted bots instead of
+a player: "optimal" always takes the right action, "random" mashes the
+level's keys and "student" plays correctly most of the time with human
+reaction times and the odd mistake. Bots act on the level models
+(level_models.py) directly, so nothing is drawn, no fonts or window are
+created and pygame is never initialised; the models run on simulated time
+(see game_clock.py), so thousands of games finish per second. Reports
+completion rates and score and time distributions, for balancing each
+level's time_limit.
+
+Usage:
+    python3 simulation.py --games 2000
+    python3 simulation.py --level 3 --bot student --time-limit 30
+    python3 simulation.py --output simulation.json
+"""
+import os
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import json
+import random
+import sys
+import time
+
+from level_models import ArrayModel, BinarySearchModel, QueueModel, StackModel
+from level_registry import level_registry
+from stats import distribution
+
+# Longest simulated step between actions; levels only compare elapsed
+# time against thresholds, so coarse steps play out the same as 1/60 s ones
+MAX_STEP = 0.1
+
+# Actions a player can take in each level, as (model method, arguments...);
+# the same calls the levels make for their keys
+LEVEL_ACTIONS = {
+    ArrayModel: (("move", -1), ("move", 1), ("check_selection",)),
+    StackModel: tuple(("push", value) for value in range(1, 10)) + (("pop",),),
+    QueueModel: (("add_customer",), ("process_customer",)),
+    BinarySearchModel: (("search_left",), ("search_right",), ("check_found",)),
+}
+
+
+def optimal_array_action(model):
+    """Walk straight to the target and select it"""
+    target_index = model.positions[model.target]
+    if model.selected_index < target_index:
+        return ("move", 1)
+    if model.selected_index > target_index:
+        return ("move", -1)
+    return ("check_selection",)
+
+
+def optimal_stack_action(model):
+    """Push the next number of the target sequence"""
+    return ("push", model.target_sequence[model.current_target_index])
+
+
+def optimal_queue_action(model):
+    """Serve whoever is waiting, or call the next customer"""
+    return ("process_customer",) if model.queue else ("add_customer",)
+
+
+def optimal_search_action(model):
+    """Compare the middle element with the target"""
+    middle = model.array[model.mid]
+    if middle > model.target:
+        return ("search_left",)
+    if middle < model.target:
+        return ("search_right",)
+    return ("check_found",)
+
+
+OPTIMAL_ACTIONS = {
+    ArrayModel: optimal_array_action,
+    StackModel: optimal_stack_action,
+    QueueModel: optimal_queue_action,
+    BinarySearchModel: optimal_search_action,
+}
+
+
+class Bot:
+    """Takes one action every reaction_time() seconds"""
+
+    def __init__(self, rng, reaction=0.15):
+        self.rng = rng
+        self.reaction = reaction
+
+    def reaction_time(self):
+        return self.reaction
+
+    def choose(self, model):
+        raise NotImplementedError
+
+
+class OptimalBot(Bot):
+    """Always takes the right action at a fast, steady pace"""
+
+    def choose(self, model):
+        return OPTIMAL_ACTIONS[type(model)](model)
+
+
+class RandomBot(Bot):
+    """Takes any of the level's actions"""
+
+    def __init__(self, rng, reaction=0.3):
+        super().__init__(rng, reaction)
+
+    def choose(self, model):
+        return self.rng.choice(LEVEL_ACTIONS[type(model)])
+
+
+class StudentBot(Bot):
+    """Plays correctly with varying reaction times and an occasional wrong key"""
+
+    def __init__(self, rng, reaction=0.8, reaction_spread=0.3, min_reaction=0.2, mistake_rate=0.15):
+        super().__init__(rng, reaction)
+        self.reaction_spread = reaction_spread
+        self.min_reaction = min_reaction
+        self.mistake_rate = mistake_rate
+
+    def reaction_time(self):
+        return max(self.min_reaction, self.rng.gauss(self.reaction, self.reaction_spread))
+
+    def choose(self, model):
+        if self.rng.random() < self.mistake_rate:
+            return self.rng.choice(LEVEL_ACTIONS[type(model)])
+        return OPTIMAL_ACTIONS[type(model)](model)
+
+
+BOTS = {
+    "optimal": OptimalBot,
+    "random": RandomBot,
+    "student": StudentBot,
+}
+
+
+def play_game(model, bot, max_step=MAX_STEP):
+    """Play one level model to the end; returns (completed, score, elapsed seconds, actions taken)"""
+    model.begin()
+    result = "playing"
+    actions = 0
+    while result == "playing":
+        # Simulated time passes until the bot reacts
+        act_at = model.elapsed + bot.reaction_time()
+        while result == "playing" and model.elapsed < act_at:
+            result = model.step(min(max_step, act_at - model.elapsed))
+        if result != "playing":
+            break
+        method, *args = bot.choose(model)
+        getattr(model, method)(*args)
+        actions += 1
+        result = model.step(0.0)
+    completed = result == "completed"
+    # A won level earns the time bonus, as in the game
+    score = model.get_score() if completed else model.score
+    return completed, score, model.elapsed, actions
+
+
+def simulate(level_num, bot_name, games=1000, seed=0, time_limit=None, max_step=MAX_STEP):
+    """Play games of one level with one kind of bot and summarize the outcomes"""
+    info = level_registry.info(level_num)
+    if info is None or info.locked:
+        raise ValueError(f"Level {level_num} not implemented yet!")
+    model_class = info.level_class.model_class
+    if model_class not in OPTIMAL_ACTIONS:
+        raise ValueError(f"No bot strategy for level {level_num}")
+    limit = info.time_limit if time_limit is None else time_limit
+
+    # Each game's level gets its own seed from one stream; bots have their own
+    seeds = random.Random(seed)
+    bot = BOTS[bot_name](random.Random(seed))
+    records = []
+    start = time.perf_counter()
+    for _ in range(games):
+        # Only the model is built: no fonts, no window, pygame never initialised
+        model = model_class(limit, seed=seeds.getrandbits(32))
+        records.append(play_game(model, bot, max_step))
+    duration = time.perf_counter() - start
+
+    wins = [record for record in records if record[0]]
+    return {
+        "level": level_num,
+        "name": info.name,
+        "bot": bot_name,
+        "games": games,
+        "time_limit": limit,
+        "completion_rate": len(wins) / games,
+        "score": distribution([record[1] for record in records]),
+        "completion_time": distribution([record[2] for record in wins]),
+        "actions": distribution([record[3] for record in records]),
+        "games_per_second": games / duration if duration > 0 else float("inf"),
+    }
+
+
+def format_summary(summary):
+    """One line per level and bot for the console"""
+    completion = summary["completion_time"]
+    times = f"time p50 {completion['p50']:5.1f}s p90 {completion['p90']:5.1f}s" if completion else "time      -"
+    return (f"Level {summary['level']} {summary['name']:<18} {summary['bot']:<8} "
+            f"limit {summary['time_limit']:>3}s  won {summary['completion_rate']:6.1%}  "
+            f"score p50 {summary['score']['p50']:>5}  {times}  "
+            f"({summary['games_per_second']:,.0f} games/s)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless level simulation with bot players")
+    parser.add_argument("--level", type=int, action="append", dest="levels",
+                        help="only simulate this level (repeatable)")
+    parser.add_argument("--bot", choices=sorted(BOTS), action="append", dest="bots",
+                        help="only use this bot (repeatable)")
+    parser.add_argument("--games", type=int, default=1000, help="games per level and bot")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--time-limit", type=float, help="try this time limit (seconds) instead of the level's")
+    parser.add_argument("--output", help="write the summaries as JSON to this file")
+    args = parser.parse_args(argv)
+
+    level_nums = args.levels or [number for number, info in level_registry.items()
+                                 if not info.locked and info.level_class.model_class in OPTIMAL_ACTIONS]
+    summaries = []
+    for level_num in level_nums:
+        for bot_name in args.bots or BOTS:
+            summary = simulate(level_num, bot_name, args.games, args.seed, args.time_limit)
+            print(format_summary(summary))
+            summaries.append(summary)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(json.dumps(summaries, indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,29 @@
+"""
+Summary statistics shared by the benchmark and the level simulator
+
+Plain Python with no pygame, so tools that only crunch numbers stay light.
+"""
+import math
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    # Smallest rank covering pct% of the values (pct * n first, so whole ranks stay exact)
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(pct * len(sorted_values) / 100) - 1))
+    return sorted_values[rank]
+
+
+def distribution(values):
+    """Mean and nearest-rank percentiles of a list of numbers"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return {
+        "mean": sum(ordered) / len(ordered),
+        "p10": percentile(ordered, 10),
+        "p50": percentile(ordered, 50),
+        "p90": percentile(ordered, 90),
+        "max": ordered[-1],
+    }
@@ -0,0 +1,153 @@
+"""
+Fixed-size data structures used by the levels
+
+RingBuffer is a bounded FIFO queue with O(1) append, popleft and indexed
+access; its storage is allocated once. ProcessedSummary keeps running
+totals and the last few items instead of an ever-growing history list.
+SequenceMatcher tracks how much of a target sequence the end of an input
+matches, one table lookup per item.
+"""
+from collections import deque
+
+
+class RingBuffer:
+    """Fixed-capacity FIFO queue backed by a preallocated list"""
+
+    __slots__ = ("capacity", "_items", "_head", "_count")
+
+    def __init__(self, capacity, items=()):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._items = [None] * capacity
+        self._head = 0
+        self._count = 0
+        for item in items:
+            self.append(item)
+
+    def __len__(self):
+        return self._count
+
+    def __bool__(self):
+        return self._count > 0
+
+    def is_full(self):
+        return self._count == self.capacity
+
+    def append(self, item):
+        """Add item at the back; returns False (and drops it) when full"""
+        if self._count == self.capacity:
+            return False
+        self._items[(self._head + self._count) % self.capacity] = item
+        self._count += 1
+        return True
+
+    def popleft(self):
+        """Remove and return the item at the front"""
+        if not self._count:
+            raise IndexError("pop from an empty RingBuffer")
+        item = self._items[self._head]
+        self._items[self._head] = None
+        self._head = (self._head + 1) % self.capacity
+        self._count -= 1
+        return item
+
+    def peek(self):
+        if not self._count:
+            raise IndexError("peek at an empty RingBuffer")
+        return self._items[self._head]
+
+    def __getitem__(self, index):
+        """Item at a position counted from the front (negative counts from the back)"""
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("RingBuffer index out of range")
+        return self._items[(self._head + index) % self.capacity]
+
+    def window(self, start, count):
+        """Up to count items starting at position start, front to back"""
+        start = max(0, start)
+        stop = min(self._count, start + count)
+        return [self._items[(self._head + i) % self.capacity] for i in range(start, stop)]
+
+    def __iter__(self):
+        return iter(self.window(0, self._count))
+
+    def clear(self):
+        self._items = [None] * self.capacity
+        self._head = 0
+        self._count = 0
+
+    def __copy__(self):
+        clone = RingBuffer.__new__(RingBuffer)
+        clone.capacity = self.capacity
+        clone._items = self._items.copy()
+        clone._head = self._head
+        clone._count = self._count
+        return clone
+
+
+class ProcessedSummary:
+    """Bounded record of processed items: a count, first and last, and the most recent few"""
+
+    __slots__ = ("count", "first", "last", "recent")
+
+    def __init__(self, recent=8):
+        self.count = 0
+        self.first = None
+        self.last = None
+        self.recent = deque(maxlen=recent)
+
+    def __len__(self):
+        return self.count
+
+    def __copy__(self):
+        clone = ProcessedSummary.__new__(ProcessedSummary)
+        clone.count = self.count
+        clone.first = self.first
+        clone.last = self.last
+        clone.recent = self.recent.copy()
+        return clone
+
+    def add(self, item):
+        if self.count == 0:
+            self.first = item
+        self.count += 1
+        self.last = item
+        self.recent.append(item)
+
+
+class SequenceMatcher:
+    """KMP automaton over a target sequence
+
+    A state is the length of the longest prefix of the pattern that ends
+    the input seen so far; state == len(pattern) means the input ends with
+    the whole pattern. step() is a single table lookup, so a caller that
+    keeps one state per position (e.g. per stack depth) can push and pop
+    in O(1).
+    """
+
+    __slots__ = ("pattern", "transitions")
+
+    def __init__(self, pattern):
+        self.pattern = tuple(pattern)
+        length = len(self.pattern)
+        self.transitions = [{} for _ in range(length + 1)]
+        if length:
+            self.transitions[0][self.pattern[0]] = 1
+        fallback = 0
+        for state in range(1, length + 1):
+            # On a mismatch behave like the longest proper border of this prefix
+            self.transitions[state] = dict(self.transitions[fallback])
+            if state < length:
+                symbol = self.pattern[state]
+                self.transitions[state][symbol] = state + 1
+                fallback = self.transitions[fallback].get(symbol, 0)
+
+    def __len__(self):
+        return len(self.pattern)
+
+    def step(self, state, symbol):
+        """State after appending symbol"""
+        return self.transitions[state].get(symbol, 0)
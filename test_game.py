@@ -2,10 +2,14 @@
 """
 Quick test script to verify the game launches without crashing
 """
+import math
+import os
 import pygame
 import sys
 import time
 
+from canvas import Canvas
+
 def test_game_launch():
     """Test that the game can launch and initialize properly"""
     try:
@@ -33,7 +37,7 @@ def test_game_launch():
         
         # Quick render test (create screen but don't show)
         screen = pygame.display.set_mode((100, 100))
-        game.screen = screen
+        game.screen = Canvas(screen)
         
         # Test drawing functions without actually displaying
         print("✅ Testing draw functions...")
@@ -52,6 +56,581 @@ def test_game_launch():
         traceback.print_exc()
         return False
 
+def test_text_cache():
+    """Test that repeated text renders are served from the LRU cache"""
+    pygame.init()
+    from render_cache import TextCache
+
+    cache = TextCache(max_size=2)
+    font = pygame.font.Font(None, 24)
+    first = cache.render(font, "HELLO", True, (255, 255, 255))
+    assert cache.render(font, "HELLO", True, (255, 255, 255)) is first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # Oldest entry is evicted once the cache is full
+    cache.render(font, "A", True, (255, 255, 255))
+    cache.render(font, "B", True, (255, 255, 255))
+    assert len(cache) == 2
+    assert cache.render(font, "HELLO", True, (255, 255, 255)) is not first
+
+    # The perf overlay's ever-changing numbers stay out of the shared cache
+    from perf_overlay import PerfOverlay
+    from render_cache import text_cache
+    overlay = PerfOverlay(font)
+    overlay.toggle()
+    screen = Canvas(pygame.Surface((400, 300)))
+    clock = pygame.time.Clock()
+    before = (len(text_cache), text_cache.hits, text_cache.misses)
+    for _ in range(3):
+        overlay.begin_frame()
+        overlay.end_frame()
+        overlay.next_text_refresh = 0
+        overlay.draw(screen, clock)
+    assert (len(text_cache), text_cache.hits, text_cache.misses) == before
+    assert len(overlay.line_surfaces) == len(overlay.lines)
+    print("✅ Text cache works")
+
+def test_benchmark_runner():
+    """Test that the headless benchmark covers every screen, level and effect"""
+    import benchmark
+
+    # Nearest-rank percentiles
+    assert benchmark.percentile(list(range(1, 101)), 95) == 95
+    assert [benchmark.percentile(list(range(1, 301)), pct) for pct in (50, 95, 99, 100)] == [150, 285, 297, 300]
+    assert benchmark.percentile([4, 8], 1) == 4 and benchmark.percentile([4, 8], 51) == 8
+    assert benchmark.percentile([], 50) == 0.0
+
+    results = benchmark.run_benchmark(frames=3, warmup=1)
+    expected = (set(benchmark.SCREEN_SCENARIOS) | set(benchmark.LEVEL_SCENARIOS)
+                | set(benchmark.STRESS_SCENARIOS) | set(benchmark.EFFECT_SCENARIOS)
+                | set(benchmark.RENDER_SCALE_SCENARIOS))
+    assert set(results["scenarios"]) == expected
+    for stats in results["scenarios"].values():
+        assert stats["p50_ms"] <= stats["p95_ms"] <= stats["p99_ms"]
+
+    # A baseline twice as fast as the current run is a regression
+    baseline = {"scenarios": {name: dict(stats, p95_ms=stats["p95_ms"] / 2)
+                              for name, stats in results["scenarios"].items()}}
+    assert len(benchmark.compare_to_baseline(results, baseline, 0.25)) == len(expected)
+    assert not benchmark.compare_to_baseline(results, results, 0.25)
+    print("✅ Benchmark runner works")
+
+def test_scoreboard_cache():
+    """Test that score tables are only re-rendered after a high score is added"""
+    pygame.init()
+    import dsa_game
+
+    game = dsa_game.DSAGame()
+    game.save_high_scores = lambda: None  # keep high_scores.txt untouched
+    game.draw_scoreboard()
+    table = game.scoreboard_layer
+    game.draw_scoreboard()
+    assert game.scoreboard_layer is table
+
+    game.add_high_score("TEST", 10 ** 6)
+    game.draw_scoreboard()
+    assert game.scoreboard_layer is not table
+    assert game.scoreboard_layer_version == game.high_scores_version
+    print("✅ Scoreboard cache works")
+
+def test_animation_clock():
+    """Test that lookup-table waves match Vector2.rotate and tweens ease"""
+    from animation import AnimationClock, Tween, cos_deg, sin_deg
+
+    for angle in (0, 45, 90, 200.5, -30, 12345.6):
+        rotated = pygame.math.Vector2(1, 0).rotate(angle)
+        assert abs(cos_deg(angle) - rotated.x) < 0.01
+        assert abs(sin_deg(angle) - rotated.y) < 0.01
+
+    clock = AnimationClock()
+    clock.sample(90 * 500)
+    assert abs(clock.cos("menu_glow")) < 0.01  # 90 degrees into the glow cycle
+
+    tween = Tween(0, 100, 1000, "ease_in_out")
+    tween.start(0)
+    assert tween.value(0) == 0 and tween.value(1000) == 100
+    assert 40 < tween.value(500) < 60 and tween.finished(1500)
+    print("✅ Animation clock works")
+
+def test_particle_system():
+    """Test that particle fields follow their paths and bursts expire"""
+    from particles import Channel, ParticleField, ParticleSystem
+
+    screen = Canvas(pygame.Surface((200, 200)))
+    field = ParticleField(4, x=Channel(100, 50, 0.001, 0.5), y=Channel(100, 50, 0.001, 0.5, "sin"),
+                          radius=Channel(2, wave="none"), intensity=Channel(200, wave="none"),
+                          tint=(1, 0, 0))
+    xs, ys = field.evaluate(0, 1000), field.evaluate(1, 1000)
+    assert abs(xs[1] - (100 + 50 * math.cos(1.5))) < 1e-6
+    assert abs(ys[1] - (100 + 50 * math.sin(1.5))) < 1e-6
+    assert field.draw(screen, 1000) is not None
+
+    system = ParticleSystem([(1, 1, 0), (0, 1, 1)], capacity=1000)
+    system.burst(1500, 100, 100, lifetime=(100, 200))
+    assert len(system) == 1000  # capped at capacity
+    system.update(0)
+    system.update(50)
+    assert system.draw(screen) is not None
+    system.update(150)
+    system.update(250)
+    assert len(system) == 0
+    print("✅ Particle system works")
+
+def test_scaled_display():
+    """Test that the canvas is scaled into the window and dirty rects are mapped"""
+    from scaled_display import ScaledDisplay, parse_size
+
+    assert parse_size("2048x1536") == (2048, 1536)
+    display = ScaledDisplay((100, 80), (250, 200), "integer")
+    assert display.offscreen and display.scale == 2
+    assert display.target_rect == pygame.Rect(25, 20, 200, 160)  # letterboxed
+    display.canvas.fill((0, 0, 0))
+    display.canvas.fill((255, 0, 0), (10, 10, 5, 5))
+    display.present([pygame.Rect(10, 10, 5, 5)])
+    assert display.window.get_at((25 + 21, 20 + 21))[:3] == (255, 0, 0)
+    assert display.window_rect((10, 10, 5, 5)) == pygame.Rect(45, 40, 10, 10)
+
+    direct = ScaledDisplay((100, 80))
+    assert not direct.offscreen and direct.canvas is direct.window
+
+    # A half render scale draws a quarter of the pixels, laid out as before
+    half = ScaledDisplay((100, 80), render_scale=0.5)
+    assert half.canvas_size == (50, 40) and half.offscreen
+    canvas = Canvas(half.canvas, 0.5, (100, 80))
+    assert canvas.get_size() == (100, 80)
+    assert canvas.to_pixels((10, 10, 5, 5)) == pygame.Rect(5, 5, 3, 3)
+    assert canvas.rect((255, 0, 0), (10, 10, 20, 20)) == pygame.Rect(10, 10, 20, 20)
+    assert half.canvas.get_at((9, 9))[:3] == (255, 0, 0) and half.canvas.get_at((15, 15))[:3] != (255, 0, 0)
+    print("✅ Scaled display works")
+
+def test_render_scale():
+    """Test that the game, fonts, sprites and levels draw at a reduced render scale"""
+    import dsa_game
+    from canvas import get_render_scale, set_render_scale
+    from fonts import get_font
+
+    full_font = get_font(36)
+    try:
+        game = dsa_game.DSAGame(window_size=(512, 384), render_scale=0.5)
+        assert game.display.canvas.get_size() == (512, 384)
+        assert game.screen.get_size() == (dsa_game.SCREEN_WIDTH, dsa_game.SCREEN_HEIGHT)
+        assert get_font(36).get_height() < full_font.get_height()
+        for state in (dsa_game.GameState.MENU, dsa_game.GameState.LEVEL_SELECT):
+            game.state = state
+            game.draw_frame()
+            game.present_frame()
+        game.start_level(1, seed=0)
+        game.state = dsa_game.GameState.PLAYING
+        game.celebrate()
+        game.draw_frame()
+        game.present_frame()
+    finally:
+        # The scale is process-wide; later tests draw at full size
+        set_render_scale(1.0)
+    assert get_render_scale() == 1.0
+    print("✅ Render scale works")
+
+def test_sprite_atlas():
+    """Test that atlas sprites are packed without overlap and match direct drawing"""
+    from assets import SpriteAtlas, build_sprite_atlas, paint_disc
+
+    atlas = build_sprite_atlas()
+    rects = list(atlas.rects.values())
+    assert all(not a.colliderect(b) for i, a in enumerate(rects) for b in rects[i + 1:])
+    assert atlas.surface.get_width() <= atlas.max_width
+
+    # A disc drawn from the atlas is pixel-identical to pygame.draw.circle
+    small = SpriteAtlas()
+    small.add("disc", *paint_disc(8, (255, 0, 0), (255, 0, 0), 0))
+    small.build()
+    drawn, direct = pygame.Surface((40, 40)), pygame.Surface((40, 40))
+    small.draw(drawn, "disc", (20, 20))
+    pygame.draw.circle(direct, (255, 0, 0), (20, 20), 8)
+    assert pygame.image.tostring(drawn, "RGB") == pygame.image.tostring(direct, "RGB")
+    print("✅ Sprite atlas works")
+
+def test_level_registry():
+    """Test that levels register themselves and pre-warmed levels start fresh"""
+    from level_registry import level_registry
+    import dsa_game
+    import levels
+
+    numbers = [number for number, _ in level_registry.items()]
+    assert numbers == list(range(1, 11))
+    assert level_registry.info(1).level_class is levels.ArrayLevel
+    assert level_registry.info(5).locked and not level_registry.is_playable(5)
+
+    game = dsa_game.DSAGame()
+    game.state = dsa_game.GameState.LEVEL_SELECT
+    game.presented_state = game.state
+    game.update()
+    assert level_registry.is_prewarmed(1)
+
+    level_registry._prewarmed[1].model.elapsed += 100  # built long before play starts
+    level = level_registry.take(1)
+    assert level.get_remaining_time() > level.time_limit - 1  # take() restarted its clock
+    assert not level_registry.is_prewarmed(1)
+    level_registry.discard_prewarmed()
+    print("✅ Level registry works")
+
+def test_font_registry():
+    """Test that fonts are loaded once per (face, size) and reloaded after pygame.quit()"""
+    from fonts import FontRegistry
+
+    pygame.init()
+    registry = FontRegistry()
+    font = registry.get(24)
+    assert registry.get(24) is font and registry.get(18) is not font
+    assert len(registry) == 2 and "Loaded 2 fonts" in registry.report()
+
+    pygame.quit()
+    assert len(registry) == 0
+    pygame.init()
+    assert registry.get(24).render("OK", True, (255, 255, 255)).get_width() > 0
+    print("✅ Font registry works")
+
+def test_ring_buffer_queue():
+    """Test the ring buffer and a rush hour queue of 10,000 customers"""
+    from structures import RingBuffer, ProcessedSummary
+    import levels
+
+    ring = RingBuffer(3, [1, 2])
+    assert ring.append(3) and not ring.append(4)  # full
+    assert ring.popleft() == 1 and ring.append(4)  # wraps around
+    assert list(ring) == [2, 3, 4] and ring[-1] == 4 and ring.window(1, 5) == [3, 4]
+
+    summary = ProcessedSummary(recent=2)
+    for item in range(5):
+        summary.add(item)
+    assert len(summary) == 5 and list(summary.recent) == [3, 4] and summary.first == 0
+
+    level = levels.QueueLevel(rush_hour=True)
+    for _ in range(level.RUSH_HOUR_CAPACITY + 5):
+        level.add_customer()
+    assert len(level.queue) == level.RUSH_HOUR_CAPACITY
+    level.scroll_to(10 ** 6)
+    assert level.scroll == level.RUSH_HOUR_CAPACITY - level.VISIBLE_SLOTS
+    level.process_customer()
+    assert level.queue.peek() == 2 and list(level.processed.recent) == [1]
+    level.draw(Canvas(pygame.Surface((1024, 768))))
+    print("✅ Ring buffer queue works")
+
+def test_stack_matcher():
+    """Test the incremental sequence matcher behind the stack level"""
+    from structures import SequenceMatcher
+    import levels
+
+    matcher = SequenceMatcher([1, 2, 1, 3])
+    state = 0
+    for value in [1, 2, 1, 2, 1, 3]:  # overlapping partial match
+        state = matcher.step(state, value)
+    assert state == len(matcher)
+
+    level = levels.StackLevel()
+    level.model.set_target([4, 5, 6])
+    for value in [9] * 500 + [4, 5]:
+        level.push(value)
+    assert level.current_target_index == 2 and level.update() == "playing"
+    level.push(7)
+    level.pop()  # popping restores the previous match state
+    assert level.current_target_index == 2
+    level.push(6)
+    assert level.update() == "completed" and level.score == 100
+    assert len(level.operations) == level.OPERATION_LOG_SIZE
+    assert level.operations[-1] == ("PUSH", 6)
+    level.draw(Canvas(pygame.Surface((1024, 768))))
+    print("✅ Stack sequence matcher works")
+
+def test_large_binary_search():
+    """Test the binary search level on a million values"""
+    import levels
+
+    level = levels.BinarySearchLevel()
+    assert level.max_comparisons == 4  # ceil(log2(16))
+    level.start_large_search()
+    size = level.LARGE_SIZE
+    assert len(level.array) == size and level.max_comparisons == 20
+    assert all(level.array[i] < level.array[i + 1] for i in range(0, size - 1, 997))
+
+    # Play a perfect search: it never needs more than max_comparisons
+    while level.array[level.mid] != level.target:
+        if level.array[level.mid] > level.target:
+            level.search_left()
+        else:
+            level.search_right()
+    level.check_found()
+    assert level.found and level.comparisons <= level.max_comparisons
+
+    first, count, stride = level.visible_window()
+    assert count == level.VISIBLE_CELLS and stride == 1 and first <= level.mid < first + count
+    level.draw(Canvas(pygame.Surface((1024, 768))))
+
+    # Zooming out samples every stride-th index and keeps the middle on a cell
+    level = levels.BinarySearchLevel(size=levels.BinarySearchModel.LARGE_SIZE)
+    level.search_right()
+    assert level.zoom_strides() == [1, 10, 100, 1000, 10000, (size - 1) // level.VISIBLE_CELLS]
+    for _ in range(10):
+        level.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_MINUS))
+        first, count, stride = level.visible_window()
+        last = first + (count - 1) * stride
+        assert 0 <= first and last < size and (level.mid - first) % stride == 0 and first <= level.mid <= last
+        level.draw(Canvas(pygame.Surface((1024, 768))))
+    # Widest zoom: the whole array, to within the cells either side of the sampled ones
+    assert stride == level.zoom_strides()[-1] and first < 2 * stride and size - 1 - last < 2 * stride
+    level.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_EQUALS))
+    assert level.stride() == 10000
+    print("✅ Large binary search works")
+
+def test_large_array_level():
+    """Test the array level's scrolling viewport and value -> index map"""
+    import levels
+
+    level = levels.ArrayLevel()
+    level.start_large_array()
+    assert len(level.array) == level.LARGE_SIZE and len(level.positions) == level.LARGE_SIZE
+
+    # Walk to the target; the viewport follows the selection
+    target_index = level.positions[level.target]
+    level.select(target_index)
+    level.follow_selection()
+    assert level.scroll <= target_index < level.scroll + level.VISIBLE_CELLS
+    assert level.linear_scan_comparisons() == target_index + 1
+    level.check_selection()
+    assert level.score == 100
+    # The map is rebuilt after the shuffle
+    assert all(level.array[index] == value for value, index in level.positions.items())
+
+    level.select(0)
+    level.follow_selection()
+    assert level.scroll == 0
+    level.draw(Canvas(pygame.Surface((1024, 768))))
+    print("✅ Large array level works")
+
+def test_game_clock():
+    """Test fixed-timestep level updates driven by an injected clock"""
+    from game_clock import FixedTimestep, ManualClock, STEP
+    import dsa_game
+    import levels
+
+    timestep = FixedTimestep(step=0.1, max_stall=1.0)
+    assert timestep.advance(10.0) == 0  # first call only starts counting
+    assert timestep.advance(10.25) == 2 and timestep.advance(10.3) == 1  # remainder carried over
+    assert timestep.advance(70.0) == 0  # long stall: dropped, not caught up
+    assert timestep.advance(70.15) == 1
+
+    # Slow frames (an unfocused or busy window) still advance levels in real time
+    for frame_time in (0.2, 0.5):
+        timestep = FixedTimestep()
+        now = 0.0
+        timestep.advance(now)
+        steps = 0
+        for _ in range(int(10 / frame_time)):
+            now += frame_time
+            steps += timestep.advance(now)
+        assert abs(steps * STEP - 10.0) <= STEP, (frame_time, steps * STEP)
+
+    # A whole queue level played out in simulated time, far faster than real time
+    level = levels.QueueLevel()
+    result = "playing"
+    while result == "playing":
+        result = level.step(STEP)
+    assert result == "failed" and level.elapsed >= level.time_limit
+    assert len(level.queue) == level.CAPACITY and level.get_score() == 0
+
+    clock = ManualClock()
+    game = dsa_game.DSAGame(game_clock=clock)
+    game.update()
+    game.start_level(1)
+    clock.advance(0.5)
+    game.update()
+    assert abs(game.current_level_instance.elapsed - 0.5) <= STEP
+    clock.advance(5.0)  # a stall does not count
+    game.update()
+    assert abs(game.current_level_instance.elapsed - 0.5) <= STEP
+    # Level time keeps up with half-second frames and runs out on time
+    for _ in range(game.current_level_instance.time_limit * 2 - 2):
+        clock.advance(0.5)
+        game.update()
+    assert game.state == dsa_game.GameState.PLAYING
+    clock.advance(0.5)
+    game.update()
+    clock.advance(0.5)
+    game.update()
+    assert game.state == dsa_game.GameState.GAME_OVER
+    print("✅ Game clock works")
+
+def test_simulation():
+    """Test headless bot games for balancing the levels"""
+    import subprocess
+    import simulation
+
+    # The simulator neither imports the game nor starts pygame
+    check = "import sys, simulation; sys.exit('pygame' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", check]).returncode == 0
+    check = "import sys, pygame, simulation; simulation.simulate(2, 'optimal', games=5); sys.exit(pygame.get_init())"
+    assert subprocess.run([sys.executable, "-c", check]).returncode == 0
+
+    for level_num in (1, 2, 3, 4):
+        summary = simulation.simulate(level_num, "optimal", games=20)
+        assert summary["completion_rate"] == 1.0, summary
+    first, second = (simulation.simulate(2, "student", games=50, seed=3) for _ in range(2))
+    first.pop("games_per_second"), second.pop("games_per_second")
+    assert first == second  # repeatable for a seed
+    hurried = simulation.simulate(1, "student", games=50, time_limit=5)
+    assert hurried["completion_rate"] < 1.0 and hurried["time_limit"] == 5
+    simulation.simulate(4, "random", games=20)
+    print("✅ Level simulation works")
+
+def test_level_models():
+    """Test the pygame-free level models behind the levels"""
+    import subprocess
+    from level_models import QueueModel, StackModel
+    import levels
+
+    # The models import without pygame
+    check = "import sys, level_models; sys.exit('pygame' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", check]).returncode == 0
+
+    model = StackModel(time_limit=45)
+    model.push(3)
+    clone = model.copy()
+    clone.push(4)
+    assert model.stack == [3] and clone.stack == [3, 4]
+    assert len(model.operations) == 1 and clone.version > model.version
+
+    queue = QueueModel(time_limit=45)
+    queue.add_customer()
+    busy = queue.copy()
+    busy.add_customer()
+    assert len(queue.queue) == 1 and len(busy.queue) == 2
+
+    # A level draws whatever model it is given; model changes trigger a full redraw
+    level = levels.QueueLevel(model=busy)
+    level.track_dirty_rects = True
+    level.draw(Canvas(pygame.Surface((1024, 768))))
+    assert level.take_dirty_rects() is None
+    level.draw(Canvas(pygame.Surface((1024, 768))))
+    assert level.take_dirty_rects() is not None
+    level.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
+    assert level.model is busy and len(busy.processed) == 1
+    assert level.take_dirty_rects() is None
+    print("✅ Level models work")
+
+def test_replay():
+    """Test recording level sessions and replaying them deterministically"""
+    import tempfile
+    from game_clock import ManualClock
+    import dsa_game
+    import replay
+
+    # A stack session played through the game, key presses and all
+    with tempfile.TemporaryDirectory() as directory:
+        clock = ManualClock()
+        game = dsa_game.DSAGame(game_clock=clock, record_dir=directory)
+        game.update()
+        game.start_level(2)
+        level = game.current_level_instance
+        for value in [7] + level.target_sequence:
+            clock.advance(0.35)
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_0 + value))
+            game.process_events()
+            game.update()
+        assert game.state == dsa_game.GameState.LEVEL_SELECT and game.recording is None
+        (name,) = os.listdir(directory)
+        path = os.path.join(directory, name)
+        recording = replay.Recording.load(path)
+        assert recording.result == "completed" and recording.score == level.get_score()
+        assert len(recording.events) == 6 and os.path.getsize(path) <= 20 + 2 * 6
+        assert replay.replay(recording) == ("completed", recording.score)
+        assert replay.main([path]) == 0
+
+    # Keys outside the table and long gaps survive encoding; same seed and keys, same session
+    keys = [(3, pygame.K_RIGHT), (10, pygame.K_SPACE), (200, pygame.K_l), (4000, pygame.K_F5)]
+    recording = replay.Recording(1, seed=12345, events=keys, steps=5000)
+    decoded = replay.Recording.from_bytes(recording.to_bytes())
+    assert decoded.events == keys and decoded.steps == 5000 and decoded.seed == 12345
+    assert replay.replay(decoded) == replay.replay(recording)
+    print("✅ Session replay works")
+
+def test_puzzle_bank():
+    """Test seeded levels and the memory-mapped puzzle bank"""
+    import random
+    import tempfile
+    from level_models import ArrayModel, BinarySearchModel, StackModel
+    import levels
+    import puzzle_bank
+
+    # Levels draw from their own seeded stream, never the global one
+    state = random.getstate()
+    assert ArrayModel(60, seed=9).array == ArrayModel(60, seed=9).array
+    assert BinarySearchModel(60, seed=9).target == BinarySearchModel(60, seed=9).target
+    assert random.getstate() == state
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "puzzles.bin")
+        size = puzzle_bank.generate(puzzle_bank.puzzle_levels(), 200, seed=1, path=path)
+        assert size == os.path.getsize(path)
+        bank = puzzle_bank.PuzzleBank(path)
+        assert sorted(bank.sections) == [1, 2, 4] and bank.count(1) == 200 and bank.count(3) == 0
+        assert bank.puzzle(3, 0) is None
+        for level_num, model_class in ((1, ArrayModel), (2, StackModel), (4, BinarySearchModel)):
+            for index in range(bank.count(level_num)):
+                puzzle = bank.puzzle(level_num, index)
+                assert model_class.valid_puzzle(puzzle.values, puzzle.target)
+
+        # Everyone given the same puzzle number plays the same puzzle
+        puzzle = bank.puzzle(1, 42)
+        first, second = levels.ArrayLevel(puzzle=puzzle), levels.ArrayLevel(puzzle=bank.puzzle(1, 42))
+        assert first.array == second.array == list(puzzle.values) and first.target == puzzle.target
+        search = levels.BinarySearchLevel(puzzle=bank.puzzle(4, 199))
+        assert search.array == bank.puzzle(4, 199).values and search.mid == 7
+        assert levels.StackLevel(puzzle=bank.puzzle(2, 0)).target_sequence == list(bank.puzzle(2, 0).values)
+        try:
+            bank.puzzle(2, 200)
+            assert False, "puzzle index out of range"
+        except IndexError:
+            pass
+        bank.close()
+    print("✅ Puzzle bank works")
+
+def test_frame_pacer():
+    """Test that levels keep the full frame rate when the window is hidden or unfocused"""
+    from frame_pacer import FramePacer
+
+    pacer = FramePacer()
+    get_active, get_focused = pygame.display.get_active, pygame.key.get_focused
+    try:
+        pygame.display.get_active = lambda: False
+        assert pacer.choose_mode(animating=True) == "active"
+        assert pacer.choose_mode(animating=False) == "hidden"
+        pygame.display.get_active = lambda: True
+        pygame.key.get_focused = lambda: False
+        assert pacer.choose_mode(animating=True) == "active"
+        assert pacer.choose_mode(animating=False) == "unfocused"
+    finally:
+        pygame.display.get_active, pygame.key.get_focused = get_active, get_focused
+    print("✅ Frame pacer works")
+
 if __name__ == "__main__":
     success = test_game_launch()
+    test_text_cache()
+    test_benchmark_runner()
+    test_scoreboard_cache()
+    test_animation_clock()
+    test_particle_system()
+    test_scaled_display()
+    test_render_scale()
+    test_sprite_atlas()
+    test_level_registry()
+    test_font_registry()
+    test_ring_buffer_queue()
+    test_stack_matcher()
+    test_large_binary_search()
+    test_large_array_level()
+    test_game_clock()
+    test_simulation()
+    test_level_models()
+    test_replay()
+    test_puzzle_bank()
+    test_frame_pacer()
     sys.exit(0 if success else 1)